@@ -0,0 +1,61 @@
+"""
+Soak benchmark for Don Tomate.
+
+Rebuilds the schedule with another number of cycles and runs it to completion on a virtual
+clock, over and over, and reports how the traced memory and the live widgets grow per
+iteration once the caches are warm, the source lines that grew the most, and what one
+timer screen costs.
+
+Runs headless on Linux through the SDL offscreen video driver by default.
+
+Usage:
+    python benchmarks/soak.py --iterations 60
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_FILELOG", "1")
+os.environ.setdefault("KIVY_LOG_LEVEL", "warning")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=60, help="iterations measured")
+    parser.add_argument("--top", type=int, default=10, help="source lines listed")
+    args = parser.parse_args(argv)
+
+    from don_tomate.soak import Soak, screen_footprint
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        soak = Soak(data_dir)
+        growth = soak.run(args.iterations)
+        footprint = screen_footprint(soak.warp.app)
+        soak.close()
+
+    last = soak.reports[-1]
+    print(f"iterations      {len(soak.reports):10}")
+    print(f"segments        {soak.warp.segments:10}")
+    print(f"memory          {last['memory'] / 1024:10.1f} KiB")
+    print(f"  growth        {growth['memory']:10.1f} B/iteration")
+    print(f"widgets         {last['widgets']:10}")
+    print(f"  growth        {growth['widgets']:10.2f} /iteration")
+    print()
+    print("timer screen")
+    print(f"  memory        {footprint['bytes'] / 1024:10.1f} KiB")
+    print(f"  widgets       {footprint['widgets']:10}")
+    print(f"  instructions  {footprint['canvas_instructions']:10}")
+    print()
+    print("top growth")
+    for stat in soak.top_growth(args.top):
+        print(f"  {stat}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Startup benchmarks for Don Tomate.
+
+Measures the import time of `don_tomate.main` (with a `-X importtime` breakdown),
+`DonTomateApp.build`, `build_screens`, `make_screen_mapping` and `rebuild_screens` for
+several numbers of Pomodoro cycles, and stores the results as JSON. When a baseline is
+given, exits with status 1 if a metric regressed past the threshold.
+
+Runs headless on Linux through the SDL offscreen video driver by default, any other
+driver can be picked with SDL_VIDEODRIVER (e.g. "dummy").
+
+Usage:
+    python benchmarks/startup.py --output startup.json
+    python benchmarks/startup.py --baseline startup.json --threshold 0.25
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_FILELOG", "1")
+os.environ.setdefault("KIVY_LOG_LEVEL", "warning")
+
+DEFAULT_CYCLES = [1, 2, 4, 8, 16, 32, 64, 100]
+
+
+def measure(func, repeat):
+    """
+    Runs a function several times and returns its median duration.
+
+    Args:
+        func (callable): The function to time, called without arguments.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The median duration in seconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def import_time(repeat, top=15):
+    """
+    Measures the cold import of `don_tomate.main` in fresh interpreters.
+
+    Args:
+        repeat (int): The number of interpreters to start.
+        top (int): The number of modules kept in the breakdown.
+
+    Returns:
+        tuple: The median cumulative import time in seconds, and the breakdown of the
+            slowest modules of the last run as a list of dicts.
+    """
+    totals, modules = [], []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import don_tomate.main"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            modules.append(
+                dict(
+                    module=name.strip(),
+                    self=int(self_us) / 1e6,
+                    cumulative=int(cumulative_us) / 1e6,
+                )
+            )
+        totals.append(next(m["cumulative"] for m in modules if m["module"] == "don_tomate.main"))
+    modules.sort(key=lambda m: m["self"], reverse=True)
+    return statistics.median(totals), modules[:top]
+
+
+def app_metrics(cycles, repeat):
+    """
+    Measures the screen building steps of the app for each number of cycles.
+
+    Args:
+        cycles (list): The numbers of Pomodoro cycles to measure.
+        repeat (int): The number of runs per measure.
+
+    Returns:
+        dict: The median durations in seconds, by metric name.
+    """
+    from kivy.uix.screenmanager import ScreenManager
+    from don_tomate.main import DonTomateApp
+
+    app = DonTomateApp()
+    app.root = app.build()  # Warm up the window, GL context and caches
+
+    metrics = {}
+    for n_pomodoros in cycles:
+        metrics[f"build[n={n_pomodoros}]"] = measure(
+            lambda: DonTomateApp().build(n_pomodoros), repeat
+        )
+
+        app.n_pomodoros = n_pomodoros
+        metrics[f"make_screen_mapping[n={n_pomodoros}]"] = measure(app.make_screen_mapping, repeat)
+        metrics[f"build_screens[n={n_pomodoros}]"] = measure(
+            lambda: app.build_screens(ScreenManager()), repeat
+        )
+
+        def rebuild():
+            app.rebuild_screens(4)
+            app.rebuild_screens(n_pomodoros)
+
+        metrics[f"rebuild_screens[4->{n_pomodoros}]"] = measure(rebuild, repeat)
+    return metrics
+
+
+def compare(results, baseline, threshold):
+    """
+    Lists the metrics that regressed compared to a baseline.
+
+    Args:
+        results (dict): The metrics of this run.
+        baseline (dict): The metrics of the baseline run.
+        threshold (float): The tolerated relative slowdown (e.g. 0.25 for 25%).
+
+    Returns:
+        list: A (metric, baseline, current) tuple for each regression.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous and current > previous * (1 + threshold):
+            regressions.append((name, previous, current))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="startup.json", help="where to write the results")
+    parser.add_argument("--baseline", help="results of a previous run to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="tolerated relative slowdown"
+    )
+    parser.add_argument("--cycles", type=int, nargs="+", default=DEFAULT_CYCLES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    import_total, import_breakdown = import_time(args.repeat)
+    metrics = {"import[don_tomate.main]": import_total}
+    metrics.update(app_metrics(args.cycles, args.repeat))
+
+    with open(args.output, "w") as f:
+        json.dump(dict(metrics=metrics, importtime=import_breakdown), f, indent=2)
+
+    for name, value in metrics.items():
+        print(f"{name:32} {value * 1000:10.2f} ms")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["metrics"]
+        regressions = compare(metrics, baseline, args.threshold)
+        for name, previous, current in regressions:
+            print(
+                f"REGRESSION {name}: {previous * 1000:.2f} ms -> {current * 1000:.2f} ms",
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Timer scheduler benchmarks for Don Tomate.
+
+Measures the cost of starting and pausing the countdowns of a `TeamScheduler` holding
+many people, then the tick jitter of its timing wheel: how late each of many timers,
+spread over a few seconds, is called by a single wakeup loop. Stores the results as JSON.
+
+Usage:
+    python benchmarks/timers.py --output timers.json
+    python benchmarks/timers.py --timers 100000 --spread 60
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from don_tomate.wheel import TeamScheduler, TimingWheel
+
+
+def percentile(values, share):
+    """
+    Args:
+        values (list): The sorted values.
+        share (float): The share of values below the percentile (e.g. 0.99).
+
+    Returns:
+        float: The percentile of the values.
+    """
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+def scheduler_metrics(n_timers):
+    """
+    Measures the operations of a scheduler holding the given number of people.
+
+    Args:
+        n_timers (int): The number of people, each with a running countdown.
+
+    Returns:
+        dict: The cost of each operation in seconds, and the memory held in bytes.
+    """
+    tracemalloc.start()
+    scheduler = TeamScheduler()
+    start = time.perf_counter()
+    for key in range(n_timers):
+        scheduler.add(key)
+    add = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in range(n_timers):
+        scheduler.start(key)
+    started = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for key in range(n_timers):
+        scheduler.pause(key)
+    pause = time.perf_counter() - start
+    return {
+        "add[per timer]": add / n_timers,
+        "start[per timer]": started / n_timers,
+        "pause[per timer]": pause / n_timers,
+        "memory[bytes per timer]": memory / n_timers,
+    }
+
+
+def jitter_metrics(n_timers, spread, resolution):
+    """
+    Calls timers spread over a few seconds from a single wakeup loop, sleeping until the
+    next due tick like the wakeup thread of `TeamScheduler` does.
+
+    Args:
+        n_timers (int): The number of timers.
+        spread (float): The latest deadline in seconds.
+        resolution (float): The length of a tick of the wheel in seconds.
+
+    Returns:
+        dict: The lateness percentiles in seconds of the timers due after they were all
+            scheduled, and the number of wakeups.
+    """
+    wheel = TimingWheel(resolution)
+    lateness = []
+
+    def fire(deadline):
+        lateness.append((deadline, time.monotonic() - deadline))
+
+    for _ in range(n_timers):
+        delay = random.uniform(0, spread)
+        wheel.schedule(delay, fire, time.monotonic() + delay)
+
+    # Timers due while the others were being scheduled are late by construction
+    ready = time.monotonic()
+    wakeups = 0
+    while len(wheel):
+        timeout = wheel.next_timeout()
+        if timeout:
+            time.sleep(timeout)
+        wheel.advance()
+        wakeups += 1
+
+    lateness = sorted(late for deadline, late in lateness if deadline >= ready)
+    return {
+        "lateness[p50]": percentile(lateness, 0.5),
+        "lateness[p99]": percentile(lateness, 0.99),
+        "lateness[max]": lateness[-1],
+        "wakeups": wakeups,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="timers.json", help="where to write the results")
+    parser.add_argument("--timers", type=int, default=100_000)
+    parser.add_argument("--spread", type=float, default=60.0, help="latest deadline in seconds")
+    parser.add_argument("--resolution", type=float, default=0.01, help="tick length in seconds")
+    args = parser.parse_args(argv)
+
+    metrics = scheduler_metrics(args.timers)
+    metrics.update(jitter_metrics(args.timers, args.spread, args.resolution))
+
+    with open(args.output, "w") as f:
+        json.dump(dict(timers=args.timers, metrics=metrics), f, indent=2)
+
+    for name, value in metrics.items():
+        if name == "wakeups":
+            print(f"{name:24} {value:10}")
+        elif name.startswith("memory"):
+            print(f"{name:24} {value:10.0f} B")
+        else:
+            print(f"{name:24} {value * 1e6:10.2f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Time warp benchmark for Don Tomate.
+
+Runs many Pomodoro cycles through `DonTomateApp` on a virtual clock, and reports how long
+the simulation took in real time against the simulated time.
+
+Runs headless on Linux through the SDL offscreen video driver by default.
+
+Usage:
+    python benchmarks/timewarp.py --pomodoros 10000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_FILELOG", "1")
+os.environ.setdefault("KIVY_LOG_LEVEL", "warning")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pomodoros", type=int, default=10_000, help="Pomodoro cycles to run")
+    parser.add_argument("--cycles", type=int, default=4, help="Pomodoro cycles per schedule")
+    parser.add_argument(
+        "--prune", action="store_true", help="drop and rebuild far screens like the app does"
+    )
+    args = parser.parse_args(argv)
+
+    from don_tomate.timewarp import TimeWarp
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        warp = TimeWarp(
+            data_dir, n_pomodoros=args.cycles, screen_cache_radius=None if args.prune else 1000
+        )
+        start = time.perf_counter()
+        warp.run_cycles(args.pomodoros // args.cycles)
+        elapsed = time.perf_counter() - start
+        warp.close()
+
+    print(f"segments        {warp.segments:10}")
+    print(f"simulated       {warp.clock.now / 86400:10.1f} days")
+    print(f"real time       {elapsed:10.2f} s")
+    print(f"per segment     {elapsed / warp.segments * 1e6:10.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+from don_tomate.cli import main
+
+main()
@@ -0,0 +1,100 @@
+class SoundCache:
+    """
+    App-wide cache of decoded sounds, shared by every screen.
+
+    Each sound is loaded once, either ahead of time with `preload` or on its first use,
+    so playing a notification never touches the disk. A missing sound file is only
+    looked up once as well.
+
+    Attributes:
+        paths (dict): The file path of each sound, by sound name, or a callable returning
+            it for a sound whose file is only made when it is first loaded.
+        sounds (dict): The loaded Sound of each sound name, None if it could not be loaded.
+    """
+
+    def __init__(self, paths):
+        """
+        Gets the SoundCache started without loading anything yet.
+
+        Args:
+            paths (dict): The file path of each sound, or a callable returning it, by
+                sound name.
+        """
+        self.paths = dict(paths)
+        self.sounds = {}
+        self._on_stop = {}
+
+    def preload(self, *args):
+        """
+        Loads every sound that was not loaded yet. Meant to be scheduled right after
+        startup so decoding does not delay the first frame.
+        """
+        for name in self.paths:
+            self.get(name)
+
+    def get(self, name):
+        """
+        Returns the shared Sound with the given name, loading it on first use.
+
+        Args:
+            name (str): The name of the sound (e.g., "notification").
+
+        Returns:
+            Sound: The loaded sound, or None if the file could not be loaded.
+        """
+        if name not in self.sounds:
+            from kivy.core.audio import SoundLoader
+
+            path = self.paths[name]
+            self.sounds[name] = SoundLoader.load(path() if callable(path) else path)
+        return self.sounds[name]
+
+    def play(self, name, on_stop=None):
+        """
+        Plays a shared sound from the start. If it is still playing for a previous
+        caller, it is stopped first so that caller gets its `on_stop` callback.
+
+        Args:
+            name (str): The name of the sound (e.g., "notification").
+            on_stop (callable): Called once with the sound when it stops, either at its end
+                or when stopped. It is unbound right after, so no callback piles up.
+
+        Returns:
+            Sound: The playing sound, or None if the file could not be loaded.
+        """
+        sound = self.get(name)
+        if sound is None:
+            return None
+        if sound.state == "play":
+            sound.stop()
+        self.release(name)
+        if on_stop is not None:
+            self._on_stop[name] = on_stop
+            sound.bind(on_stop=self._dispatch_stop)
+        sound.play()
+        return sound
+
+    def release(self, name):
+        """
+        Drops the `on_stop` callback registered for a sound, if any.
+
+        Args:
+            name (str): The name of the sound (e.g., "notification").
+        """
+        sound = self.sounds.get(name)
+        if self._on_stop.pop(name, None) is not None and sound is not None:
+            sound.unbind(on_stop=self._dispatch_stop)
+
+    def _dispatch_stop(self, sound):
+        """
+        Calls and releases the `on_stop` callback of the sound that just stopped.
+
+        Args:
+            sound (Sound): The sound that stopped.
+        """
+        for name, loaded in self.sounds.items():
+            if loaded is sound and name in self._on_stop:
+                on_stop = self._on_stop[name]
+                self.release(name)
+                on_stop(sound)
+                return
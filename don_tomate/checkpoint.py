@@ -0,0 +1,101 @@
+from collections import namedtuple
+import os
+import struct
+import zlib
+
+# States of the checkpointed timer
+IDLE = 0
+RUNNING = 1
+PAUSED = 2
+
+MAGIC = b"DTCP"
+
+# The fixed-size record: magic, state, number of Pomodoro cycles, screen name of the
+# segment, wall-clock deadline of a running timer, remaining time of a paused one and
+# the CRC32 of everything before it
+RECORD = struct.Struct("<4sBxH16sddI")
+
+Checkpoint = namedtuple("Checkpoint", ["state", "segment", "n_pomodoros", "deadline", "remaining"])
+
+
+class TimerCheckpoint:
+    """
+    The state of the current timer, kept in a small fixed-size file so a countdown
+    survives a crash of the app or a suspend of the machine.
+
+    The deadline of a running timer is stored as wall-clock time, which keeps counting
+    while the machine sleeps and across restarts, unlike the monotonic clock of the
+    timers. Each save is a single `pwrite` of the whole record at the start of the file,
+    made only when the timer state changes, never on ticks, and skipped if the record did
+    not change. A record torn by a crash fails its checksum and is ignored.
+
+    Attributes:
+        path (str): The path of the checkpoint file.
+        last (Checkpoint): The last record saved or loaded, None if there is none.
+    """
+
+    def __init__(self, path):
+        """
+        Gets the TimerCheckpoint started. The file is only opened on the first save.
+
+        Args:
+            path (str): The path of the checkpoint file.
+        """
+        self.path = str(path)
+        self.last = None
+        self._fd = None
+
+    def save(self, state, segment="", n_pomodoros=0, deadline=0.0, remaining=0.0):
+        """
+        Writes the state of the current timer.
+
+        Args:
+            state (int): IDLE, RUNNING or PAUSED.
+            segment (str): The screen name of the timer (e.g., "break_1").
+            n_pomodoros (int): The number of Pomodoro cycles of the schedule.
+            deadline (float): The Unix time at which a running timer ends.
+            remaining (float): The remaining time in seconds of a paused timer.
+        """
+        checkpoint = Checkpoint(state, segment, n_pomodoros, deadline, remaining)
+        if checkpoint == self.last:
+            return
+        fields = (MAGIC, state, n_pomodoros, segment.encode(), deadline, remaining)
+        data = RECORD.pack(*fields, zlib.crc32(RECORD.pack(*fields, 0)[:-4]))
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if hasattr(os, "pwrite"):
+            os.pwrite(self._fd, data, 0)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            os.write(self._fd, data)
+        self.last = checkpoint
+
+    def load(self):
+        """
+        Reads the last saved state.
+
+        Returns:
+            Checkpoint: The saved state, None if the file is missing or not a valid record.
+        """
+        try:
+            with open(self.path, "rb") as checkpoint_file:
+                data = checkpoint_file.read(RECORD.size)
+        except OSError:
+            return None
+        if len(data) != RECORD.size:
+            return None
+        magic, state, n_pomodoros, segment, deadline, remaining, crc = RECORD.unpack(data)
+        if magic != MAGIC or crc != zlib.crc32(data[:-4]):
+            return None
+        self.last = Checkpoint(
+            state, segment.rstrip(b"\0").decode(), n_pomodoros, deadline, remaining
+        )
+        return self.last
+
+    def close(self):
+        """
+        Closes the checkpoint file.
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
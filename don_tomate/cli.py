@@ -0,0 +1,112 @@
+import argparse
+import os
+from don_tomate.schedule import DEFAULT_DURATIONS, MAX_DURATION
+
+
+def positive_minutes(text):
+    """
+    Parses a length in minutes from the command line.
+
+    Args:
+        text (str): The argument (e.g., "52").
+
+    Returns:
+        int: The length in minutes.
+
+    Raises:
+        argparse.ArgumentTypeError: If the length is not a whole number of minutes up to
+            a day.
+    """
+    try:
+        minutes = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number of minutes: {text!r}")
+    if not 0 < minutes * 60 <= MAX_DURATION:
+        raise argparse.ArgumentTypeError(f"not between 1 and {MAX_DURATION // 60} minutes")
+    return minutes
+
+
+def main(argv=None):
+    """
+    Runs Don Tomate, either with its window or from the status bar only.
+
+    Args:
+        argv (list): The command line arguments, `sys.argv` if None.
+    """
+    parser = argparse.ArgumentParser(prog="don_tomate", description="Pomodoro app")
+    parser.add_argument(
+        "--tray",
+        action="store_true",
+        help="run from the status bar icon only, the window is opened on demand",
+    )
+    parser.add_argument(
+        "--cycles", type=int, help="number of Pomodoro cycles, the saved one by default"
+    )
+    parser.add_argument(
+        "--pomodoro",
+        type=positive_minutes,
+        metavar="MINUTES",
+        help="length of the Pomodoros, the saved ones or 25 minutes by default",
+    )
+    parser.add_argument(
+        "--short-break",
+        type=positive_minutes,
+        metavar="MINUTES",
+        help="length of the short breaks, the saved ones or 5 minutes by default",
+    )
+    parser.add_argument(
+        "--long-break",
+        type=positive_minutes,
+        metavar="MINUTES",
+        help="length of the long break, the saved one or 30 minutes by default",
+    )
+    parser.add_argument(
+        "--control",
+        metavar="ADDRESS",
+        help="serve the JSON control API on a Unix socket path or a localhost port",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        help="measure tick and frame times (overlay on F12) and write a summary on exit",
+    )
+    args = parser.parse_args(argv)
+
+    # The arguments are ours, keep Kivy from parsing them
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+    kind_durations = None
+    if (args.pomodoro, args.short_break, args.long_break) != (None, None, None):
+        kind_durations = tuple(
+            default if minutes is None else minutes * 60
+            for minutes, default in zip(
+                (args.pomodoro, args.short_break, args.long_break), DEFAULT_DURATIONS
+            )
+        )
+
+    handover = None
+    if args.tray:
+        from don_tomate.tray import run_tray
+
+        # The tray does not read the saved settings, the window follows its schedule
+        if args.cycles is None:
+            args.cycles = 4
+        handover = run_tray(args.cycles, kind_durations)
+        if handover is None:
+            return
+
+    from don_tomate.main import DonTomateApp
+
+    app = DonTomateApp()
+    if args.cycles is not None:
+        app.n_pomodoros = args.cycles
+    if kind_durations is not None:
+        app.kind_durations = kind_durations
+    app.handover = handover
+    app.control_address = args.control
+    app.metrics_path = args.metrics
+    app.run()
+
+
+if __name__ == "__main__":
+    main()
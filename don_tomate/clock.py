@@ -0,0 +1,223 @@
+import heapq
+import itertools
+import time
+
+# Callbacks a VirtualClock calls at the same time before giving up on a callback that keeps
+# scheduling itself without the time moving
+MAX_CALLBACKS_PER_DEADLINE = 10_000
+
+
+class KivyClock:
+    """
+    The clock of the running app: monotonic time, and callbacks scheduled on the Kivy
+    event loop.
+    """
+
+    def time(self):
+        """
+        Returns:
+            float: The current monotonic time in seconds.
+        """
+        return time.monotonic()
+
+    def wall_time(self):
+        """
+        Returns:
+            float: The current Unix time in seconds, which keeps counting while the
+                machine sleeps, unlike the monotonic time.
+        """
+        return time.time()
+
+    def schedule_once(self, callback, timeout=0):
+        """
+        Calls a function once, after the timeout.
+
+        Args:
+            callback (callable): Called with the elapsed time.
+            timeout (float): The delay in seconds.
+
+        Returns:
+            ClockEvent: The scheduled event, to cancel it.
+        """
+        from kivy.clock import Clock
+
+        return Clock.schedule_once(callback, timeout)
+
+    def schedule_interval(self, callback, interval):
+        """
+        Calls a function repeatedly, until it returns False or is cancelled.
+
+        Args:
+            callback (callable): Called with the elapsed time.
+            interval (float): The delay between the calls in seconds.
+
+        Returns:
+            ClockEvent: The scheduled event, to cancel it.
+        """
+        from kivy.clock import Clock
+
+        return Clock.schedule_interval(callback, interval)
+
+
+class VirtualEvent:
+    """
+    A callback scheduled on a VirtualClock.
+
+    Attributes:
+        callback (callable): Called with the elapsed time.
+        timeout (float): The delay in seconds the event was scheduled with.
+        deadline (float): The virtual time at which the callback is due.
+        repeat (bool): Indicates if the callback is called again every `timeout`.
+        cancelled (bool): Indicates if the event was cancelled.
+    """
+
+    __slots__ = ("callback", "timeout", "deadline", "repeat", "cancelled")
+
+    def __init__(self, callback, timeout, deadline, repeat):
+        """
+        Gets the VirtualEvent started, pending.
+        """
+        self.callback = callback
+        self.timeout = timeout
+        self.deadline = deadline
+        self.repeat = repeat
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Cancels the event, if it did not fire yet.
+        """
+        self.cancelled = True
+
+
+class VirtualClock:
+    """
+    A clock whose time only moves when told to, for tests and simulations.
+
+    Scheduled callbacks are called in the order of their deadlines as `advance` moves the
+    time forward, with the time set to each deadline, so a simulated hour takes as long
+    as the callbacks of that hour do.
+
+    Attributes:
+        now (float): The current virtual time in seconds.
+        epoch (float): The Unix time at the virtual time 0, moved by `suspend`.
+    """
+
+    def __init__(self, now=0.0, epoch=0.0):
+        """
+        Gets the VirtualClock started with nothing scheduled.
+
+        Args:
+            now (float): The initial virtual time in seconds.
+            epoch (float): The Unix time at the virtual time 0.
+        """
+        self.now = now
+        self.epoch = epoch
+        self._queue = []
+        self._counter = itertools.count()
+
+    def time(self):
+        """
+        Returns:
+            float: The current virtual time in seconds.
+        """
+        return self.now
+
+    def wall_time(self):
+        """
+        Returns:
+            float: The current virtual Unix time in seconds.
+        """
+        return self.epoch + self.now
+
+    def suspend(self, seconds):
+        """
+        Simulates the machine sleeping: the wall-clock time moves forward while the
+        monotonic time and the callbacks stand still.
+
+        Args:
+            seconds (float): The time the machine sleeps, in seconds.
+        """
+        self.epoch += seconds
+
+    def schedule_once(self, callback, timeout=0):
+        """
+        Calls a function once, after the timeout.
+
+        Args:
+            callback (callable): Called with the elapsed time.
+            timeout (float): The delay in seconds. Negative delays count as zero.
+
+        Returns:
+            VirtualEvent: The scheduled event, to cancel it.
+        """
+        return self._push(VirtualEvent(callback, timeout, self.now + max(0, timeout), False))
+
+    def schedule_interval(self, callback, interval):
+        """
+        Calls a function repeatedly, until it returns False or is cancelled.
+
+        Args:
+            callback (callable): Called with the elapsed time.
+            interval (float): The delay between the calls in seconds.
+
+        Returns:
+            VirtualEvent: The scheduled event, to cancel it.
+        """
+        return self._push(VirtualEvent(callback, interval, self.now + interval, True))
+
+    def next_deadline(self):
+        """
+        Returns:
+            float: The virtual time of the next pending callback, None if there is none.
+        """
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
+        return self._queue[0][0] if self._queue else None
+
+    def advance(self, seconds):
+        """
+        Moves the time forward, calling every callback due on the way.
+
+        Args:
+            seconds (float): The time to move forward by, in seconds.
+
+        Returns:
+            int: The number of callbacks called.
+
+        Raises:
+            RuntimeError: If more than MAX_CALLBACKS_PER_DEADLINE callbacks are called at the
+                same time, e.g. a zero interval or a callback timing itself on another clock.
+        """
+        target = self.now + seconds
+        called = 0
+        same_deadline = 0
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > target:
+                break
+            _, _, event = heapq.heappop(self._queue)
+            same_deadline = same_deadline + 1 if deadline == self.now else 1
+            if same_deadline > MAX_CALLBACKS_PER_DEADLINE:
+                raise RuntimeError(
+                    f"{event.callback!r} keeps being scheduled at the virtual time {deadline}"
+                )
+            self.now = deadline
+            called += 1
+            # Callbacks are always on time, so the elapsed time is the timeout
+            if (
+                event.callback(max(0, event.timeout)) is not False
+                and event.repeat
+                and not event.cancelled
+            ):
+                event.deadline += event.timeout
+                self._push(event)
+        self.now = target
+        return called
+
+    def _push(self, event):
+        """
+        Queues an event by deadline, keeping the scheduling order for equal deadlines.
+        """
+        heapq.heappush(self._queue, (event.deadline, next(self._counter), event))
+        return event
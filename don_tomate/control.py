@@ -0,0 +1,210 @@
+import asyncio
+import json
+import threading
+from kivy.clock import Clock
+
+# Commands of the control server, by the MainScreen method they call
+COMMANDS = {
+    "start_stop": "start_stop",
+    "reset": "reset_timer",
+    "next": "next_screen",
+    "previous": "previous_screen",
+}
+
+
+class ControlServer:
+    """
+    Lets local scripts drive the app, through newline-delimited JSON over a Unix domain
+    socket or a localhost TCP port.
+
+    The server runs its own asyncio loop on a background thread, beside the Kivy loop.
+    Every command is handed over to the Kivy thread with `Clock.schedule_once`, which
+    runs it on the displayed timer like the matching button would, and answers with the
+    state of the app once done. A client can also subscribe to have every later state
+    change pushed to it.
+
+    Requests look like `{"command": "start_stop", "id": 1}`, where the command is
+    "status", "subscribe" or one of COMMANDS, and the optional id is echoed back.
+    Answers look like `{"id": 1, "ok": true, "state": {...}}`, and pushed changes like
+    `{"event": "state", "state": {...}}`.
+
+    Attributes:
+        app (DonTomateApp): The app to drive.
+        path (str): The path of the Unix domain socket, None to listen on a TCP port.
+        host (str): The host of the TCP port.
+        port (int): The TCP port, 0 for any free one.
+        address: The address listened on once started, a path or a (host, port) tuple.
+    """
+
+    def __init__(self, app, path=None, host="127.0.0.1", port=0):
+        """
+        Gets the ControlServer started, not listening yet.
+
+        Args:
+            app (DonTomateApp): The app to drive.
+            path (str): The path of the Unix domain socket, None to listen on a TCP port.
+            host (str): The host of the TCP port.
+            port (int): The TCP port, 0 for any free one.
+        """
+        self.app = app
+        self.path = path
+        self.host = host
+        self.port = port
+        self.address = None
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._subscribers = set()
+        self._error = None
+
+    def start(self):
+        """
+        Starts listening on the background thread, returns once the address is bound.
+
+        Raises:
+            OSError: If the address could not be bound, e.g. a port in use or a socket path
+                in a missing directory. The background thread is stopped.
+        """
+        started = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, args=(started,), daemon=True)
+        self._thread.start()
+        started.wait()
+        if self._error is not None:
+            self._thread.join()
+            raise self._error
+        self.app.state_listeners.append(self.publish)
+
+    def stop(self):
+        """
+        Closes the server and its connections, and stops the background thread.
+        """
+        if self.publish in self.app.state_listeners:
+            self.app.state_listeners.remove(self.publish)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def publish(self, state):
+        """
+        Pushes a state change to the subscribed clients. Called on the Kivy thread.
+
+        Args:
+            state (dict): The state of the app.
+        """
+        if self._loop is not None:
+            message = encode(dict(event="state", state=state))
+            self._loop.call_soon_threadsafe(self._push, message)
+
+    def _run(self, started):
+        """
+        Runs the asyncio loop of the server until stopped.
+        """
+        loop = asyncio.new_event_loop()
+        if self.path is not None:
+            server = asyncio.start_unix_server(self._handle, self.path)
+        else:
+            server = asyncio.start_server(self._handle, self.host, self.port)
+        try:
+            self._server = loop.run_until_complete(server)
+        except OSError as error:
+            # Handed over to `start`, which would otherwise wait forever
+            self._error = error
+            loop.close()
+            started.set()
+            return
+        self._loop = loop
+        self.address = self.path or self._server.sockets[0].getsockname()[:2]
+        started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            for writer in self._subscribers:
+                writer.close()
+            # Let the connections still open close their writers before the loop goes
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    def _push(self, message):
+        """
+        Writes a message to every subscribed client.
+        """
+        for writer in list(self._subscribers):
+            if writer.is_closing():
+                self._subscribers.discard(writer)
+            else:
+                writer.write(message)
+
+    async def _handle(self, reader, writer):
+        """
+        Answers the requests of a client until it disconnects.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(encode(await self._answer(line, writer)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._subscribers.discard(writer)
+            writer.close()
+
+    async def _answer(self, line, writer):
+        """
+        Runs a request on the Kivy thread and returns the answer.
+        """
+        try:
+            request = json.loads(line)
+            command = request["command"]
+        except (ValueError, TypeError, KeyError):
+            return dict(ok=False, error="requests are JSON objects with a command")
+        answer = dict(id=request.get("id"))
+        if not isinstance(command, str) or (
+            command != "status" and command != "subscribe" and command not in COMMANDS
+        ):
+            return dict(answer, ok=False, error=f"unknown command: {command}")
+        if command == "subscribe":
+            self._subscribers.add(writer)
+
+        future = self._loop.create_future()
+        Clock.schedule_once(lambda dt: self._execute(command, future))
+        try:
+            state = await future
+        except Exception as error:
+            return dict(answer, ok=False, error=f"{command} failed: {error!r}")
+        return dict(answer, ok=True, state=state)
+
+    def _execute(self, command, future):
+        """
+        Runs a command on the displayed timer, on the Kivy thread, and resolves the
+        future with the resulting state.
+        """
+        try:
+            if command in COMMANDS:
+                getattr(self.app.control_target(), COMMANDS[command])(None)
+            result = self.app.timer_state()
+        except Exception as error:
+            self._loop.call_soon_threadsafe(future.set_exception, error)
+        else:
+            self._loop.call_soon_threadsafe(future.set_result, result)
+
+
+def encode(message):
+    """
+    Args:
+        message (dict): The message to send.
+
+    Returns:
+        bytes: The message as a line of JSON.
+    """
+    return json.dumps(message).encode() + b"\n"
@@ -0,0 +1,172 @@
+from kivy.core.text import Label as CoreLabel
+from kivy.event import EventDispatcher
+from kivy.graphics import Color, InstructionGroup, Rectangle
+from kivy.properties import ColorProperty, NumericProperty, StringProperty
+
+DIGITS = "0123456789"
+
+
+class CountdownLabel(EventDispatcher):
+    """
+    A text drawn on the canvas of the widget holding it, specialised for MM:SS countdowns.
+    It is not a widget itself: the holder adds its `instructions` to its own canvas and
+    centers it with `center_x` and `center_y`, so it takes no part in the layout passes.
+
+    Every glyph is rasterized once per font size and shared by all the countdowns of the
+    app. Each character of the text is drawn as its own rectangle in a fixed width cell,
+    so a tick only swaps the textures of the digits that changed instead of rendering
+    the whole string into a new texture. Any other text (e.g. "Time's up!") is rendered
+    as a whole, and cached as well.
+
+    Attributes:
+        text (str): The displayed text.
+        font_size (float): The font size, accepts Kivy units (e.g. "40sp").
+        color (list): The text color.
+        center_x (float): The horizontal center of the text.
+        center_y (float): The vertical center of the text.
+        instructions (InstructionGroup): The canvas instructions drawing the text.
+    """
+
+    text = StringProperty("")
+    font_size = NumericProperty("15sp")
+    color = ColorProperty([1, 1, 1, 1])
+    center_x = NumericProperty(0)
+    center_y = NumericProperty(0)
+
+    # Rendered glyph textures, by (text, font_size)
+    _textures = {}
+    # Width of the widest digit, by font_size
+    _digit_widths = {}
+
+    def __init__(self, **kwargs):
+        """
+        Gets the CountdownLabel started with its canvas instructions.
+        """
+        super(CountdownLabel, self).__init__(**kwargs)
+        self._cells = []
+        self._rects = []
+        self.instructions = InstructionGroup()
+        self._color = Color(*self.color)
+        self.instructions.add(self._color)
+        self.bind(
+            text=self._update_text,
+            font_size=self._rebuild,
+            center_x=self._update_layout,
+            center_y=self._update_layout,
+            color=self._update_color,
+        )
+        self._rebuild()
+
+    @classmethod
+    def glyph(cls, text, font_size):
+        """
+        Returns the texture of the given text, rendering it in white on first use.
+
+        Args:
+            text (str): The glyph or text to render.
+            font_size (float): The font size in pixels.
+
+        Returns:
+            Texture: The rendered texture.
+        """
+        key = (text, font_size)
+        texture = cls._textures.get(key)
+        if texture is None:
+            label = CoreLabel(text=text, font_size=font_size)
+            label.refresh()
+            texture = cls._textures[key] = label.texture
+        return texture
+
+    def _split(self, text):
+        """
+        Splits the text into the glyphs drawn in each cell.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            list: The characters of a countdown, or the whole text otherwise.
+        """
+        if text and all(char in DIGITS or char == ":" for char in text):
+            return list(text)
+        return [text] if text else []
+
+    def _cell_width(self, cell):
+        """
+        Returns the width of a cell, all digits sharing the width of the widest one so the
+        countdown does not move while it ticks.
+
+        Args:
+            cell (str): The glyph drawn in the cell.
+
+        Returns:
+            float: The width of the cell in pixels.
+        """
+        if cell in DIGITS:
+            width = self._digit_widths.get(self.font_size)
+            if width is None:
+                width = max(self.glyph(digit, self.font_size).width for digit in DIGITS)
+                self._digit_widths[self.font_size] = width
+            return width
+        return self.glyph(cell, self.font_size).width
+
+    def _rebuild(self, *args):
+        """
+        Recreates the rectangles of every cell.
+        """
+        for rect in self._rects:
+            self.instructions.remove(rect)
+        self._cells = self._split(self.text)
+        self._rects = []
+        for cell in self._cells:
+            rect = Rectangle(texture=self.glyph(cell, self.font_size))
+            self.instructions.add(rect)
+            self._rects.append(rect)
+        self._update_layout()
+
+    def _update_text(self, instance, text):
+        """
+        Swaps the textures of the cells that changed, or rebuilds the cells if the text
+        no longer has the same shape.
+        """
+        cells = self._split(text)
+        if len(cells) != len(self._cells) or len(cells) == 1:
+            self._rebuild()
+            return
+        for idx, (old, new) in enumerate(zip(self._cells, cells)):
+            if old != new:
+                if (old in DIGITS) != (new in DIGITS):
+                    self._rebuild()
+                    return
+                self._cells[idx] = new
+                self._place(idx, self._rects[idx].pos[0] + self._rects[idx].size[0] / 2)
+
+    def _place(self, idx, center_x):
+        """
+        Draws the glyph of a cell centered on the given abscissa.
+
+        Args:
+            idx (int): The index of the cell.
+            center_x (float): The horizontal center of the cell.
+        """
+        texture = self.glyph(self._cells[idx], self.font_size)
+        rect = self._rects[idx]
+        rect.texture = texture
+        rect.size = texture.size
+        rect.pos = (center_x - texture.width / 2, self.center_y - texture.height / 2)
+
+    def _update_layout(self, *args):
+        """
+        Centers the cells on the center of the text.
+        """
+        widths = [self._cell_width(cell) for cell in self._cells]
+        x = self.center_x - sum(widths) / 2
+        for idx, width in enumerate(widths):
+            self._place(idx, x + width / 2)
+            x += width
+
+    def _update_color(self, instance, color):
+        """
+        Tints the glyphs with the text color.
+        """
+        self._color.rgba = color
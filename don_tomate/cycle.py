@@ -0,0 +1,175 @@
+class CycleState:
+    """
+    The state machine of a Pomodoro cycle: which segments finished, which one is the
+    current timer, and which segments may be started.
+
+    A segment may be started when the previous one finished, or when it is the current
+    timer and just finished itself. The first segment may also be started at the
+    beginning of a cycle (nothing finished yet) and once the whole cycle finished.
+    Restarting a segment over its own pending notification disarms it, after which only
+    the rule of the first segment applies to it. Starting the first segment once the
+    whole cycle finished begins a new cycle. Every check is O(1).
+
+    Attributes:
+        segments (list): The screen names of the segments, in order.
+        completed (list): Indicates for each segment if it finished.
+        n_completed (int): The number of finished segments.
+        armed (list): Indicates for each segment if it may follow the previous one.
+        current (int): The position of the current timer, None if there is none.
+    """
+
+    def __init__(self, segments):
+        """
+        Gets the CycleState started at the beginning of a cycle.
+
+        Args:
+            segments (list): The screen names of the segments, in order.
+        """
+        self.segments = list(segments)
+        self.positions = {name: idx for idx, name in enumerate(self.segments)}
+        self.completed = [False] * len(self.segments)
+        self.n_completed = 0
+        self.armed = [True] * len(self.segments)
+        self.current = None
+
+    @property
+    def current_name(self):
+        """
+        str: The screen name of the current timer, None if there is none.
+        """
+        return None if self.current is None else self.segments[self.current]
+
+    def can_start(self, name):
+        """
+        Checks if a segment may be started.
+
+        Args:
+            name (str): The screen name of the segment (e.g., "break_1").
+
+        Returns:
+            bool: True if the segment may be started.
+        """
+        idx = self.positions[name]
+        if idx == 0 and self.n_completed in (0, len(self.segments)):
+            return True
+        if not self.armed[idx]:
+            return False
+        if self.current == idx and self.completed[idx]:
+            return True
+        return self.completed[idx - 1]
+
+    def start(self, name):
+        """
+        Makes a segment the current timer, beginning a new cycle if it is the first
+        segment and the whole cycle finished.
+
+        Args:
+            name (str): The screen name of the segment.
+
+        Returns:
+            bool: True if a new cycle began.
+        """
+        self.current = self.positions[name]
+        if self.current == 0 and self.n_completed == len(self.segments):
+            self.restart()
+            return True
+        return False
+
+    def restart(self):
+        """
+        Starts the cycle over, keeping the current timer.
+        """
+        self.completed = [False] * len(self.segments)
+        self.n_completed = 0
+        self.armed = [True] * len(self.segments)
+
+    def stop(self):
+        """
+        Clears the current timer, when it is paused or reset.
+        """
+        self.current = None
+
+    def complete(self, name):
+        """
+        Marks a segment as finished.
+
+        Args:
+            name (str): The screen name of the segment.
+        """
+        idx = self.positions[name]
+        if not self.completed[idx]:
+            self.completed[idx] = True
+            self.n_completed += 1
+
+    def disarm(self, name):
+        """
+        Keeps a segment restarted over its pending notification from following the
+        previous one again.
+
+        Args:
+            name (str): The screen name of the segment.
+        """
+        self.armed[self.positions[name]] = False
+
+    def is_armed(self, name):
+        """
+        Args:
+            name (str): The screen name of the segment.
+
+        Returns:
+            bool: True if the segment may follow the previous one.
+        """
+        return self.armed[self.positions[name]]
+
+    def resize(self, segments):
+        """
+        Moves to a new list of segments, keeping the state of the segments still in it.
+
+        Args:
+            segments (list): The screen names of the segments, in order.
+        """
+        snapshot = self.snapshot()
+        self.__init__(segments)
+        self._apply(snapshot)
+
+    def snapshot(self):
+        """
+        Returns the state as plain data, e.g. to be stored as JSON.
+
+        Returns:
+            dict: The segments, the finished and disarmed segments, and the current timer.
+        """
+        return dict(
+            segments=list(self.segments),
+            completed=[name for name, done in zip(self.segments, self.completed) if done],
+            disarmed=[name for name, armed in zip(self.segments, self.armed) if not armed],
+            current=self.current_name,
+        )
+
+    @classmethod
+    def restore(cls, snapshot):
+        """
+        Creates a CycleState from a snapshot.
+
+        Args:
+            snapshot (dict): A snapshot returned by `snapshot`.
+
+        Returns:
+            CycleState: The restored state.
+        """
+        state = cls(snapshot["segments"])
+        state._apply(snapshot)
+        return state
+
+    def _apply(self, snapshot):
+        """
+        Applies the state of a snapshot to the segments that are in this cycle.
+        """
+        for name in snapshot["completed"]:
+            if name in self.positions:
+                self.complete(name)
+        for name in snapshot["disarmed"]:
+            if name in self.positions:
+                self.disarm(name)
+        if snapshot["current"] in self.positions:
+            self.start(snapshot["current"])
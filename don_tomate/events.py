@@ -0,0 +1,257 @@
+from collections import deque, namedtuple
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import threading
+from don_tomate import journal
+
+# Kinds of timer events
+SEGMENT_STARTED = "segment_started"
+PAUSED = "paused"
+RESET = "reset"
+COMPLETED = "completed"
+CYCLE_COMPLETED = "cycle_completed"
+EVENT_KINDS = (SEGMENT_STARTED, PAUSED, RESET, COMPLETED, CYCLE_COMPLETED)
+
+# The kind of event of each journal event, and back
+JOURNAL_KINDS = {
+    journal.START: SEGMENT_STARTED,
+    journal.PAUSE: PAUSED,
+    journal.RESET: RESET,
+    journal.COMPLETE: COMPLETED,
+}
+JOURNAL_EVENTS = {kind: event for event, kind in JOURNAL_KINDS.items()}
+
+logger = logging.getLogger(__name__)
+
+TimerEvent = namedtuple(
+    "TimerEvent", ["kind", "segment", "title", "planned", "actual", "timestamp"]
+)
+
+
+class Subscription:
+    """
+    A handler subscribed to some kinds of events, with the events waiting for it.
+
+    Attributes:
+        kinds (frozenset): The kinds of events handled, among EVENT_KINDS.
+        handler (callable): Called with each TimerEvent. A coroutine function runs on the
+            loop of the bus, any other callable on its thread pool.
+        timeout (float): The time in seconds the handler is given for each event.
+        pending (deque): The events waiting for the handler, oldest first.
+        dropped (int): The number of events dropped because too many were waiting.
+    """
+
+    __slots__ = ("kinds", "handler", "timeout", "pending", "dropped", "_draining")
+
+    def __init__(self, kinds, handler, timeout):
+        """
+        Gets the Subscription started with no pending event.
+        """
+        self.kinds = kinds
+        self.handler = handler
+        self.timeout = timeout
+        self.pending = deque()
+        self.dropped = 0
+        self._draining = False
+
+
+class EventBus:
+    """
+    Delivers the timer events to their subscribers off the Kivy thread, so a slow hook
+    (a status update, a desktop notification, a write) never stalls the UI.
+
+    `publish` only enqueues the event for each subscriber of its kind and returns. The
+    events are delivered on an asyncio loop running on a background thread: coroutine
+    handlers run on the loop, other handlers on a bounded thread pool. Each subscriber
+    gets its events one at a time, in the order they were published whatever their
+    kinds, while different
+    subscribers run concurrently. A handler that takes longer than its timeout is given
+    up on and the next event is delivered, and a handler error is logged. When a
+    subscriber already has `max_pending` events waiting, new ones are dropped for it and
+    counted, and `publish` reports it, rather than the UI thread waiting.
+
+    The loop and the pool are only started with the first subscription.
+
+    Attributes:
+        max_workers (int): The number of threads of the pool.
+        max_pending (int): The number of events waiting for a subscriber at most.
+        timeout (float): The default time in seconds a handler is given for each event.
+    """
+
+    def __init__(self, max_workers=2, max_pending=1024, timeout=5.0):
+        """
+        Gets the EventBus started without any subscriber.
+
+        Args:
+            max_workers (int): The number of threads of the pool.
+            max_pending (int): The number of events waiting for a subscriber at most.
+            timeout (float): The default time in seconds a handler is given for each event.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._subscriptions = []
+        self._loop = None
+        self._thread = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._unfinished = 0
+
+    def subscribe(self, handler, kinds=EVENT_KINDS, timeout=None):
+        """
+        Calls a handler with every later event of some kinds.
+
+        Args:
+            handler (callable): Called with each TimerEvent, a plain or coroutine function.
+            kinds (tuple): The kinds of events, among EVENT_KINDS.
+            timeout (float): The time in seconds the handler is given for each event, the
+                `timeout` of the bus if None.
+
+        Returns:
+            Subscription: The subscription, to unsubscribe.
+
+        Raises:
+            ValueError: If a kind is not one of EVENT_KINDS.
+        """
+        kinds = frozenset(kinds)
+        unknown = kinds.difference(EVENT_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown event kinds {sorted(unknown)}")
+        subscription = Subscription(kinds, handler, self.timeout if timeout is None else timeout)
+        with self._lock:
+            self._ensure_loop()
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Stops calling the handler of a subscription. Its pending events are still
+        delivered.
+
+        Args:
+            subscription (Subscription): A subscription returned by `subscribe`.
+        """
+        with self._lock:
+            self._subscriptions = [
+                other for other in self._subscriptions if other is not subscription
+            ]
+
+    def publish(self, event):
+        """
+        Enqueues an event for the subscribers of its kind, without blocking.
+
+        Args:
+            event (TimerEvent): The event.
+
+        Returns:
+            bool: False if the event was dropped for a subscriber that had too many
+                events waiting.
+        """
+        delivered = True
+        with self._lock:
+            for subscription in self._subscriptions:
+                if event.kind not in subscription.kinds:
+                    continue
+                if len(subscription.pending) >= self.max_pending:
+                    subscription.dropped += 1
+                    delivered = False
+                    continue
+                subscription.pending.append(event)
+                self._unfinished += 1
+                if not subscription._draining:
+                    subscription._draining = True
+                    self._loop.call_soon_threadsafe(self._start_drain, subscription)
+        if not delivered:
+            logger.warning("Dropped a %s event, its subscribers are behind", event.kind)
+        return delivered
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every published event was handled, or given up on.
+
+        Args:
+            timeout (float): The longest time to wait in seconds, no limit if None.
+
+        Returns:
+            bool: True if every event was handled.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def close(self, timeout=None):
+        """
+        Delivers the pending events, then stops the loop and the thread pool.
+
+        Args:
+            timeout (float): The longest time to wait for the pending events in seconds,
+                no limit if None.
+        """
+        self.flush(timeout)
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = self._thread = self._executor = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        # A handler given up on may still be running, it is not waited for
+        executor.shutdown(wait=False)
+
+    def _ensure_loop(self):
+        """
+        Starts the loop thread and the thread pool if they are not running.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="don_tomate-events"
+            )
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="don_tomate-events-loop", daemon=True
+            )
+            self._thread.start()
+
+    def _start_drain(self, subscription):
+        """
+        Starts delivering the pending events of a subscription, on the loop.
+        """
+        asyncio.ensure_future(self._drain(subscription))
+
+    async def _drain(self, subscription):
+        """
+        Delivers the pending events of a subscription one at a time, in order.
+        """
+        while True:
+            with self._lock:
+                if not subscription.pending:
+                    subscription._draining = False
+                    return
+                event = subscription.pending.popleft()
+            try:
+                await self._deliver(subscription, event)
+            finally:
+                with self._idle:
+                    self._unfinished -= 1
+                    self._idle.notify_all()
+
+    async def _deliver(self, subscription, event):
+        """
+        Calls the handler of a subscription with an event, within its timeout.
+        """
+        handler = subscription.handler
+        if inspect.iscoroutinefunction(handler):
+            call = handler(event)
+        else:
+            call = asyncio.get_running_loop().run_in_executor(self._executor, handler, event)
+        try:
+            await asyncio.wait_for(call, subscription.timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                "%r took more than %s s on a %s event", handler, subscription.timeout, event.kind
+            )
+        except Exception:
+            logger.exception("%r failed on a %s event", handler, event.kind)
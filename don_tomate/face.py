@@ -0,0 +1,213 @@
+from kivy.event import EventDispatcher
+from kivy.graphics import Color, InstructionGroup, Line, Rectangle
+from kivy.metrics import dp
+from kivy.properties import BooleanProperty, NumericProperty, StringProperty
+from kivy.uix.widget import Widget
+from don_tomate.countdown import CountdownLabel
+
+# Where each control of the timer is drawn, by slot
+TOP_SLOTS = ("stop_sound", "reset", "settings")
+SIDE_SLOTS = ("previous", "next")
+CENTER_SLOT = "start_stop"
+
+BACKGROUND_COLOR = (0.95, 0.95, 0.95, 1)
+RING_TRACK_COLOR = (0.85, 0.85, 0.85, 1)
+RING_COLOR = (0.3, 0.5, 1, 1)
+
+
+class FaceButton(EventDispatcher):
+    """
+    A control of the timer, drawn as an icon on the canvas of its `TimerFace`. It is not a
+    widget: the face hit-tests it and dispatches `on_press` when it is touched.
+
+    Attributes:
+        background_normal (str): The source of the icon (e.g., an atlas URI).
+        disabled (bool): Indicates if touches are ignored.
+        opacity (float): The opacity of the icon. A button with no opacity ignores touches.
+        instructions (InstructionGroup): The canvas instructions drawing the icon.
+        rect (Rectangle): The rectangle holding the icon, also its hit area.
+    """
+
+    __events__ = ("on_press",)
+
+    background_normal = StringProperty("")
+    disabled = BooleanProperty(False)
+    opacity = NumericProperty(1)
+
+    def __init__(self, **kwargs):
+        """
+        Gets the FaceButton started with its canvas instructions.
+
+        Args:
+            on_press (callable): Called with the button when it is pressed.
+        """
+        on_press = kwargs.pop("on_press", None)
+        super(FaceButton, self).__init__(**kwargs)
+        if on_press is not None:
+            self.bind(on_press=on_press)
+        self._color = Color(1, 1, 1, min(self.opacity, 1))
+        self.rect = Rectangle(source=self.background_normal or None)
+        self.instructions = InstructionGroup()
+        self.instructions.add(self._color)
+        self.instructions.add(self.rect)
+        self.bind(background_normal=self._update_source, opacity=self._update_opacity)
+
+    def on_press(self):
+        pass
+
+    def collide_point(self, x, y):
+        """
+        Checks if a point hits the button, ignoring hidden and disabled buttons.
+
+        Args:
+            x (float): The abscissa of the point.
+            y (float): The ordinate of the point.
+
+        Returns:
+            bool: True if the button takes the touch.
+        """
+        if self.disabled or self.opacity <= 0:
+            return False
+        (left, bottom), (width, height) = self.rect.pos, self.rect.size
+        return left <= x <= left + width and bottom <= y <= bottom + height
+
+    def _update_source(self, instance, source):
+        """
+        Swaps the icon, a cache lookup for the icons of the atlas.
+        """
+        self.rect.source = source or None
+
+    def _update_opacity(self, instance, opacity):
+        """
+        Fades the icon.
+        """
+        self._color.a = min(opacity, 1)
+
+
+class TimerFace(Widget):
+    """
+    The face of a timer, drawn on a single canvas: the background, the name, the countdown,
+    a ring showing the elapsed part of the timer and the icons of the controls. A resize
+    places everything in one pass and a tick only swaps the changed digits and the arc of
+    the ring, without any layout.
+
+    Attributes:
+        label_name (CountdownLabel): The name of the timer.
+        label (CountdownLabel): The countdown.
+        controls (dict): The FaceButton of each slot (e.g., "start_stop").
+        progress (float): The elapsed part of the timer, from 0 to 1.
+    """
+
+    progress = NumericProperty(0)
+
+    def __init__(self, name, text, controls, **kwargs):
+        """
+        Gets the TimerFace started with its canvas instructions.
+
+        Args:
+            name (str): The name of the timer (e.g., "Pomodoro 1").
+            text (str): The text of the countdown.
+            controls (dict): The FaceButton of each slot, among TOP_SLOTS, SIDE_SLOTS and
+                CENTER_SLOT.
+        """
+        super(TimerFace, self).__init__(**kwargs)
+        self.label_name = CountdownLabel(text=name, font_size="30sp", color=(0, 0, 0, 1))
+        self.label = CountdownLabel(text=text, font_size="40sp", color=(0, 0, 0, 1))
+        self.controls = controls
+        with self.canvas:
+            Color(*BACKGROUND_COLOR)
+            self._background = Rectangle()
+            Color(*RING_TRACK_COLOR)
+            self._track = Line(width=dp(1))
+            Color(*RING_COLOR)
+            self._ring = Line(width=dp(2.5))
+        self.canvas.add(self.label_name.instructions)
+        self.canvas.add(self.label.instructions)
+        for control in controls.values():
+            self.canvas.add(control.instructions)
+        self._ring_circle = (0, 0, 0)
+        self.bind(pos=self._layout, size=self._layout, progress=self._update_ring)
+        self._layout()
+
+    def _layout(self, *args):
+        """
+        Places the background, the texts, the ring and the controls in the face.
+        """
+        x, y = self.pos
+        width, height = self.size
+        unit = min(width, height)
+        margin = unit * 0.02
+
+        self._background.pos = self.pos
+        self._background.size = self.size
+
+        # The secondary controls, in a row at the top right
+        top_size = unit * 0.16
+        top = y + height - margin - top_size
+        left = x + width - margin - top_size * len(TOP_SLOTS)
+        for idx, slot in enumerate(TOP_SLOTS):
+            self._place(slot, left + idx * top_size, top, top_size)
+        below_top = top - margin - y
+
+        # The navigation, on each side
+        side_size = unit * 0.22
+        side_y = y + (below_top - side_size) / 2
+        for slot, side_x in zip(SIDE_SLOTS, (x + margin, x + width - margin - side_size)):
+            self._place(slot, side_x, side_y, side_size)
+
+        # The countdown in its ring, the name above and the start button below
+        center_x = x + width / 2
+        center_y = y + below_top * 0.55
+        radius = min(below_top * 0.26, width * 0.2)
+        self._ring_circle = (center_x, center_y, radius)
+        self._track.circle = self._ring_circle
+        self._update_ring()
+        self.label.center_x = self.label_name.center_x = center_x
+        self.label.center_y = center_y
+        self.label_name.center_y = (center_y + radius + y + below_top) / 2
+        start_space = center_y - radius - y
+        start_size = max(0, min(side_size, start_space - 2 * margin))
+        self._place(
+            CENTER_SLOT, center_x - start_size / 2, y + (start_space - start_size) / 2, start_size
+        )
+
+    def _place(self, slot, x, y, size):
+        """
+        Places the icon of a control, if the face has it.
+
+        Args:
+            slot (str): The slot of the control (e.g., "reset").
+            x (float): The left of the icon.
+            y (float): The bottom of the icon.
+            size (float): The width and height of the icon.
+        """
+        control = self.controls.get(slot)
+        if control is not None:
+            control.rect.pos = (x, y)
+            control.rect.size = (size, size)
+
+    def _update_ring(self, *args):
+        """
+        Draws the arc of the ring for the elapsed part of the timer, clockwise from the top.
+        """
+        progress = min(self.progress, 1)
+        if progress > 0:
+            self._ring.circle = self._ring_circle + (0, 360 * progress)
+        else:
+            self._ring.points = []
+
+    def on_touch_down(self, touch):
+        """
+        Dispatches `on_press` to the control under the touch, if any.
+
+        Args:
+            touch: The touch event instance.
+
+        Returns:
+            bool: True if a control took the touch.
+        """
+        for control in self.controls.values():
+            if control.collide_point(*touch.pos):
+                control.dispatch("on_press")
+                return True
+        return super(TimerFace, self).on_touch_down(touch)
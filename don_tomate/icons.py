@@ -0,0 +1,54 @@
+from pathlib import Path
+import tempfile
+
+base_path = Path(__file__).parent / "don_tomate" / "Resources"
+
+# Control icons packed in the atlas, by file name without extension
+ICON_NAMES = ["play", "pause", "reset", "sound", "stop_sound", "settings", "next", "prev"]
+ICON_SIZE = 252
+ATLAS_NAME = "icons"
+ATLAS_PATH = base_path / f"{ATLAS_NAME}.atlas"
+
+
+def icon_uri(name):
+    """
+    Returns the Kivy URI of an icon in the control icons atlas. Kivy loads the whole atlas
+    in a single texture the first time one of its icons is used, so swapping a button
+    between icons is a cache lookup.
+
+    Args:
+        name (str): The name of the icon (e.g., "play").
+
+    Returns:
+        str: The atlas URI of the icon.
+    """
+    return f"atlas://{base_path / ATLAS_NAME}/{name}"
+
+
+def build_atlas(resources=base_path, size=ICON_SIZE):
+    """
+    Packs the control icons of the Resources directory into the `icons` atlas. The icons
+    are scaled down first, since they are drawn at about 100 pixels.
+
+    Args:
+        resources (Path): The directory holding the icons, where the atlas is written.
+        size (int): The size in pixels of each icon in the atlas.
+
+    Returns:
+        tuple: The atlas file name and its metadata, as returned by `Atlas.create`.
+    """
+    from PIL import Image
+    from kivy.atlas import Atlas
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filenames = []
+        for name in ICON_NAMES:
+            image = Image.open(resources / f"{name}.png").convert("RGBA")
+            filename = str(Path(tmp_dir) / f"{name}.png")
+            image.resize((size, size), Image.LANCZOS).save(filename)
+            filenames.append(filename)
+        return Atlas.create(str(resources / ATLAS_NAME), filenames, (1024, 512), use_path=False)
+
+
+if __name__ == "__main__":
+    build_atlas()
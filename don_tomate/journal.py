@@ -0,0 +1,223 @@
+from collections import namedtuple
+from contextlib import closing
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    day TEXT NOT NULL,
+    event TEXT NOT NULL,
+    segment TEXT NOT NULL,
+    title TEXT NOT NULL,
+    planned REAL NOT NULL,
+    actual REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_day ON sessions (day);
+"""
+
+# Journal events
+START = "start"
+PAUSE = "pause"
+RESET = "reset"
+COMPLETE = "complete"
+
+# Queue marker asking the writer thread to commit right away
+_FLUSH = "flush"
+
+logger = logging.getLogger(__name__)
+
+Session = namedtuple(
+    "Session", ["timestamp", "day", "event", "segment", "title", "planned", "actual"]
+)
+
+
+class SessionJournal:
+    """
+    Append-only journal of the timer events, stored in a SQLite database in WAL mode.
+
+    `record` only enqueues the event, a background thread batches the writes and commits
+    them, so the Kivy main loop never waits on the disk. Events are indexed by local day,
+    so reading back a date range stays fast with months of history.
+
+    Attributes:
+        path (str): The path of the SQLite database.
+        batch_size (int): The number of events committed at once at most.
+        flush_interval (float): The longest time in seconds an event waits to be committed.
+    """
+
+    def __init__(self, path, batch_size=64, flush_interval=1.0):
+        """
+        Gets the SessionJournal started. The database and the writer thread are only
+        created when the first event is recorded.
+
+        Args:
+            path (str): The path of the SQLite database.
+            batch_size (int): The number of events committed at once at most.
+            flush_interval (float): The longest time in seconds an event waits to be committed.
+        """
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def record(self, event, segment, title, planned, actual, timestamp=None):
+        """
+        Enqueues a timer event, without blocking.
+
+        Args:
+            event (str): The event, one of START, PAUSE, RESET or COMPLETE.
+            segment (str): The name of the screen of the timer (e.g., "main_2").
+            title (str): The displayed name of the timer (e.g., "Pomodoro 2").
+            planned (float): The planned duration of the timer in seconds.
+            actual (float): The time in seconds the timer ran for so far.
+            timestamp (float): The Unix time of the event, now if None.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        self._ensure_writer()
+        self._queue.put((timestamp, event, segment, title, planned, actual))
+
+    def flush(self):
+        """
+        Blocks until every recorded event is committed.
+        """
+        if self._thread is not None:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self):
+        """
+        Commits the pending events and stops the writer thread.
+        """
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def read(self, start_day=None, end_day=None):
+        """
+        Reads back the recorded events, oldest first.
+
+        Args:
+            start_day (str): The first local day to read (e.g., "2024-08-29"), included.
+            end_day (str): The last local day to read, included.
+
+        Returns:
+            list: The Session of each event.
+        """
+        query = "SELECT timestamp, day, event, segment, title, planned, actual FROM sessions"
+        clauses, params = [], []
+        if start_day is not None:
+            clauses.append("day >= ?")
+            params.append(start_day)
+        if end_day is not None:
+            clauses.append("day <= ?")
+            params.append(end_day)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY day, timestamp"
+        with closing(self._connect()) as connection:
+            return [Session(*row) for row in connection.execute(query, params)]
+
+    def select(self, query, params=()):
+        """
+        Runs a read-only query over the recorded events, e.g. to load them in bulk.
+
+        Args:
+            query (str): The SQL query, over the `sessions` table.
+            params (tuple): The parameters of the query.
+
+        Returns:
+            list: The rows of the result, as tuples.
+        """
+        with closing(self._connect()) as connection:
+            return connection.execute(query, params).fetchall()
+
+    def _connect(self):
+        """
+        Opens a connection to the database, creating its table and index if needed.
+
+        Returns:
+            sqlite3.Connection: The new connection.
+        """
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _ensure_writer(self):
+        """
+        Starts the writer thread if it is not running.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._write_loop, name="don_tomate-journal", daemon=True
+                )
+                self._thread.start()
+
+    def _write_loop(self):
+        """
+        Commits the enqueued events in batches until the journal is closed. A batch that
+        cannot be written (database locked or read-only, disk full) is logged and dropped,
+        and the next one opens a new connection, so the thread keeps draining the queue
+        and `flush` never waits forever.
+        """
+        connection = None
+        running = True
+        while running:
+            items = [self._queue.get()]
+            try:
+                deadline = time.monotonic() + self.flush_interval
+                while items[-1] not in (None, _FLUSH) and len(items) < self.batch_size:
+                    try:
+                        items.append(
+                            self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                        )
+                    except queue.Empty:
+                        break
+                running = items[-1] is not None
+                batch = [item for item in items if item not in (None, _FLUSH)]
+                if connection is None:
+                    connection = self._connect()
+                self._commit(connection, batch)
+            except sqlite3.Error:
+                logger.exception("Cannot write %d events to %s", len(batch), self.path)
+                if connection is not None:
+                    connection.close()
+                    connection = None
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+        if connection is not None:
+            connection.close()
+
+    def _commit(self, connection, batch):
+        """
+        Writes a batch of events in a single transaction.
+
+        Args:
+            connection (sqlite3.Connection): The connection of the writer thread.
+            batch (list): The enqueued events.
+        """
+        if not batch:
+            return
+        with connection:
+            connection.executemany(
+                "INSERT INTO sessions (timestamp, day, event, segment, title, planned, actual) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (timestamp, time.strftime("%Y-%m-%d", time.localtime(timestamp)), *rest)
+                    for timestamp, *rest in batch
+                ],
+            )
@@ -2,36 +2,60 @@ from kivy.app import App
 from kivy.uix.label import Label
 from kivy.uix.boxlayout import BoxLayout
 from kivy.clock import Clock
+from kivy.logger import Logger
 from kivy.uix.button import Button
-from kivy.core.audio import SoundLoader
 from kivy.graphics import Color, Rectangle
-from kivy.core.window import Window
 from kivy.uix.screenmanager import ScreenManager
+from functools import partial
+import time
 from pathlib import Path
 from kivy.uix.screenmanager import SlideTransition
 from kivy.uix.screenmanager import Screen
-from kivy.uix.treeview import TreeView, TreeViewLabel
-from kivy.uix.scrollview import ScrollView
-import platform
-import objc
-from Quartz import kCGStatusWindowLevel, kCGNormalWindowLevel
+from don_tomate import checkpoint, events, journal, schedule
+from don_tomate.audio import SoundCache
+from don_tomate.clock import KivyClock
+from don_tomate.cycle import CycleState
+from don_tomate.face import FaceButton, TimerFace
+from don_tomate.icons import icon_uri
+from don_tomate.metrics import Instrumentation
+from don_tomate.schedule import CYCLE_OPTIONS
+from don_tomate.settings import SettingsStore
+from don_tomate.timer import TimerEngine, format_time
+from don_tomate.window import (
+    WINDOW_SIZE,
+    IdleMonitor,
+    get_window,
+    set_always_on_top,
+    set_opacity,
+)
 
 base_path = Path(__file__).parent / "don_tomate" / "Resources"
 
 SOUND_PATH = str(base_path / "notification.wav")
-PLAY = str(base_path / "play.png")
-RESET = str(base_path / "reset.png")
-SOUND = str(base_path / "sound.png")
-PAUSE = str(base_path / "pause.png")
-STOP_SOUND = str(base_path / "stop_sound.png")
-SETTINGS = str(base_path / "settings.png")
+PLAY = icon_uri("play")
+RESET = icon_uri("reset")
+SOUND = icon_uri("sound")
+PAUSE = icon_uri("pause")
+STOP_SOUND = icon_uri("stop_sound")
+SETTINGS = icon_uri("settings")
 ICON = str(base_path / "don_tomate.png")
-NEXT = str(base_path / "next.png")
-PREV = str(base_path / "prev.png")
+NEXT = icon_uri("next")
+PREV = icon_uri("prev")
 STATUS_MENU_ICON = str(base_path / "status_menu_icon.png")
 
-# Default window size
-Window.size = (500, 300)
+# F12, toggles the instrumentation overlay
+OVERLAY_KEY = 293
+
+# Number of screens kept alive on each side of the current one
+SCREEN_CACHE_RADIUS = 1
+
+# Opacity of the window while it is translucent
+TRANSLUCENT_OPACITY = 0.8
+
+# Seconds between the checks for a suspend of the machine, and the time a running timer
+# must be behind its checkpointed deadline to be caught up
+SUSPEND_CHECK_INTERVAL = 5
+SUSPEND_TOLERANCE = 2
 
 
 class ColoredBoxLayout(BoxLayout):
@@ -54,11 +78,14 @@ class MainScreen(Screen):
     Attributes:
         duration (int): Duration of the timer in seconds.
         time (int): Current remaining time of the timer in seconds.
+        clock: The time source and scheduler of the timer, the clock of the app it was
+            created in.
+        timer (TimerEngine): The deadline based countdown rendered by this screen.
         running (bool): Indicates if the timer is currently running.
-        clock_event (ClockEvent): The clock event for the timer update.
-        sound (Sound): The sound to play when the timer finishes.
+        clock_event (ClockEvent): The clock event for the next timer update.
+        tone (str): The name of the tone played when the timer finishes.
+        sound (Sound): The shared notification sound while it plays for this timer.
         mute (bool): Indicates if the sound is muted.
-        flag_mute_by_stop (bool): Indicates if the sound should be muted when stopped.
     """
 
     def __init__(
@@ -69,6 +96,7 @@ class MainScreen(Screen):
         dir_left_button_disabled=True,
         previous_screen_name=None,
         next_screen_name="break",
+        tone="pomodoro",
         **kwargs,
     ):
         """
@@ -81,207 +109,74 @@ class MainScreen(Screen):
             dir_left_button_disabled (bool): Indicates if the left direction button is disabled.
             previous_screen_name (str): Name of the previous screen.
             next_screen_name (str): Name of the next screen.
+            tone (str): The name of the tone played when the timer finishes.
         """
         super(MainScreen, self).__init__(**kwargs)
         self.duration = duration
-        self.time = self.duration
+        self.clock = App.get_running_app().clock
+        self.timer = TimerEngine(self.duration, clock=self.clock.time)
 
         self.running = False
         self.clock_event = None
+        self._wakeup_at = None
+        self.tone = tone
         self.sound = None
         self.mute = None
         self.previous_screen_name = previous_screen_name
         self.next_screen_name = next_screen_name
-        self.flag_mute_by_stop = True
-
-        # Main Layout
-        main_layout = BoxLayout(orientation="vertical", padding=2, spacing=20)
-
-        # Background color (white or light color)
-        main_layout.canvas.before.clear()
-        with main_layout.canvas.before:
-            Color(0.95, 0.95, 0.95, 1)  # Light pastel gray
-            self.rect = Rectangle(size=main_layout.size, pos=main_layout.pos)
-        main_layout.bind(size=self._update_rect, pos=self._update_rect)
-
-        # Timer display
-        self.label_name = Label(text=screen, font_size="30sp", color=(0, 0, 0, 1))
 
-        # Timer display
-        self.label = Label(text=self.format_time(self.time), font_size="40sp", color=(0, 0, 0, 1))
-
-        # Control buttons with icons
-        self.start_stop_button = Button(
-            background_normal=PLAY,
-            on_press=self.start_stop,
-        )
-
-        # Settings button
-        self.settings_button = Button(background_normal=SETTINGS, on_press=self.open_settings)
-
-        # Sound/Stop Sound button
-        self.stop_sound_button = Button(
+        # Controls, drawn on the face with the icons of the atlas
+        self.start_stop_button = FaceButton(background_normal=PLAY, on_press=self.start_stop)
+        self.settings_button = FaceButton(background_normal=SETTINGS, on_press=self.open_settings)
+        self.stop_sound_button = FaceButton(
             background_normal=SOUND,
             on_press=self.stop_sound,
             disabled=True,
-            disabled_color=(0.95, 0.95, 0.95, 1),
-            color=(0.95, 0.95, 0.95, 1),
             opacity=0,
         )
-
-        # Reset button
-        self.reset_button = Button(
-            background_normal=RESET,
-            on_press=self.reset_timer,
-        )
-
-        # next button
-        self.right_screen_button = Button(
-            background_normal=NEXT,
-            on_press=self.next_screen,
-        )
-
-        self.left_screen_button = Button(
+        self.reset_button = FaceButton(background_normal=RESET, on_press=self.reset_timer)
+        self.right_screen_button = FaceButton(background_normal=NEXT, on_press=self.next_screen)
+        self.left_screen_button = FaceButton(
             background_normal=PREV,
             on_press=self.previous_screen,
-            disabled=True,
-        )
-        self.left_screen_button.opacity = dir_left_button_opacity
-        self.left_screen_button.disabled = dir_left_button_disabled
-
-        # Layout for top-right buttons
-        top_buttons_layout = BoxLayout(
-            orientation="horizontal",
-            size_hint_y=0.1,
-            top=True,
+            disabled=dir_left_button_disabled,
+            opacity=dir_left_button_opacity,
         )
 
-        top_right_layout = BoxLayout(
-            orientation="horizontal",
-            size_hint=(None, None),
-            height=80,
-            width=240,
-            pos_hint={"right": 1, "top": 1},
-        )
-        empty_box = BoxLayout(orientation="horizontal", size_hint_x=0.7)
-        top_right_layout.add_widget(self.stop_sound_button)
-        top_right_layout.add_widget(self.reset_button)
-        top_right_layout.add_widget(self.settings_button)
-        top_buttons_layout.add_widget(empty_box)
-        top_buttons_layout.add_widget(top_right_layout)
-
-        HB = BoxLayout(orientation="horizontal", size_hint_y=0.7, spacing=10)
-
-        main_screen_place_holder = BoxLayout(orientation="vertical", size_hint_x=0.8, spacing=10)
-        empty_lower_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=0.15,
-        )
-        empty_upper_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=0.1,
+        # Name, countdown and controls, on a single canvas
+        self.face = TimerFace(
+            screen,
+            self.format_time(self.time),
+            dict(
+                stop_sound=self.stop_sound_button,
+                reset=self.reset_button,
+                settings=self.settings_button,
+                previous=self.left_screen_button,
+                next=self.right_screen_button,
+                start_stop=self.start_stop_button,
+            ),
         )
+        self.label_name = self.face.label_name
+        self.label = self.face.label
+        self.label.bind(text=self._update_progress)
+        self.add_widget(self.face)
 
-        name_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=0.25,
-        )
-        time_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=0.25,
-        )
-        controls_box = BoxLayout(orientation="horizontal", size_hint_y=0.25, spacing=5)
-
-        name_box.add_widget(self.label_name)
-        time_box.add_widget(self.label)
-
-        controls_empty_right_box = BoxLayout(
-            orientation="horizontal",
-            size_hint_x=0.45,
-        )
-        control_button_box = BoxLayout(
-            orientation="horizontal",
-            size_hint=(None, None),
-            size=(100, 100),
-            pos_hint={"center": 1},
-        )
-        control_button_box.add_widget(self.start_stop_button)
-        controls_empty_left_box = BoxLayout(
-            orientation="horizontal",
-            size_hint_x=0.45,
-        )
-        controls_box.add_widget(controls_empty_right_box)
-        controls_box.add_widget(control_button_box)
-        controls_box.add_widget(controls_empty_left_box)
-
-        main_screen_place_holder.add_widget(name_box)
-        main_screen_place_holder.add_widget(time_box)
-        main_screen_place_holder.add_widget(empty_upper_box)
-        main_screen_place_holder.add_widget(controls_box)
-        main_screen_place_holder.add_widget(empty_lower_box)
-
-        self.left_button_placeholder = BoxLayout(
-            orientation="vertical", size_hint_x=0.15, spacing=10
-        )
-        self.left_upper_empty_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=0.37,
-        )
-        self.left_lower_empty_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=0.37,
-        )
-        self.left_direction_button_placeholder = BoxLayout(
-            orientation="horizontal",
-            size_hint=(None, None),
-            size=(100, 100),
-        )
-        self.left_button_placeholder.add_widget(self.left_upper_empty_box)
-        self.left_direction_button_placeholder.add_widget(self.left_screen_button)
-        self.left_button_placeholder.add_widget(self.left_direction_button_placeholder)
-        self.left_button_placeholder.add_widget(self.left_lower_empty_box)
-
-        self.right_button_placeholder = BoxLayout(
-            orientation="vertical", size_hint_x=0.15, spacing=10
-        )
-        self.upper_empty_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=0.37,
-        )
-        self.lower_empty_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=0.37,
-        )
-        self.direction_button_placeholder = BoxLayout(
-            orientation="horizontal",
-            size_hint=(None, None),
-            size=(100, 100),
-            pos_hint={"right": 1},
-        )
-        self.right_button_placeholder.add_widget(self.upper_empty_box)
-        self.direction_button_placeholder.add_widget(self.right_screen_button)
-        self.right_button_placeholder.add_widget(self.direction_button_placeholder)
-        self.right_button_placeholder.add_widget(self.lower_empty_box)
-
-        HB.add_widget(self.left_button_placeholder)
-
-        HB.add_widget(main_screen_place_holder)
-        HB.add_widget(self.right_button_placeholder)
-        main_layout.add_widget(top_buttons_layout)
-        main_layout.add_widget(HB)
+    @property
+    def time(self):
+        """
+        int: The remaining time of the timer in whole seconds, as displayed.
+        """
+        return self.timer.remaining_seconds()
 
-        self.add_widget(main_layout)
+    @time.setter
+    def time(self, seconds):
+        self.timer.set_remaining(seconds)
 
-    def _update_rect(self, instance, value):
+    def _update_progress(self, *args):
         """
-        Updates the background rectangle size and position based on the layout.
-
-        Args:
-            instance: The instance of the widget calling this method.
-            value: The new value for size or position.
+        Updates the ring of the face along with the countdown.
         """
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+        self.face.progress = 1 - self.timer.remaining() / self.duration if self.duration else 0
 
     def format_time(self, seconds):
         """
@@ -293,8 +188,7 @@ class MainScreen(Screen):
         Returns:
             str: The formatted time string.
         """
-        minutes, seconds = divmod(seconds, 60)
-        return f"{minutes:02}:{seconds:02}"
+        return format_time(seconds)
 
     def start_stop(self, instance):
         """
@@ -308,40 +202,80 @@ class MainScreen(Screen):
         if self.running:
             self.running = False
             self.start_stop_button.background_normal = PLAY
-            if self.clock_event:
-                self.clock_event.cancel()
-                self.clock_event = None
-            app.current_timer = None  # Clear the current timer
+            self.timer.pause()
+            self._cancel_tick()
+            app.cycle.stop()  # Clear the current timer
+            self.log_event(journal.PAUSE)
         else:
             # check if the previous timer is not finished yet
-            current_screen_pos = app.screens.index(self.name)
-            if current_screen_pos == 0 and (
-                sum(app.timers_status.values()) == 0
-                or sum(app.timers_status.values()) == len(app.screens)
-            ):
-                pass
-            elif (
-                app.current_timer == self
-                and app.timers_status.get(app.screens[current_screen_pos])
-                and self.flag_mute_by_stop
-            ):
-                pass
-            elif (
-                app.timers_status.get(app.screens[current_screen_pos - 1])
-                and self.flag_mute_by_stop
-            ):
-                pass
-            else:
+            if not app.cycle.can_start(self.name):
                 return
 
             self.running = True
-            app.current_timer = self  # Set the current timer to this one
+            # Set the current timer to this one
+            if app.cycle.start(self.name):
+                # A new cycle begins, the other timers no longer hold a finished state
+                for screen in self.manager.screens:
+                    if isinstance(screen, MainScreen) and screen is not self and screen.mute:
+                        screen.soft_reset(None)
             self.start_stop_button.background_normal = PAUSE
             if self.sound or self.mute:
                 self.soft_reset(None)
-                self.flag_mute_by_stop = False
+                app.cycle.disarm(self.name)
             else:
-                self.clock_event = Clock.schedule_interval(self.update_time, 1)
+                self.log_event(journal.START)
+                self.timer.start()
+                self._schedule_tick()
+        app.save_checkpoint(self)
+
+    def _schedule_tick(self):
+        """
+        Schedules the next timer update at the next whole-second boundary of the countdown,
+        or once at the deadline while the screen is not displayed or the window is hidden.
+        """
+        self._cancel_tick()
+        app = App.get_running_app()
+        visible = (
+            self.manager is not None
+            and self.manager.current == self.name
+            and not (app.idle_monitor is not None and app.idle_monitor.hidden)
+        )
+        delay = self.timer.next_wakeup(visible)
+        self._wakeup_at = self.clock.time() + delay
+        self.clock_event = self.clock.schedule_once(self._tick, delay)
+
+    def _tick(self, dt):
+        """
+        Updates the countdown on a scheduled wakeup, measuring how late it woke up and how
+        long the update took when the instrumentation is on.
+
+        Args:
+            dt (float): The time delta since the wakeup was scheduled.
+        """
+        app = App.get_running_app()
+        metrics = app.instrumentation
+        if metrics is None:
+            self.update_time(dt)
+            return
+        start = self.clock.time()
+        metrics.tick_jitter.record(start - self._wakeup_at)
+        self.update_time(dt)
+        metrics.update_time.record(self.clock.time() - start)
+
+    def _cancel_tick(self):
+        """
+        Cancels the pending timer update, if any.
+        """
+        if self.clock_event:
+            self.clock_event.cancel()
+            self.clock_event = None
+
+    def on_enter(self, *args):
+        """
+        Catches the display up with the countdown when the screen becomes visible.
+        """
+        if self.running and self.timer.running:
+            self.update_time(0)
 
     def reset_timer(self, instance):
         """
@@ -350,9 +284,13 @@ class MainScreen(Screen):
         Args:
             instance: The button instance that triggered this method.
         """
+        # A finished timer was journaled as complete, resetting it only rewinds it
+        finished = self.sound is not None or self.mute
+        if not finished and (self.running or self.timer.remaining() < self.duration):
+            self.log_event(journal.RESET)
         self.soft_reset(None)
         app = App.get_running_app()
-        app.current_timer = None  # Clear the current timer
+        app.cycle.stop()  # Clear the current timer
 
     def soft_reset(self, instance, **kwargs):
         """
@@ -363,10 +301,8 @@ class MainScreen(Screen):
             **kwargs: Additional keyword arguments.
         """
         self.running = False
-        if self.clock_event:
-            self.clock_event.cancel()
-            self.clock_event = None
-        self.time = self.duration
+        self._cancel_tick()
+        self.timer.reset(self.duration)
         self.label.text = self.format_time(self.time)
         self.start_stop_button.background_normal = PLAY
         self.stop_sound(None)
@@ -374,42 +310,84 @@ class MainScreen(Screen):
         self.stop_sound_button.disabled = True
         self.stop_sound_button.opacity = 0
         self.stop_sound_button.background_normal = SOUND
+        App.get_running_app().save_checkpoint(self)
 
     def update_time(self, dt):
         """
-        Updates the timer every second. Stops the timer when time is up.
+        Renders the remaining time of the countdown and schedules the next update.
+        Stops the timer when time is up.
 
         Args:
-            dt (float): The time delta since the last update.
+            dt (float): The time delta since the last update, unused since the remaining
+                time is derived from the deadline.
         """
         if self.running:
-            if self.time > 0:
-                self.time -= 1
+            if not self.timer.expired():
                 self.label.text = self.format_time(self.time)
+                self._schedule_tick()
             else:
                 app = App.get_running_app()
-                app.timers_status[self.name] = True
+                n_completed = app.cycle.n_completed
+                app.cycle.complete(self.name)
                 self.running = False
+                self.timer.pause()
+                self._cancel_tick()
+                self.log_event(journal.COMPLETE)
+                if n_completed < app.cycle.n_completed == len(app.cycle.segments):
+                    app.publish_event(
+                        events.CYCLE_COMPLETED,
+                        self.name,
+                        self.label_name.text,
+                        self.duration,
+                        self.duration,
+                    )
+                app.save_checkpoint(self)
                 self.label.text = "Time's up!"
                 self.notify_time()
-                self.sound.bind(
-                    on_stop=lambda instance=None, inactive_stop=True: self.soft_reset(
-                        instance=instance, inactive_stop=inactive_stop
-                    )
-                )
+
+    def log_event(self, event):
+        """
+        Records a timer event in the statistics of the app, which the UI reads, and
+        publishes it on the event bus of the app, which journals it.
+
+        Args:
+            event (str): The event, one of the `don_tomate.journal` events (e.g. "start").
+        """
+        app = App.get_running_app()
+        actual = self.duration - self.timer.remaining()
+        if app.statistics is not None:
+            app.statistics.record(event, self.name, self.duration, actual)
+        app.publish_event(
+            events.JOURNAL_KINDS[event], self.name, self.label_name.text, self.duration, actual
+        )
+        app.state_changed()
 
     def notify_time(self):
         """
-        Plays the notification sound when the timer finishes.
+        Plays the tone of the timer when it finishes, or the notification sound if the
+        tone cannot be played. The timer is soft reset once the sound stops, either at its
+        end or from the stop sound button.
         """
-        self.sound = SoundLoader.load(SOUND_PATH)
+        app = App.get_running_app()
+        self.sound = app.sounds.play(self.tone, on_stop=self.on_sound_stop) or app.sounds.play(
+            "notification", on_stop=self.on_sound_stop
+        )
         if self.sound:
-            self.sound.play()
             self.stop_sound_button.disabled = False
             self.stop_sound_button.opacity = 1
         else:
             print("Sound file not found!")
 
+    def on_sound_stop(self, sound):
+        """
+        Soft resets the timer when its notification sound stops.
+
+        Args:
+            sound (Sound): The sound that stopped.
+        """
+        self.soft_reset(None, inactive_stop=True)
+        App.get_running_app().state_changed()
+
     def stop_sound(self, instance):
         """
         Stops the sound if it is playing and updates the mute state.
@@ -436,6 +414,7 @@ class MainScreen(Screen):
         self.manager.transition = SlideTransition(direction="left")
         app = App.get_running_app()
         app.prev_screen = self.manager.current
+        app.ensure_settings(self.manager)
         self.manager.current = "settings"
 
     def next_screen(self, instance):
@@ -445,8 +424,8 @@ class MainScreen(Screen):
         Args:
             instance: The button instance that triggered this method.
         """
-        self.manager.transition = SlideTransition(direction="left")
-        self.manager.current = self.next_screen_name
+        app = App.get_running_app()
+        app.show_screen(self.next_screen_name, direction="left", sm=self.manager)
 
     def previous_screen(self, instance):
         """
@@ -455,8 +434,35 @@ class MainScreen(Screen):
         Args:
             instance: The button instance that triggered this method.
         """
-        self.manager.transition = SlideTransition(direction="right")
-        self.manager.current = self.previous_screen_name
+        app = App.get_running_app()
+        app.show_screen(self.previous_screen_name, direction="right", sm=self.manager)
+
+    def relink(self, previous_screen_name, next_screen_name):
+        """
+        Points the navigation buttons to new neighbouring screens.
+
+        Args:
+            previous_screen_name (str): Name of the previous screen.
+            next_screen_name (str): Name of the next screen.
+        """
+        self.previous_screen_name = previous_screen_name
+        self.next_screen_name = next_screen_name
+
+    def is_pristine(self):
+        """
+        Checks if the screen holds no state besides its construction arguments, in which
+        case it can be dropped and created again later without any visible difference.
+
+        Returns:
+            bool: True if the timer is stopped at its full duration and no sound is pending.
+        """
+        return (
+            not self.running
+            and self.timer.remaining() == self.duration
+            and self.sound is None
+            and self.mute is None
+            and App.get_running_app().cycle.is_armed(self.name)
+        )
 
 
 class SettingsScreen(Screen):
@@ -464,26 +470,32 @@ class SettingsScreen(Screen):
     The settings screen for customizing timer options and other configurations.
 
     Attributes:
-        time_options (dict): A dictionary of available timer options.
-        selected_times (dict): A dictionary of the selected times for each timer.
+        schedule (Schedule): The segments of the cycle and their durations.
         n_pomodoros (int): The number of Pomodoro cycles.
-        tree_nodes (dict): A dictionary to store references to TreeViewLabel nodes.
+        tree_nodes (dict): The TreeViewLabel node of each duration option, by (screen name,
+            duration in seconds).
+        option_nodes (dict): The TreeViewLabel node of each timer, by screen name.
+        cycles_nodes (dict): The TreeViewLabel node of each number of cycles.
     """
 
-    def __init__(self, time_options, selected_times, n_pomodoros, **kwargs):
+    def __init__(self, schedule, n_pomodoros, **kwargs):
         """
         gets the SettingsScreen started for the timer options and other settings.
 
         Args:
-            time_options (dict): A dictionary of available timer options.
-            selected_times (dict): A dictionary of the selected times for each timer.
+            schedule (Schedule): The segments of the cycle and their durations.
             n_pomodoros (int): The number of Pomodoro cycles.
         """
+        # The tree widgets are only imported once the settings are first opened
+        from kivy.uix.scrollview import ScrollView
+        from kivy.uix.treeview import TreeView, TreeViewLabel
+
         super(SettingsScreen, self).__init__(**kwargs)
-        self.time_options = time_options
-        self.selected_times = selected_times
+        self.schedule = schedule
         self.n_pomodoros = n_pomodoros
         self.tree_nodes = {}
+        self.option_nodes = {}
+        self.cycles_nodes = {}
 
         # Create a ScrollView for the TreeView
         scrollview = ScrollView(size_hint=(1, 1))
@@ -491,14 +503,16 @@ class SettingsScreen(Screen):
         # Create the TreeView
         treeview = TreeView(root_options=dict(text="Settings"), hide_root=True, size_hint_y=None)
         treeview.bind(minimum_height=treeview.setter("height"))
+        self.treeview = treeview
 
         # Timer options
         self.add_timer_options(treeview)
 
         # Add the numbers of pomodoros
         tree_node = treeview.add_node(TreeViewLabel(text="Cycles"))
-        for n_cycles in [1, 2, 3, 4, 5, 6]:
+        for n_cycles in sorted({*CYCLE_OPTIONS, n_pomodoros}):
             cycles_node = treeview.add_node(TreeViewLabel(text=str(n_cycles)), tree_node)
+            self.cycles_nodes[n_cycles] = cycles_node
 
             # Highlight the selected option
             if n_cycles == self.n_pomodoros:
@@ -506,19 +520,23 @@ class SettingsScreen(Screen):
 
             # Bind the selection action
             cycles_node.bind(
-                on_touch_down=lambda instance, touch, opt=cycles_node: self.select_cycles(
+                on_touch_down=lambda instance, touch, opt=n_cycles: self.select_cycles(
                     instance, touch, opt
                 )
             )
 
         # Always on Top option
-        self.always_on_top_node = treeview.add_node(TreeViewLabel(text="Float on Top On"))
+        self.always_on_top_node = treeview.add_node(TreeViewLabel(text=self.always_on_top_text()))
         self.always_on_top_node.bind(on_touch_down=self.toggle_always_on_top)
 
         # Transparency option
-        self.transparency_node = treeview.add_node(TreeViewLabel(text="Translucent On"))
+        self.transparency_node = treeview.add_node(TreeViewLabel(text=self.transparency_text()))
         self.transparency_node.bind(on_touch_down=self.toggle_transparency)
 
+        # Statistics
+        statistics_node = treeview.add_node(TreeViewLabel(text="Statistics"))
+        statistics_node.bind(on_touch_down=self.open_statistics)
+
         # Done button
         done_node = treeview.add_node(TreeViewLabel(text="Done"))
         done_node.bind(on_touch_down=self.done_settings)
@@ -545,18 +563,11 @@ class SettingsScreen(Screen):
             touch: The touch event instance.
         """
         if instance.collide_point(*touch.pos):
-            if platform.system() == "Darwin":
-                NSApplication = objc.lookUpClass("NSApplication")
-                app = NSApplication.sharedApplication()
-                window = app.windows()[0]  # Get the main window
-
-                current_text = self.always_on_top_node.text
-                if "On" in current_text:
-                    window.setLevel_(kCGStatusWindowLevel)  # Set to "Always on Top"
-                    self.update_node_text(self.always_on_top_node, "Float on Top Off")
-                else:
-                    window.setLevel_(kCGNormalWindowLevel)  # Set back to normal
-                    self.update_node_text(self.always_on_top_node, "Float on Top On")
+            app = App.get_running_app()
+            if set_always_on_top(not app.always_on_top):
+                app.always_on_top = not app.always_on_top
+                self.update_node_text(self.always_on_top_node, self.always_on_top_text())
+                app.save_settings()
 
     def toggle_transparency(self, instance, touch):
         """
@@ -567,13 +578,29 @@ class SettingsScreen(Screen):
             touch: The touch event instance.
         """
         if instance.collide_point(*touch.pos):
-            current_text = self.transparency_node.text
-            if "On" in current_text:
-                Window.opacity = 0.8  # Adjust opacity as needed
-                self.update_node_text(self.transparency_node, "Translucent Off")
-            else:
-                Window.opacity = 1  # Reset opacity to full
-                self.update_node_text(self.transparency_node, "Translucent On")
+            app = App.get_running_app()
+            app.translucent = not app.translucent
+            set_opacity(TRANSLUCENT_OPACITY if app.translucent else 1)
+            self.update_node_text(self.transparency_node, self.transparency_text())
+            app.save_settings()
+
+    def always_on_top_text(self):
+        """
+        Returns the text of the "Always on Top" node, the action it takes.
+
+        Returns:
+            str: The text of the node.
+        """
+        return "Float on Top Off" if App.get_running_app().always_on_top else "Float on Top On"
+
+    def transparency_text(self):
+        """
+        Returns the text of the transparency node, the action it takes.
+
+        Returns:
+            str: The text of the node.
+        """
+        return "Translucent Off" if App.get_running_app().translucent else "Translucent On"
 
     def add_timer_options(self, treeview):
         """
@@ -582,27 +609,86 @@ class SettingsScreen(Screen):
         Args:
             treeview (TreeView): The TreeView to which the timer options are added.
         """
-        root_node = treeview.add_node(TreeViewLabel(text="Custom timers"))
+        from kivy.uix.treeview import TreeViewLabel
+
+        self.timers_root_node = treeview.add_node(TreeViewLabel(text="Custom timers"))
+
+        for name in self.schedule.names:
+            self.add_segment_options(name)
+
+    def add_segment_options(self, name):
+        """
+        Adds the duration options of a single timer to the TreeView.
 
-        for option, time_options in self.time_options.items():
-            tree_node = treeview.add_node(TreeViewLabel(text=option), root_node)
+        Args:
+            name (str): The screen name of the timer (e.g., "break_1").
+        """
+        from kivy.uix.treeview import TreeViewLabel
+
+        idx = self.schedule.index(name)
+        tree_node = self.treeview.add_node(
+            TreeViewLabel(text=self.schedule.titles[idx]), self.timers_root_node
+        )
+        self.option_nodes[name] = tree_node
 
-            for time_option in time_options:
-                time_node = treeview.add_node(TreeViewLabel(text=time_option), tree_node)
+        for duration in self.schedule.duration_options(idx):
+            time_node = self.treeview.add_node(
+                TreeViewLabel(text=format_time(duration)), tree_node
+            )
 
-                # Store reference to the TreeViewLabel node
-                self.tree_nodes[(option, time_option)] = time_node
+            # Store reference to the TreeViewLabel node
+            self.tree_nodes[(name, duration)] = time_node
 
-                # Highlight the selected time
-                if self.selected_times[option] == time_option:
-                    time_node.color = (0.3, 0.5, 1, 1)
+            # Highlight the selected duration
+            if self.schedule.durations[idx] == duration:
+                time_node.color = (0.3, 0.5, 1, 1)
 
-                # Bind the selection action
-                time_node.bind(
-                    on_touch_down=lambda instance, touch, opt=option, time_opt=time_option: self.select_time(
-                        instance, touch, opt, time_opt
-                    )
+            # Bind the selection action
+            time_node.bind(
+                on_touch_down=lambda instance, touch, opt=name, time_opt=duration: self.select_time(
+                    instance, touch, opt, time_opt
                 )
+            )
+
+    def remove_segment_options(self, name):
+        """
+        Removes the duration options of a single timer from the TreeView.
+
+        Args:
+            name (str): The screen name of the timer (e.g., "break_1").
+        """
+        tree_node = self.option_nodes.pop(name)
+        for key in [key for key in self.tree_nodes if key[0] == name]:
+            del self.tree_nodes[key]
+        self.treeview.remove_node(tree_node)
+
+    def update_schedule(self, schedule, n_pomodoros):
+        """
+        Updates the TreeView in place after the number of Pomodoro cycles changed, only
+        adding and removing the options of the timers that changed.
+
+        Args:
+            schedule (Schedule): The segments of the new cycle and their durations.
+            n_pomodoros (int): The number of Pomodoro cycles.
+        """
+        self.schedule = schedule
+
+        for name in [name for name in self.option_nodes if name not in schedule.positions]:
+            self.remove_segment_options(name)
+        for name in schedule.names:
+            if name not in self.option_nodes:
+                self.add_segment_options(name)
+
+        # Keep the timers in schedule order
+        self.option_nodes = {name: self.option_nodes[name] for name in schedule.names}
+        self.timers_root_node.nodes[:] = self.option_nodes.values()
+
+        if self.n_pomodoros in self.cycles_nodes:
+            self.cycles_nodes[self.n_pomodoros].color = (1, 1, 1, 1)  # Default color
+        self.n_pomodoros = n_pomodoros
+        if n_pomodoros in self.cycles_nodes:
+            self.cycles_nodes[n_pomodoros].color = (0.3, 0.5, 1, 1)
+        self.treeview._trigger_layout()
 
     def done_settings(self, instance, touch):
         """
@@ -617,44 +703,50 @@ class SettingsScreen(Screen):
             app = App.get_running_app()
             self.manager.current = app.prev_screen
 
-    def select_time(self, instance, touch, screen, time):
+    def open_statistics(self, instance, touch):
+        """
+        Opens the statistics screen.
+
+        Args:
+            instance (TreeViewLabel): The node that was touched.
+            touch: The touch event instance.
+        """
+        if instance.collide_point(*touch.pos):
+            app = App.get_running_app()
+            app.ensure_statistics(self.manager)
+            self.manager.transition = SlideTransition(direction="left")
+            self.manager.current = "statistics"
+
+    def select_time(self, instance, touch, name, duration):
         """
         Selects a specific timer option and updates the TreeView to reflect the selection.
 
         Args:
             instance (TreeViewLabel): The node that was touched.
             touch: The touch event instance.
-            screen (str): The name of the screen associated with the timer (e.g., "Pomodoro 1").
-            time (str): The selected time option (e.g., "25 min").
+            name (str): The screen name of the timer (e.g., "break_1").
+            duration (int): The selected duration in seconds.
         """
         if instance.collide_point(*touch.pos):
             app = App.get_running_app()
+            idx = self.schedule.index(name)
             # Reset the color of the previous selection
-            previous_time = app.selected_times[screen]
-            if (screen, previous_time) in self.tree_nodes:
-                self.tree_nodes[(screen, previous_time)].color = (
-                    1,
-                    1,
-                    1,
-                    1,
-                )  # Default color
-
-            # Update the selected time
-            self.selected_times[screen] = time
+            previous_duration = self.schedule.durations[idx]
+            if (name, previous_duration) in self.tree_nodes:
+                self.tree_nodes[(name, previous_duration)].color = (1, 1, 1, 1)  # Default color
+
+            # Update the selected duration
+            self.schedule.set_duration(idx, duration)
 
             # Highlight the new selection
-            self.tree_nodes[(screen, time)].color = (0.3, 0.5, 1, 1)
+            self.tree_nodes[(name, duration)].color = (0.3, 0.5, 1, 1)
 
             # Update the actual application timer values
-            screen_map = app.screen_map
-            selected_screen = screen_map[screen]
-            selected_time = time.split(":")[0]
-            app.root.get_screen(selected_screen).duration = int(selected_time) * 60
-            app.root.get_screen(selected_screen).time = int(selected_time) * 60
-            app.root.get_screen(selected_screen).label.text = app.root.get_screen(
-                "main"
-            ).format_time(int(selected_time) * 60)
-            app.root.get_screen(selected_screen).reset_timer(None)
+            app.screen_specs[name]["duration"] = duration
+            if app.root.has_screen(name):
+                app.root.get_screen(name).duration = duration
+                app.root.get_screen(name).reset_timer(None)
+            app.save_settings()
 
     def select_cycles(self, instance, touch, n_cycles):
         """
@@ -667,179 +759,661 @@ class SettingsScreen(Screen):
         """
         if instance.collide_point(*touch.pos):
             app = App.get_running_app()
-            self.n_pomodoros = int(n_cycles.text)  # Update the number of Pomodoros
-            app.rebuild_screens(
-                self.n_pomodoros
-            )  # Rebuild screens with the new number of Pomodoros
+            app.rebuild_screens(n_cycles)  # Rebuild screens with the new number of Pomodoros
+            app.save_settings()
+
+
+class StatisticsScreen(Screen):
+    """
+    The statistics screen summarizing the session history.
+
+    Attributes:
+        statistics (SessionStatistics): The statistics of the session history.
+        summary_label (Label): The label showing the summary.
+    """
+
+    def __init__(self, statistics, **kwargs):
+        """
+        gets the StatisticsScreen started.
+
+        Args:
+            statistics (SessionStatistics): The statistics of the session history.
+        """
+        super(StatisticsScreen, self).__init__(**kwargs)
+        self.statistics = statistics
+
+        layout = BoxLayout(orientation="vertical", padding=20, spacing=10)
+        self.summary_label = Label(halign="left", valign="top", font_size="16sp")
+        self.summary_label.bind(size=self.summary_label.setter("text_size"))
+        done_button = Button(text="Done", size_hint_y=0.2, on_press=self.done_statistics)
+        layout.add_widget(self.summary_label)
+        layout.add_widget(done_button)
+        self.add_widget(layout)
+
+    def on_pre_enter(self, *args):
+        """
+        Refreshes the summary before the screen is shown.
+        """
+        self.summary_label.text = "\n".join(self.statistics.summary())
+
+    def done_statistics(self, instance):
+        """
+        Returns to the settings screen.
+
+        Args:
+            instance: The button instance that triggered this method.
+        """
+        self.manager.transition = SlideTransition(direction="right")
+        self.manager.current = "settings"
 
 
 class DonTomateApp(App):
     """
     The main application class for the Don Tomate Pomodoro app.
     Manages the app's screens, timers, and settings.
+
+    Attributes:
+        n_pomodoros (int): The number of Pomodoro cycles the app is built with, the saved
+            one unless set before the app is built.
+        kind_durations (tuple): The duration in seconds of each kind of segment, by
+            `don_tomate.schedule` kind. The saved durations of the segments are used unless
+            set before the app is built.
+        schedule (Schedule): The segments of the cycle and their durations.
+        always_on_top (bool): Indicates if the window floats on top of the others.
+        translucent (bool): Indicates if the window is translucent.
+        handover (dict): A countdown to continue once the app starts, the
+            `TrayTimer.handover` of the tray-only mode. None to start at the first Pomodoro.
+        control_address (str): Where the control server listens, a Unix socket path or a
+            localhost port number. The server is not started if None.
+        clock: The time source and scheduler of the timers, a `don_tomate.clock.KivyClock`
+            if None when the app is built. A `VirtualClock` lets simulations skip time.
+        screen_cache_radius (int): The number of timer screens kept alive on each side of
+            the current one.
+        metrics_path (str): Where the summary of the tick and frame measures is written
+            on exit. The measures and their overlay (toggled with F12) are off if None.
     """
 
-    def build(self, n_pomodoros=4):
+    n_pomodoros = 4
+    kind_durations = schedule.DEFAULT_DURATIONS
+    always_on_top = False
+    translucent = False
+    handover = None
+    control_address = None
+    metrics_path = None
+    clock = None
+    screen_cache_radius = SCREEN_CACHE_RADIUS
+
+    def build(self, n_pomodoros=None):
         """
         Builds the main application interface, including the screen manager and initial screens.
 
+        The saved settings are loaded first, so the screens are built with the chosen
+        durations right away.
+
         Args:
-            n_pomodoros (int): The number of Pomodoro cycles (default is 4).
+            n_pomodoros (int): The number of Pomodoro cycles, `n_pomodoros` if None.
 
         Returns:
             ScreenManager: The screen manager containing all the screens of the app.
         """
         self.icon = ICON
-        self.screen_map = {}
-        self.time_options = {}
-        self.selected_times = {}
-        self.n_pomodoros = n_pomodoros
-        self.current_timer = None
-        self.timers_status = {}
+        if self.clock is None:
+            self.clock = KivyClock()
+        self.tones = None
+        self.sounds = SoundCache(
+            {
+                "notification": SOUND_PATH,
+                **{name: partial(self.tone_path, name) for name in schedule.TONE_NAMES},
+            }
+        )
+        self.journal = journal.SessionJournal(Path(self.user_data_dir) / "history.sqlite3")
+        self.checkpoint = checkpoint.TimerCheckpoint(Path(self.user_data_dir) / "timer.checkpoint")
+        self.events = events.EventBus()
+        self.events.subscribe(self.journal_event, kinds=tuple(events.JOURNAL_EVENTS))
+        self.statistics = None
+        self.idle_monitor = None
+        self.control = None
+        self.instrumentation = Instrumentation() if self.metrics_path else None
+        self.overlay = None
+        self._overlay_event = None
+        self.state_listeners = []
+        self._state_trigger = Clock.create_trigger(self.publish_state)
+        self.schedule = None
+        self.settings = SettingsStore(Path(self.user_data_dir) / "settings.json")
+        if n_pomodoros is not None:
+            self.n_pomodoros = n_pomodoros
+        elif "n_pomodoros" not in vars(self):
+            saved = self.settings.get("n_pomodoros")
+            if isinstance(saved, int) and saved >= 1:
+                self.n_pomodoros = saved
+        self.always_on_top = self.settings.get("always_on_top") is True
+        self.translucent = self.settings.get("translucent") is True
         self.screens = ["main", "long_break"]
+        self.cycle = None
+        self.screen_specs = {}
         self.make_screen_mapping()
 
+        get_window().size = WINDOW_SIZE
+
         sm = ScreenManager()
         sm = self.build_screens(sm)
+        return sm
+
+    def tone_path(self, name):
+        """
+        Returns the WAV file of a notification tone, synthesizing the tones with NumPy the
+        first time one is needed.
+
+        Args:
+            name (str): The name of the tone (e.g., "long_break").
+
+        Returns:
+            str: The path of the WAV file.
+        """
+        from don_tomate.tones import ToneBank
+
+        if self.tones is None:
+            self.tones = ToneBank(Path(self.user_data_dir) / "tones")
+        return self.tones.path(name)
 
-        sm.add_widget(
-            SettingsScreen(
-                name="settings",
-                time_options=self.time_options,
-                selected_times=self.selected_times,
-                n_pomodoros=self.n_pomodoros,
+    def resume_timer(self, segment, remaining, deadline=None):
+        """
+        Continues a countdown started elsewhere, e.g. in the tray-only mode, on its screen.
+        The segments before it count as finished in the cycle.
+
+        Args:
+            segment (str): The screen name of the segment (e.g., "break_1").
+            remaining (float): The remaining time in seconds of a paused countdown.
+            deadline (float): The monotonic time at which a running countdown ends, None
+                if it is paused.
+        """
+        for name in self.screens[: self.screens.index(segment)]:
+            self.cycle.complete(name)
+        self.show_screen(segment)
+        screen = self.root.get_screen(segment)
+        if deadline is not None:
+            remaining = deadline - self.clock.time()
+        screen.timer.set_remaining(max(0.0, remaining))
+        screen.label.text = screen.format_time(screen.time)
+        if deadline is not None:
+            screen.start_stop(None)
+        else:
+            self.save_checkpoint(screen)
+
+    def save_checkpoint(self, screen):
+        """
+        Checkpoints the state of a timer after it changed: the wall-clock deadline of a
+        running timer, or the remaining time of a paused one. A timer that stops clears
+        the checkpoint if it holds this timer.
+
+        Args:
+            screen (MainScreen): The timer screen whose state changed.
+        """
+        if screen.running:
+            self.checkpoint.save(
+                checkpoint.RUNNING,
+                screen.name,
+                self.n_pomodoros,
+                deadline=self.clock.wall_time() + screen.timer.remaining(),
             )
-        )
-        return sm
+        elif 0 < screen.timer.remaining() < screen.duration:
+            self.checkpoint.save(
+                checkpoint.PAUSED,
+                screen.name,
+                self.n_pomodoros,
+                remaining=screen.timer.remaining(),
+            )
+        elif self.checkpoint.last is not None and self.checkpoint.last.segment == screen.name:
+            self.checkpoint.save(checkpoint.IDLE)
 
-    def make_screen_mapping(self):
+    def restore_checkpoint(self):
         """
-        Creates mappings for the screen names, time options, and selected times
-        based on the number of Pomodoro cycles. This mapping is used to manage
-        transitions between different screens in the app.
-        """
-        pomodoro_time_options = [
-            "05:00",
-            "10:00",
-            "15:00",
-            "20:00",
-            "25:00",
-            "30:00",
-        ]
-        break_time_options = [
-            "05:00",
-            "10:00",
-            "15:00",
-            "20:00",
-            "25:00",
-            "30:00",
-        ]
-        screen_map, time_options, selected_times = {}, {}, {}
-        for i in range(self.n_pomodoros + 1):
-            if i == 0:
-                screen_map["Pomodoro 1"] = "main"
-                time_options["Pomodoro 1"] = pomodoro_time_options
-                selected_times["Pomodoro 1"] = "25:00"
-            elif i == self.n_pomodoros:
-                screen_map["Long Break"] = "long_break"
-                time_options["Long Break"] = break_time_options
-                selected_times["Long Break"] = "15:00"
-            else:
-                screen_map[f"Short Break {i}"] = f"break_{i}"
-                time_options[f"Short Break {i}"] = break_time_options
-                selected_times[f"Short Break {i}"] = "05:00"
-                screen_map[f"Pomodoro {i + 1}"] = f"main_{i + 1}"
-                time_options[f"Pomodoro {i + 1}"] = pomodoro_time_options
-                selected_times[f"Pomodoro {i + 1}"] = "25:00"
-
-        self.screen_map = screen_map
-        self.time_options = time_options
-        self.selected_times = selected_times
-        self.screens = list(screen_map.values())
+        Continues the timer checkpointed by the previous run of the app, e.g. after a
+        crash, or fires its notification right away if it ended in the meantime.
 
-    def build_screens(self, sm):
+        Returns:
+            bool: True if a timer was restored.
+        """
+        saved = self.checkpoint.load()
+        if (
+            saved is None
+            or saved.state == checkpoint.IDLE
+            or saved.n_pomodoros != self.n_pomodoros
+            or saved.segment not in self.screen_specs
+        ):
+            return False
+        if saved.state == checkpoint.PAUSED:
+            self.resume_timer(saved.segment, saved.remaining)
+            return True
+        remaining = max(0.0, saved.deadline - self.clock.wall_time())
+        self.resume_timer(saved.segment, remaining, deadline=self.clock.time() + remaining)
+        if remaining == 0:
+            self.root.get_screen(saved.segment).update_time(0)
+        return True
+
+    def check_suspend(self, *args):
+        """
+        Catches the running timer up with its checkpointed deadline after the machine
+        slept, since the monotonic clock of the timers stands still meanwhile. A timer
+        whose deadline passed during the sleep finishes right away.
+        """
+        saved = self.checkpoint.last
+        if saved is None or saved.state != checkpoint.RUNNING:
+            return
+        if not self.root.has_screen(saved.segment):
+            return
+        screen = self.root.get_screen(saved.segment)
+        if not (screen.running and screen.timer.running):
+            return
+        remaining = max(0.0, saved.deadline - self.clock.wall_time())
+        if screen.timer.remaining() - remaining > SUSPEND_TOLERANCE:
+            screen.timer.set_remaining(remaining)
+            screen.update_time(0)
+
+    def ensure_statistics(self, sm=None):
         """
-        Creates and adds all the Pomodoro, break, and long break screens to the screen manager.
+        Returns the statistics screen, creating it and loading the session history with
+        NumPy the first time it is opened.
 
         Args:
-            sm (ScreenManager): The screen manager to which the screens will be added.
+            sm (ScreenManager): The screen manager holding the screens, the app root if None.
+
+        Returns:
+            StatisticsScreen: The statistics screen.
+        """
+        from don_tomate.stats import SessionStatistics
+
+        sm = sm or self.root
+        if self.statistics is None:
+            # The events still on the bus are not journaled yet
+            self.events.flush()
+            self.statistics = SessionStatistics(self.journal)
+        if not sm.has_screen("statistics"):
+            sm.add_widget(StatisticsScreen(name="statistics", statistics=self.statistics))
+        return sm.get_screen("statistics")
+
+    def ensure_settings(self, sm=None):
+        """
+        Returns the settings screen, creating it the first time the settings are opened.
+
+        Args:
+            sm (ScreenManager): The screen manager holding the screens, the app root if None.
 
         Returns:
-            ScreenManager: The updated screen manager with all the screens added.
+            SettingsScreen: The settings screen.
+        """
+        sm = sm or self.root
+        if not sm.has_screen("settings"):
+            sm.add_widget(
+                SettingsScreen(
+                    name="settings",
+                    schedule=self.schedule,
+                    n_pomodoros=self.n_pomodoros,
+                )
+            )
+        return sm.get_screen("settings")
+
+    def on_start(self):
+        """
+        Synthesizes the tones and decodes the notification sounds right after the first
+        frame, so a finishing timer never waits on them, applies the saved window settings,
+        starts following the window state and continues the countdown handed over by the
+        tray-only mode or checkpointed by the previous run, if any.
         """
-        if self.n_pomodoros == 1:
-            next_screen_name = "long_break"
+        self.clock.schedule_once(self.sounds.preload)
+        if self.always_on_top:
+            self.always_on_top = set_always_on_top(True)
+        if self.translucent:
+            set_opacity(TRANSLUCENT_OPACITY)
+        self.idle_monitor = IdleMonitor(self.on_window_state)
+        self.idle_monitor.start()
+        if self.handover is not None:
+            self.resume_timer(**self.handover)
         else:
-            next_screen_name = "break_1"
-
-        sm.add_widget(
-            MainScreen(
-                name="main",
-                screen="Pomodoro 1",
-                duration=25 * 60,
-                previous_screen_name="long_break",
-                next_screen_name=next_screen_name,
+            self.restore_checkpoint()
+        self.clock.schedule_interval(self.check_suspend, SUSPEND_CHECK_INTERVAL)
+        if self.control_address is not None:
+            from don_tomate.control import ControlServer
+
+            if self.control_address.isdigit():
+                self.control = ControlServer(self, port=int(self.control_address))
+            else:
+                self.control = ControlServer(self, path=self.control_address)
+            try:
+                self.control.start()
+            except OSError as error:
+                Logger.error(f"Control: cannot listen on {self.control_address}: {error}")
+                self.control = None
+        if self.instrumentation is not None:
+            window = get_window()
+            window.bind(
+                on_draw=lambda window: self.instrumentation.on_draw(self.clock.time()),
+                on_flip=lambda window: self.instrumentation.on_flip(self.clock.time()),
+                on_key_down=self.on_key_down,
+            )
+
+    def on_key_down(self, window, key, *args):
+        """
+        Toggles the instrumentation overlay with F12.
+
+        Args:
+            window (Window): The window of the app.
+            key (int): The key code.
+        """
+        if key == OVERLAY_KEY:
+            self.toggle_overlay()
+            return True
+
+    def toggle_overlay(self):
+        """
+        Shows or hides the instrumentation report over the screens, refreshed twice a
+        second while shown.
+        """
+        window = get_window()
+        if self.overlay is None:
+            self.overlay = Label(
+                text=self.instrumentation.report(),
+                font_size="11sp",
+                color=(0.8, 0.1, 0.1, 1),
+                halign="left",
+                valign="bottom",
+                size_hint=(None, None),
+                size=(window.width, 70),
+                text_size=(window.width - 10, 70),
+                pos=(5, 0),
             )
+            self._overlay_event = Clock.schedule_interval(
+                lambda dt: setattr(self.overlay, "text", self.instrumentation.report()), 0.5
+            )
+            window.add_widget(self.overlay)
+        else:
+            self._overlay_event.cancel()
+            window.remove_widget(self.overlay)
+            self.overlay = None
+
+    def on_window_state(self, monitor):
+        """
+        Stops the per-second countdown updates while the window is minimized or hidden,
+        leaving a single wakeup at the deadline, and catches up instantly on restore.
+
+        Args:
+            monitor (IdleMonitor): The monitor of the window state.
+        """
+        for screen in self.root.screens:
+            if isinstance(screen, MainScreen) and screen.running and screen.timer.running:
+                screen.update_time(0)
+
+    def on_stop(self):
+        """
+        Delivers the pending timer events, commits the pending session journal events and
+        settings, closes the control server and writes the instrumentation summary before the
+        app exits.
+        """
+        self.events.close()
+        self.journal.close()
+        self.settings.close()
+        self.checkpoint.close()
+        if self.control is not None:
+            self.control.stop()
+        if self.instrumentation is not None:
+            self.instrumentation.dump(self.metrics_path)
+
+    def control_target(self):
+        """
+        Returns the timer screen the control commands apply to: the displayed one, or the
+        one the settings were opened from.
+
+        Returns:
+            MainScreen: The timer screen.
+        """
+        sm = self.root
+        name = (
+            sm.current if sm.current in self.screen_specs else getattr(self, "prev_screen", "main")
         )
+        return self.ensure_screen(name, sm)
 
-        idx = 0
-        for screen, name in self.screen_map.items():
-            if idx == 0:
-                pass
-            elif idx + 1 == len(self.screens):
-                sm.add_widget(
-                    MainScreen(
-                        name="long_break",
-                        screen="Long Break",
-                        duration=30 * 60,
-                        dir_left_button_opacity=100,
-                        dir_left_button_disabled=False,
-                        previous_screen_name=self.screens[idx - 1],
-                        next_screen_name="main",
-                    )
-                )
-            else:
-                duration = 5 * 60 if "break" in name else 25 * 60
-                sm.add_widget(
-                    MainScreen(
-                        name=name,
-                        screen=screen,
-                        duration=duration,
-                        dir_left_button_opacity=100,
-                        dir_left_button_disabled=False,
-                        previous_screen_name=self.screens[idx - 1],
-                        next_screen_name=self.screens[idx + 1],
-                    )
-                )
+    def timer_state(self):
+        """
+        Describes the timer the control commands apply to.
+
+        Returns:
+            dict: The screen name, displayed name, running state, remaining time and
+                duration in seconds of the timer, and the screen name of the running
+                timer if any.
+        """
+        screen = self.control_target()
+        return dict(
+            screen=screen.name,
+            title=screen.label_name.text,
+            running=screen.running,
+            remaining=screen.timer.remaining(),
+            duration=screen.duration,
+            current_timer=self.cycle.current_name,
+        )
+
+    def publish_event(self, kind, segment, title, planned, actual):
+        """
+        Publishes a timer event on the event bus, stamped with the current time. Only
+        enqueues it, the subscribers run off the Kivy thread.
+
+        Args:
+            kind (str): The kind of event, one of `don_tomate.events.EVENT_KINDS`.
+            segment (str): The screen name of the timer (e.g., "main_2").
+            title (str): The displayed name of the timer (e.g., "Pomodoro 2").
+            planned (float): The planned duration of the timer in seconds.
+            actual (float): The time in seconds the timer ran for so far.
+        """
+        self.events.publish(events.TimerEvent(kind, segment, title, planned, actual, time.time()))
+
+    def journal_event(self, event):
+        """
+        Records a timer event in the session journal, as a subscriber of the event bus.
+
+        Args:
+            event (TimerEvent): The event.
+        """
+        self.journal.record(
+            events.JOURNAL_EVENTS[event.kind],
+            event.segment,
+            event.title,
+            event.planned,
+            event.actual,
+            event.timestamp,
+        )
+
+    def state_changed(self):
+        """
+        Tells the state listeners about a change once the current frame is done, so the
+        changes of one action are published once.
+        """
+        self._state_trigger()
+
+    def publish_state(self, *args):
+        """
+        Calls the state listeners with the state of the timer.
+        """
+        if self.state_listeners:
+            state = self.timer_state()
+            for listener in self.state_listeners:
+                listener(state)
+
+    def save_settings(self):
+        """
+        Saves the schedule and window settings, in the background.
+        """
+        self.settings.update(
+            n_pomodoros=self.n_pomodoros,
+            durations=dict(zip(self.schedule.names, self.schedule.durations)),
+            always_on_top=self.always_on_top,
+            translucent=self.translucent,
+        )
+
+    def make_screen_mapping(self):
+        """
+        Plans the schedule for the number of Pomodoro cycles and lists the screen names
+        used to manage transitions between the screens of the app. A new schedule takes
+        the saved durations over the default ones, a resized one keeps the durations of
+        the segments it still has.
+        """
+        if self.schedule is None:
+            self.schedule = schedule.Schedule.plan(self.n_pomodoros, self.kind_durations)
+            for name, duration in self.saved_durations().items():
+                self.schedule.set_duration(self.schedule.index(name), duration)
+        else:
+            self.schedule = self.schedule.resized(self.n_pomodoros, self.kind_durations)
+        self.screens = list(self.schedule.names)
+        if self.cycle is None:
+            self.cycle = CycleState(self.screens)
+        else:
+            self.cycle.resize(self.screens)
+
+    def saved_durations(self):
+        """
+        Returns the saved durations of the timers of a new schedule, none if the durations
+        of the kinds of segments were set before the app was built.
+
+        Returns:
+            dict: The saved duration in seconds of each timer (e.g., {"main": 1800}).
+        """
+        saved = self.settings.get("durations")
+        if not isinstance(saved, dict) or "kind_durations" in vars(self):
+            return {}
+        return {
+            name: duration
+            for name, duration in saved.items()
+            if name in self.schedule.positions
+            and type(duration) is int
+            and 0 < duration <= schedule.MAX_DURATION
+        }
+
+    def make_screen_specs(self):
+        """
+        Creates the constructor arguments of every Pomodoro, break and long break screen
+        from the schedule. Screens are only built from these specs when navigated to.
+        """
+        screen_specs = {}
+        for idx, name in enumerate(self.schedule.names):
+            screen_specs[name] = dict(
+                screen=self.schedule.titles[idx],
+                duration=self.schedule.durations[idx],
+                dir_left_button_opacity=0 if idx == 0 else 100,
+                dir_left_button_disabled=idx == 0,
+                previous_screen_name=self.screens[idx - 1],
+                next_screen_name=self.screens[(idx + 1) % len(self.screens)],
+                tone=self.schedule.tone(idx),
+            )
+        self.screen_specs = screen_specs
+
+    def build_screens(self, sm):
+        """
+        Prepares the Pomodoro, break, and long break screens and adds the first one to the
+        screen manager. The others are created lazily by `ensure_screen`.
 
-            idx += 1
+        Args:
+            sm (ScreenManager): The screen manager to which the screens will be added.
 
+        Returns:
+            ScreenManager: The updated screen manager with the first screen added.
+        """
+        self.make_screen_specs()
+        self.ensure_screen("main", sm)
         return sm
 
+    def ensure_screen(self, name, sm=None):
+        """
+        Returns the screen with the given name, creating it from its spec if needed.
+
+        Args:
+            name (str): The name of the screen (e.g., "break_1").
+            sm (ScreenManager): The screen manager holding the screens, the app root if None.
+
+        Returns:
+            Screen: The screen with the given name.
+        """
+        sm = sm or self.root
+        if sm.has_screen(name):
+            return sm.get_screen(name)
+        screen = MainScreen(name=name, **self.screen_specs[name])
+        sm.add_widget(screen)
+        return screen
+
+    def show_screen(self, name, direction="left", sm=None):
+        """
+        Transitions to the given screen, creating it if needed, and drops the screens that
+        are far from it.
+
+        Args:
+            name (str): The name of the screen to show.
+            direction (str): The direction of the slide transition.
+            sm (ScreenManager): The screen manager holding the screens, the app root if None.
+        """
+        sm = sm or self.root
+        self.ensure_screen(name, sm)
+        sm.transition = SlideTransition(direction=direction)
+        sm.current = name
+        self.prune_screens(sm)
+        self.state_changed()
+
+    def prune_screens(self, sm=None):
+        """
+        Removes the timer screens further than `screen_cache_radius` from the current one.
+        Screens holding a running, paused or finished timer are kept.
+
+        Args:
+            sm (ScreenManager): The screen manager holding the screens, the app root if None.
+        """
+        sm = sm or self.root
+        if sm.current not in self.screen_specs:
+            return
+        n_screens = len(self.screens)
+        current_pos = self.screens.index(sm.current)
+        for screen in list(sm.screens):
+            if screen.name not in self.screen_specs or screen.name == self.cycle.current_name:
+                continue
+            distance = abs(self.screens.index(screen.name) - current_pos)
+            distance = min(distance, n_screens - distance)
+            if distance > self.screen_cache_radius and screen.is_pristine():
+                sm.remove_widget(screen)
+
     def rebuild_screens(self, n_pomodoros):
         """
         Rebuild the screens in the application based on the updated number of Pomodoros.
+        The old and new schedules are diffed so only the screens of the segments that
+        were removed are dropped, while the others, including a running timer, are kept
+        and relinked in place. The new schedule starts a new cycle, only a running timer
+        carries over.
 
         Args:
             n_pomodoros (int): The number of Pomodoro cycles to set up.
         """
+        old_specs = self.screen_specs
+        old_current = self.cycle.current_name
+
         self.n_pomodoros = n_pomodoros
-        self.make_screen_mapping()  # Recreate the screen mappings based on the new number of Pomodoros
-        self.screens = list(self.screen_map.values())
+        self.make_screen_mapping()  # Resize the schedule to the new number of Pomodoros
+        self.make_screen_specs()
 
         sm = self.root
-        sm.clear_widgets()  # Remove all previous screens
-
-        sm = self.build_screens(sm)  # Rebuild the screens
-
-        sm.add_widget(
-            SettingsScreen(
-                name="settings",
-                time_options=self.time_options,
-                selected_times=self.selected_times,
-                n_pomodoros=n_pomodoros,
-            )
-        )  # Add the settings screen back
+        for screen in list(sm.screens):
+            if screen.name not in old_specs:
+                continue
+            if screen.name in self.screen_specs:
+                spec = self.screen_specs[screen.name]
+                screen.relink(spec["previous_screen_name"], spec["next_screen_name"])
+            else:
+                if screen.name == old_current:
+                    screen.reset_timer(None)
+                sm.remove_widget(screen)
+        self.cycle.restart()
+        # The finished timers go back to their full duration, with their notification
+        for screen in sm.screens:
+            if isinstance(screen, MainScreen) and (screen.sound or screen.mute):
+                screen.soft_reset(None)
+        if sm.has_screen("settings"):
+            sm.get_screen("settings").update_schedule(self.schedule, n_pomodoros)
+        self.ensure_screen("main", sm)
+        if not sm.has_screen(getattr(self, "prev_screen", "main")):
+            self.prev_screen = "main"
         sm.current = "main"  # Return to the main screen after rebuilding
 
 
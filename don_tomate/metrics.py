@@ -0,0 +1,274 @@
+from array import array
+import json
+
+# Sub-buckets per power of two of the histograms, about 3% of precision
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Percentiles of the summaries
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class RingBuffer:
+    """
+    Fixed-size buffer of the latest samples, overwriting the oldest ones once full.
+
+    Attributes:
+        capacity (int): The number of samples kept.
+        count (int): The number of samples ever appended.
+    """
+
+    def __init__(self, capacity):
+        """
+        Gets the RingBuffer started, empty, with all its memory allocated.
+
+        Args:
+            capacity (int): The number of samples kept.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self._samples = array("d", bytes(8 * capacity))
+
+    def append(self, value):
+        """
+        Args:
+            value (float): The sample to add.
+        """
+        self._samples[self.count % self.capacity] = value
+        self.count += 1
+
+    def values(self):
+        """
+        Returns:
+            list: The kept samples, oldest first.
+        """
+        if self.count <= self.capacity:
+            return self._samples[: self.count].tolist()
+        start = self.count % self.capacity
+        return (self._samples[start:] + self._samples[:start]).tolist()
+
+
+class Histogram:
+    """
+    Log-linear histogram of durations in the style of HdrHistogram: each power of two of
+    microseconds is split in SUB_BUCKETS buckets, so recording is O(1), the memory is
+    bounded, and every percentile is within a few percent whatever the range.
+
+    Attributes:
+        count (int): The number of recorded values.
+        total (float): The sum of the recorded values in seconds.
+        min (float): The smallest recorded value in seconds.
+        max (float): The largest recorded value in seconds.
+    """
+
+    def __init__(self):
+        """
+        Gets the Histogram started, empty.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._counts = []
+
+    def record(self, seconds):
+        """
+        Args:
+            seconds (float): The value to record, negative values count as zero.
+        """
+        seconds = max(0.0, seconds)
+        index = bucket_index(int(seconds * 1e6))
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+        self._counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, percent):
+        """
+        Args:
+            percent (float): The share of values below the percentile, in percent.
+
+        Returns:
+            float: The upper bound of the bucket holding the percentile in seconds, None if
+                nothing was recorded.
+        """
+        if not self.count:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank and count:
+                return min(bucket_upper_bound(index) / 1e6, self.max)
+        return self.max
+
+    def summary(self):
+        """
+        Returns:
+            dict: The count, mean, extremes and percentiles in milliseconds.
+        """
+        summary = dict(count=self.count)
+        if self.count:
+            summary.update(
+                mean_ms=self.total / self.count * 1e3,
+                min_ms=self.min * 1e3,
+                max_ms=self.max * 1e3,
+            )
+            for percent in PERCENTILES:
+                summary[f"p{percent:g}_ms"] = self.percentile(percent) * 1e3
+        return summary
+
+
+def bucket_index(micros):
+    """
+    Args:
+        micros (int): A duration in microseconds.
+
+    Returns:
+        int: The index of the histogram bucket holding the duration.
+    """
+    if micros < SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (micros >> shift) - SUB_BUCKETS
+
+
+def bucket_upper_bound(index):
+    """
+    Args:
+        index (int): The index of a histogram bucket.
+
+    Returns:
+        int: The largest duration in microseconds held by the bucket.
+    """
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    return ((index % SUB_BUCKETS + SUB_BUCKETS + 1) << shift) - 1
+
+
+class LatencyRecorder:
+    """
+    Keeps the latest samples of a duration in a ring buffer, and all of them in a
+    histogram.
+
+    Attributes:
+        samples (RingBuffer): The latest samples in seconds.
+        histogram (Histogram): The distribution of every sample.
+    """
+
+    def __init__(self, capacity=1024):
+        """
+        Gets the LatencyRecorder started, empty.
+
+        Args:
+            capacity (int): The number of latest samples kept.
+        """
+        self.samples = RingBuffer(capacity)
+        self.histogram = Histogram()
+
+    def record(self, seconds):
+        """
+        Args:
+            seconds (float): The duration to record.
+        """
+        self.samples.append(seconds)
+        self.histogram.record(seconds)
+
+
+class Instrumentation:
+    """
+    Opt-in measures of the countdown: how late each tick wakes up compared to when it was
+    scheduled, how long `MainScreen.update_time` takes, how long frames take to render
+    and the time between them.
+
+    Attributes:
+        tick_jitter (LatencyRecorder): The delay between the scheduled and actual tick.
+        update_time (LatencyRecorder): The time spent updating the countdown on a tick.
+        render_time (LatencyRecorder): The time spent drawing a frame.
+        frame_time (LatencyRecorder): The time between two frames.
+    """
+
+    def __init__(self, capacity=1024):
+        """
+        Gets the Instrumentation started, with nothing recorded.
+
+        Args:
+            capacity (int): The number of latest samples kept of each measure.
+        """
+        self.tick_jitter = LatencyRecorder(capacity)
+        self.update_time = LatencyRecorder(capacity)
+        self.render_time = LatencyRecorder(capacity)
+        self.frame_time = LatencyRecorder(capacity)
+        self._draw_start = None
+        self._last_frame = None
+
+    def on_draw(self, now):
+        """
+        Notes the start of a frame.
+
+        Args:
+            now (float): The monotonic time in seconds.
+        """
+        self._draw_start = now
+
+    def on_flip(self, now):
+        """
+        Records the time spent drawing the frame that just ended, and the time since the
+        previous one.
+
+        Args:
+            now (float): The monotonic time in seconds.
+        """
+        if self._draw_start is not None:
+            self.render_time.record(now - self._draw_start)
+            self._draw_start = None
+        if self._last_frame is not None:
+            self.frame_time.record(now - self._last_frame)
+        self._last_frame = now
+
+    def summary(self):
+        """
+        Returns:
+            dict: The histogram summary of each measure.
+        """
+        return dict(
+            tick_jitter=self.tick_jitter.histogram.summary(),
+            update_time=self.update_time.histogram.summary(),
+            render_time=self.render_time.histogram.summary(),
+            frame_time=self.frame_time.histogram.summary(),
+        )
+
+    def report(self):
+        """
+        Returns:
+            str: The p50, p99 and max of each measure, one per line, for the overlay.
+        """
+        lines = []
+        for name, summary in self.summary().items():
+            if summary["count"]:
+                lines.append(
+                    f"{name}: p50 {summary['p50_ms']:.2f} p99 {summary['p99_ms']:.2f}"
+                    f" max {summary['max_ms']:.2f} ms"
+                )
+            else:
+                lines.append(f"{name}: -")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """
+        Writes the summary and the latest samples of each measure to a JSON file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        data = self.summary()
+        for name in data:
+            data[name]["latest_ms"] = [
+                sample * 1e3 for sample in getattr(self, name).samples.values()
+            ]
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
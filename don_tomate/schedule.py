@@ -0,0 +1,245 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+# Kinds of segments, also the position of their tone in TONE_NAMES
+POMODORO = 0
+SHORT_BREAK = 1
+LONG_BREAK = 2
+
+# The tones played at the end of the timers, one per kind of timer
+TONE_NAMES = ("pomodoro", "short_break", "long_break")
+
+# The default duration in seconds of each kind of segment
+DEFAULT_DURATIONS = (25 * 60, 5 * 60, 30 * 60)
+
+# The longest duration of a segment in seconds
+MAX_DURATION = 24 * 60 * 60
+
+# The durations in seconds offered in the settings for each kind of segment
+DURATION_OPTIONS = (
+    tuple(minutes * 60 for minutes in (5, 10, 15, 20, 25, 30)),
+    tuple(minutes * 60 for minutes in (5, 10, 15, 20, 25, 30)),
+    tuple(minutes * 60 for minutes in (5, 10, 15, 20, 25, 30)),
+)
+
+# The numbers of Pomodoro cycles offered in the settings, any other may be planned
+CYCLE_OPTIONS = (1, 2, 3, 4, 5, 6, 8, 10, 12)
+
+
+class Schedule:
+    """
+    The segments of a Pomodoro cycle, in order. Kept free of Kivy so the schedule can be
+    run without a window.
+
+    The kinds and the durations in seconds of the segments are kept in typed arrays,
+    along with the prefix sums of the durations, so the segment running at any elapsed
+    time of the cycle is found with a bisect. The screen names and the displayed names of
+    the segments follow from their kinds and are computed once.
+
+    Attributes:
+        kinds (array): The kind of each segment, POMODORO, SHORT_BREAK or LONG_BREAK.
+        durations (array): The duration of each segment in seconds.
+        ends (array): The elapsed time of the cycle in seconds at the end of each segment.
+        names (tuple): The screen name of each segment (e.g., "break_1").
+        titles (tuple): The displayed name of each segment (e.g., "Short Break 1").
+        positions (dict): The position of each segment, by screen name.
+    """
+
+    __slots__ = ("kinds", "durations", "ends", "names", "titles", "positions")
+
+    def __init__(self, kinds, durations):
+        """
+        Gets the Schedule started.
+
+        Args:
+            kinds (list): The kind of each segment, in order.
+            durations (list): The duration of each segment in seconds.
+
+        Raises:
+            ValueError: If the schedule is empty, or a duration is not between 1 second
+                and MAX_DURATION.
+        """
+        if not kinds or len(kinds) != len(durations):
+            raise ValueError("A schedule needs a duration for each of its segments")
+        if min(durations) <= 0 or max(durations) > MAX_DURATION:
+            raise ValueError(f"The durations of the segments must be within 1 to {MAX_DURATION} s")
+        self.kinds = array("B", kinds)
+        self.durations = array("L", durations)
+        self.ends = array("Q", accumulate(self.durations))
+
+        names, titles, counts = [], [], [0, 0, 0]
+        for kind in self.kinds:
+            counts[kind] += 1
+            count = counts[kind]
+            if kind == POMODORO:
+                names.append("main" if count == 1 else f"main_{count}")
+                titles.append(f"Pomodoro {count}")
+            elif kind == SHORT_BREAK:
+                names.append(f"break_{count}")
+                titles.append(f"Short Break {count}")
+            else:
+                names.append("long_break" if count == 1 else f"long_break_{count}")
+                titles.append("Long Break" if count == 1 else f"Long Break {count}")
+        self.names = tuple(names)
+        self.titles = tuple(titles)
+        self.positions = {name: idx for idx, name in enumerate(self.names)}
+
+    @classmethod
+    def plan(cls, n_pomodoros=4, durations=DEFAULT_DURATIONS):
+        """
+        Plans the usual cycle: the Pomodoros separated by short breaks, then a long break.
+
+        Args:
+            n_pomodoros (int): The number of Pomodoro cycles.
+            durations (tuple): The duration in seconds of each kind of segment, by kind.
+
+        Returns:
+            Schedule: The schedule of the cycle.
+
+        Raises:
+            ValueError: If there is not at least one Pomodoro.
+        """
+        if n_pomodoros < 1:
+            raise ValueError("A schedule needs at least one Pomodoro")
+        kinds = [POMODORO] + [SHORT_BREAK, POMODORO] * (n_pomodoros - 1) + [LONG_BREAK]
+        return cls(kinds, [durations[kind] for kind in kinds])
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @property
+    def total(self):
+        """
+        int: The duration of the whole cycle in seconds.
+        """
+        return self.ends[-1]
+
+    @property
+    def n_pomodoros(self):
+        """
+        int: The number of Pomodoros of the cycle.
+        """
+        return self.kinds.count(POMODORO)
+
+    def index(self, name):
+        """
+        Returns the position of a segment.
+
+        Args:
+            name (str): The screen name of the segment (e.g., "break_1").
+
+        Returns:
+            int: The position of the segment in the cycle.
+        """
+        return self.positions[name]
+
+    def start(self, idx):
+        """
+        Returns the elapsed time of the cycle at the start of a segment.
+
+        Args:
+            idx (int): The position of the segment.
+
+        Returns:
+            int: The elapsed time in seconds.
+        """
+        return self.ends[idx] - self.durations[idx]
+
+    def seek(self, elapsed):
+        """
+        Finds the segment running after some time, the cycle repeating once it ends.
+
+        Args:
+            elapsed (float): The time in seconds since the start of the cycle.
+
+        Returns:
+            tuple: The position of the segment and the time in seconds since its start.
+        """
+        elapsed %= self.ends[-1]
+        idx = bisect_right(self.ends, elapsed)
+        return idx, elapsed - self.start(idx)
+
+    def set_duration(self, idx, duration):
+        """
+        Changes the duration of a segment, and the prefix sums that follow it.
+
+        Args:
+            idx (int): The position of the segment.
+            duration (int): The new duration in seconds.
+
+        Raises:
+            ValueError: If the duration is not between 1 second and MAX_DURATION.
+        """
+        if not 0 < duration <= MAX_DURATION:
+            raise ValueError(f"The durations of the segments must be within 1 to {MAX_DURATION} s")
+        delta = duration - self.durations[idx]
+        self.durations[idx] = duration
+        for later in range(idx, len(self.ends)):
+            self.ends[later] += delta
+
+    def tone(self, idx):
+        """
+        Returns the tone played at the end of a segment.
+
+        Args:
+            idx (int): The position of the segment.
+
+        Returns:
+            str: "pomodoro", "short_break" or "long_break".
+        """
+        return TONE_NAMES[self.kinds[idx]]
+
+    def duration_options(self, idx):
+        """
+        Returns the durations offered in the settings for a segment, its own included.
+
+        Args:
+            idx (int): The position of the segment.
+
+        Returns:
+            tuple: The durations in seconds, in increasing order.
+        """
+        return tuple(sorted({*DURATION_OPTIONS[self.kinds[idx]], self.durations[idx]}))
+
+    def resized(self, n_pomodoros, durations=DEFAULT_DURATIONS):
+        """
+        Plans the usual cycle with another number of Pomodoros, the segments that are in
+        both cycles keeping their durations.
+
+        Args:
+            n_pomodoros (int): The number of Pomodoro cycles.
+            durations (tuple): The duration in seconds of each kind of the new segments.
+
+        Returns:
+            Schedule: The schedule of the new cycle.
+        """
+        resized = Schedule.plan(n_pomodoros, durations)
+        for idx, name in enumerate(resized.names):
+            if name in self.positions:
+                resized.set_duration(idx, self.durations[self.positions[name]])
+        return resized
+
+    def segments(self):
+        """
+        Lists the segments in order.
+
+        Returns:
+            list: A (displayed name, screen name, duration in seconds) tuple for each
+                segment.
+        """
+        return list(zip(self.titles, self.names, self.durations))
+
+
+def make_segments(n_pomodoros, durations=DEFAULT_DURATIONS):
+    """
+    Lists the timers of the usual cycle in order.
+
+    Args:
+        n_pomodoros (int): The number of Pomodoro cycles.
+        durations (tuple): The duration in seconds of each kind of segment, by kind.
+
+    Returns:
+        list: A (displayed name, screen name, duration in seconds) tuple for each timer.
+    """
+    return Schedule.plan(n_pomodoros, durations).segments()
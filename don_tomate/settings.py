@@ -0,0 +1,153 @@
+import json
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+
+# Queue marker asking the writer thread to write right away
+_FLUSH = "flush"
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsStore:
+    """
+    The user settings, persisted to a small JSON file.
+
+    The file is read once when the store is created, so the settings are there before the
+    screens are built. `update` only changes the values in memory and hands a snapshot to
+    a background thread, which waits for the settings to stay unchanged for `delay`
+    seconds before writing the last snapshot, so clicking through the settings makes a
+    single write. The file is written aside and renamed, so it is never left half written.
+
+    Attributes:
+        path (Path): The path of the JSON file.
+        delay (float): The time in seconds the settings must stay unchanged to be written.
+        values (dict): The current settings.
+    """
+
+    def __init__(self, path, delay=0.5):
+        """
+        Gets the SettingsStore started with the saved settings. The writer thread is only
+        created when the settings first change.
+
+        Args:
+            path (str): The path of the JSON file.
+            delay (float): The time in seconds the settings must stay unchanged to be written.
+        """
+        self.path = Path(path)
+        self.delay = delay
+        self.values = self.load()
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Reads the saved settings.
+
+        Returns:
+            dict: The saved settings, empty if the file is missing or unreadable.
+        """
+        try:
+            values = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return values if isinstance(values, dict) else {}
+
+    def get(self, key, default=None):
+        """
+        Returns a setting.
+
+        Args:
+            key (str): The name of the setting (e.g., "n_pomodoros").
+            default: The value returned if the setting was never saved.
+
+        Returns:
+            The value of the setting.
+        """
+        return self.values.get(key, default)
+
+    def update(self, **values):
+        """
+        Changes settings and schedules their write, without blocking.
+
+        Args:
+            **values: The new value of each changed setting.
+        """
+        self.values.update(values)
+        # Serialized right away, the writer thread never sees the values change under it
+        snapshot = json.dumps(self.values, indent=2, sort_keys=True)
+        self._ensure_writer()
+        self._queue.put(snapshot)
+
+    def flush(self):
+        """
+        Blocks until the last settings are written.
+        """
+        if self._thread is not None:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self):
+        """
+        Writes the pending settings and stops the writer thread.
+        """
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _ensure_writer(self):
+        """
+        Starts the writer thread if it is not running.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._write_loop, name="don_tomate-settings", daemon=True
+                )
+                self._thread.start()
+
+    def _write_loop(self):
+        """
+        Writes the last snapshot once no other came for `delay` seconds, or right away
+        on `flush` and `close`, until the store is closed. A write that fails is logged
+        and the thread keeps going.
+        """
+        running = True
+        while running:
+            items = [self._queue.get()]
+            try:
+                while items[-1] not in (None, _FLUSH):
+                    try:
+                        items.append(self._queue.get(timeout=self.delay))
+                    except queue.Empty:
+                        break
+                running = items[-1] is not None
+                snapshots = [item for item in items if item not in (None, _FLUSH)]
+                if snapshots:
+                    self._write(snapshots[-1])
+            except OSError:
+                logger.exception("Cannot write the settings to %s", self.path)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+    def _write(self, snapshot):
+        """
+        Replaces the file with the given settings.
+
+        Args:
+            snapshot (str): The settings, serialized to JSON.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_suffix(".part")
+        with open(partial, "w") as settings_file:
+            settings_file.write(snapshot)
+            settings_file.flush()
+            os.fsync(settings_file.fileno())
+        os.replace(partial, self.path)
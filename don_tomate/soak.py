@@ -0,0 +1,171 @@
+from collections import Counter
+import gc
+import tracemalloc
+from kivy.graphics import InstructionGroup
+from kivy.uix.widget import Widget
+from don_tomate.main import MainScreen
+from don_tomate.timewarp import TimeWarp
+
+# Numbers of Pomodoro cycles the soak goes through, in turn
+SOAK_CYCLES = (4, 1, 6, 2, 5, 3)
+
+
+def live_widgets():
+    """
+    Counts the widgets alive in the interpreter, after a full garbage collection.
+
+    Returns:
+        Counter: The number of live widgets of each class name.
+    """
+    gc.collect()
+    # The type, not isinstance, which goes through the weak proxies Kivy leaves around
+    return Counter(type(obj).__name__ for obj in gc.get_objects() if issubclass(type(obj), Widget))
+
+
+def count_instructions(group):
+    """
+    Counts the canvas instructions of a group, including the groups nested in it such as
+    the canvases of the child widgets.
+
+    Args:
+        group (InstructionGroup): The group, e.g. the canvas of a widget.
+
+    Returns:
+        int: The number of instructions.
+    """
+    return sum(
+        1 + count_instructions(child) if isinstance(child, InstructionGroup) else 1
+        for child in group.children
+    )
+
+
+def screen_footprint(app, name="main"):
+    """
+    Measures what one timer screen costs, building it twice from its spec so the shared
+    caches (glyphs, atlas) filled by the first one are not counted.
+
+    Args:
+        app (DonTomateApp): The built app.
+        name (str): The screen name of the timer to measure.
+
+    Returns:
+        dict: The memory allocated in bytes, the number of widgets and the number of
+            canvas instructions of the screen.
+    """
+    started = tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start()
+    MainScreen(name=name, **app.screen_specs[name])
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    screen = MainScreen(name=name, **app.screen_specs[name])
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    if not started:
+        tracemalloc.stop()
+    return dict(
+        bytes=allocated,
+        widgets=len(list(screen.walk())),
+        canvas_instructions=count_instructions(screen.canvas),
+    )
+
+
+class Soak:
+    """
+    Soak test of the app: rebuilds the screens with another number of cycles, runs a whole
+    schedule through the settings and timer screens on a virtual clock, and measures the
+    memory and live widgets after each iteration, so anything surviving the rebuilds and
+    cycles shows up as growth.
+
+    Only the virtual clock moves, so the callbacks widgets leave on the Kivy clock (label
+    textures, layouts) stay pending and count in the memory growth, not in the widgets.
+
+    Attributes:
+        warp (TimeWarp): The app running on a virtual clock.
+        reports (list): A dict with the iteration, traced memory in bytes and live widgets
+            for each iteration.
+    """
+
+    def __init__(self, data_dir, cycles=SOAK_CYCLES):
+        """
+        Gets the Soak started on a freshly built app.
+
+        Args:
+            data_dir (str): The directory of the session journal.
+            cycles (tuple): The numbers of Pomodoro cycles to go through, in turn.
+        """
+        self.warp = TimeWarp(data_dir)
+        self.cycles = cycles
+        self.reports = []
+        self._snapshots = None
+
+    def iterate(self, iteration):
+        """
+        Rebuilds the screens with the next number of cycles and runs the whole schedule.
+
+        Args:
+            iteration (int): The number of the iteration.
+        """
+        app = self.warp.app
+        app.ensure_settings()
+        app.rebuild_screens(self.cycles[iteration % len(self.cycles)])
+        self.warp.finish_transition()
+        self.warp.run_cycles(1)
+
+    def run(self, iterations, warmup=len(SOAK_CYCLES)):
+        """
+        Runs the soak, tracing the memory allocations.
+
+        Args:
+            iterations (int): The number of iterations measured.
+            warmup (int): The number of iterations run first, to fill the caches.
+
+        Returns:
+            dict: The growth per measured iteration of the traced memory in bytes and of
+                the live widgets.
+        """
+        for iteration in range(warmup):
+            self.iterate(iteration)
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.take_snapshot()
+            for iteration in range(warmup, warmup + iterations):
+                self.iterate(iteration)
+                widgets = live_widgets()
+                self.reports.append(
+                    dict(
+                        iteration=iteration,
+                        memory=tracemalloc.get_traced_memory()[0],
+                        widgets=sum(widgets.values()),
+                        widget_classes=widgets,
+                    )
+                )
+            self._snapshots = (baseline, tracemalloc.take_snapshot())
+        finally:
+            tracemalloc.stop()
+        # Compare iterations a whole round of cycle counts apart, which have the same screens
+        span = (len(self.reports) - 1) // len(self.cycles) * len(self.cycles) or 1
+        first, last = self.reports[0], self.reports[min(span, len(self.reports) - 1)]
+        return dict(
+            memory=(last["memory"] - first["memory"]) / span,
+            widgets=(last["widgets"] - first["widgets"]) / span,
+        )
+
+    def top_growth(self, limit=10):
+        """
+        Lists the source lines whose allocations grew the most during the measured
+        iterations.
+
+        Args:
+            limit (int): The number of lines listed.
+
+        Returns:
+            list: The tracemalloc statistic of each line, largest growth first.
+        """
+        baseline, final = self._snapshots
+        return final.compare_to(baseline, "lineno")[:limit]
+
+    def close(self):
+        """
+        Commits the session journal of the app.
+        """
+        self.warp.close()
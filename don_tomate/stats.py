@@ -0,0 +1,309 @@
+import calendar
+import time
+import numpy as np
+from don_tomate import journal
+
+# Segment kinds
+POMODORO = 0
+SHORT_BREAK = 1
+LONG_BREAK = 2
+KIND_NAMES = ["Pomodoro", "Short Break", "Long Break"]
+
+# Event codes of the columns
+EVENT_CODES = {journal.START: 0, journal.PAUSE: 1, journal.RESET: 2, journal.COMPLETE: 3}
+
+# The columns of every event, in the order of COLUMN_TYPES, mapped to numbers by SQLite so
+# the whole history converts to an array at once: the event and kind codes, the local day
+# number (days since 1970-01-01) from the day journaled, and the local hour
+EVENT_CASES = " ".join(f"WHEN '{event}' THEN {code}" for event, code in EVENT_CODES.items())
+LOAD_QUERY = f"""
+SELECT
+    timestamp,
+    CAST(julianday(day) - 2440587.5 AS INTEGER),
+    CASE event {EVENT_CASES} END,
+    CASE WHEN segment = 'long_break' THEN {LONG_BREAK}
+         WHEN segment LIKE 'break%' THEN {SHORT_BREAK} ELSE {POMODORO} END,
+    planned,
+    actual,
+    CAST(strftime('%H', timestamp, 'unixepoch', 'localtime') AS INTEGER)
+FROM sessions ORDER BY day, timestamp
+"""
+
+COLUMN_TYPES = dict(
+    timestamp=np.float64,
+    day=np.int64,
+    event=np.int8,
+    kind=np.int8,
+    planned=np.float64,
+    actual=np.float64,
+    hour=np.int8,
+)
+
+
+def segment_kind(segment):
+    """
+    Returns the kind of a timer from the name of its screen.
+
+    Args:
+        segment (str): The name of the screen of the timer (e.g., "break_2").
+
+    Returns:
+        int: POMODORO, SHORT_BREAK or LONG_BREAK.
+    """
+    if segment == "long_break":
+        return LONG_BREAK
+    if segment.startswith("break"):
+        return SHORT_BREAK
+    return POMODORO
+
+
+def local_day_and_hour(timestamp):
+    """
+    Returns the local day number (days since 1970-01-01) and hour of a Unix time.
+
+    Args:
+        timestamp (float): The Unix time.
+
+    Returns:
+        tuple: The local day number and the local hour.
+    """
+    local = time.localtime(timestamp)
+    return (timestamp + local.tm_gmtoff) // 86400, local.tm_hour
+
+
+class SessionStatistics:
+    """
+    Productivity statistics computed with NumPy over the columns of the session journal.
+
+    The history is loaded once into columnar arrays, then every new event is appended
+    in amortized O(1), so the statistics never need to read the journal again. Each
+    statistic is a handful of vectorized operations over the columns.
+
+    Attributes:
+        journal (SessionJournal): The journal the history is loaded from.
+        size (int): The number of events in the columns.
+        completed (numpy.ndarray): The number of completed timers of each kind.
+        ended (numpy.ndarray): The number of completed or reset timers of each kind.
+    """
+
+    def __init__(self, journal=None, capacity=1024):
+        """
+        Gets the SessionStatistics started with empty columns.
+
+        Args:
+            journal (SessionJournal): The journal the history is loaded from, if any.
+            capacity (int): The initial capacity of the columns.
+        """
+        self.journal = journal
+        self.loaded = journal is None
+        self.size = 0
+        self.columns = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in COLUMN_TYPES.items()
+        }
+        self.completed = np.zeros(3, dtype=np.int64)
+        self.ended = np.zeros(3, dtype=np.int64)
+
+    def ensure_loaded(self):
+        """
+        Loads the whole history from the journal the first time statistics are needed,
+        with a single query converted to the columns at once.
+        """
+        if self.loaded:
+            return
+        self.loaded = True
+        self.journal.flush()
+        rows = np.array(self.journal.select(LOAD_QUERY), dtype=np.float64).reshape(-1, 7)
+        self.size = len(rows)
+        capacity = max(self.size, len(self.columns["timestamp"]))
+        for idx, (name, dtype) in enumerate(COLUMN_TYPES.items()):
+            self.columns[name] = np.resize(rows[:, idx].astype(dtype), capacity)
+
+        event, kind = self.column("event"), self.column("kind")
+        completed = event == EVENT_CODES[journal.COMPLETE]
+        ended = completed | (event == EVENT_CODES[journal.RESET])
+        self.completed = np.bincount(kind[completed], minlength=3)
+        self.ended = np.bincount(kind[ended], minlength=3)
+
+    def record(self, event, segment, planned, actual, timestamp=None):
+        """
+        Appends an event to the columns and updates the running counters. Events recorded
+        before the history is loaded are skipped, since loading reads them back.
+
+        Args:
+            event (str): The event, one of the `don_tomate.journal` events.
+            segment (str): The name of the screen of the timer (e.g., "main_2").
+            planned (float): The planned duration of the timer in seconds.
+            actual (float): The time in seconds the timer ran for.
+            timestamp (float): The Unix time of the event, now if None.
+        """
+        if not self.loaded:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+        if self.size == len(self.columns["timestamp"]):
+            for name, column in self.columns.items():
+                self.columns[name] = np.resize(column, 2 * len(column))
+
+        kind = segment_kind(segment)
+        day, hour = local_day_and_hour(timestamp)
+        row = dict(
+            timestamp=timestamp,
+            day=day,
+            event=EVENT_CODES[event],
+            kind=kind,
+            planned=planned,
+            actual=actual,
+            hour=hour,
+        )
+        for name, value in row.items():
+            self.columns[name][self.size] = value
+        self.size += 1
+
+        if event == journal.COMPLETE:
+            self.completed[kind] += 1
+        if event in (journal.COMPLETE, journal.RESET):
+            self.ended[kind] += 1
+
+    def column(self, name):
+        """
+        Returns a read-only view of a column, loading the history if needed.
+
+        Args:
+            name (str): The name of the column (e.g., "actual").
+
+        Returns:
+            numpy.ndarray: The column.
+        """
+        self.ensure_loaded()
+        view = self.columns[name][: self.size]
+        view.flags.writeable = False
+        return view
+
+    def _focus(self):
+        """
+        Returns:
+            tuple: The day number and the focus seconds of each completed or reset Pomodoro.
+        """
+        event, kind = self.column("event"), self.column("kind")
+        ended = (kind == POMODORO) & (
+            (event == EVENT_CODES[journal.COMPLETE]) | (event == EVENT_CODES[journal.RESET])
+        )
+        return self.column("day")[ended], self.column("actual")[ended]
+
+    def daily_focus(self):
+        """
+        Totals the focus time of each day with at least one Pomodoro.
+
+        Returns:
+            tuple: The days as datetime64[D] and the focus seconds of each day.
+        """
+        days, actual = self._focus()
+        unique_days, inverse = np.unique(days, return_inverse=True)
+        return unique_days.astype("datetime64[D]"), np.bincount(inverse, weights=actual)
+
+    def weekly_focus(self):
+        """
+        Totals the focus time of each week with at least one Pomodoro.
+
+        Returns:
+            tuple: The Mondays starting each week as datetime64[D] and the focus seconds
+                of each week.
+        """
+        days, actual = self._focus()
+        # 1970-01-01 was a Thursday, shift so weeks start on Mondays
+        weeks = (days + 3) // 7
+        unique_weeks, inverse = np.unique(weeks, return_inverse=True)
+        mondays = (unique_weeks * 7 - 3).astype("datetime64[D]")
+        return mondays, np.bincount(inverse, weights=actual)
+
+    def completion_rates(self):
+        """
+        Returns:
+            numpy.ndarray: The share of completed timers among the completed or reset ones,
+                for each kind (POMODORO, SHORT_BREAK, LONG_BREAK). NaN for kinds never ended.
+        """
+        self.ensure_loaded()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.completed / self.ended
+
+    def streaks(self):
+        """
+        Computes the streaks of consecutive days with at least one completed Pomodoro.
+
+        Returns:
+            tuple: The current streak (ending today or yesterday) and the longest streak,
+                in days.
+        """
+        event, kind = self.column("event"), self.column("kind")
+        completed = (event == EVENT_CODES[journal.COMPLETE]) & (kind == POMODORO)
+        days = np.unique(self.column("day")[completed])
+        if not len(days):
+            return 0, 0
+        # Each streak starts where the gap to the previous day is not one day
+        starts = np.flatnonzero(np.diff(days, prepend=days[0] - 2) != 1)
+        lengths = np.diff(np.append(starts, len(days)))
+        today, _ = local_day_and_hour(time.time())
+        current = lengths[-1] if today - days[-1] <= 1 else 0
+        return int(current), int(lengths.max())
+
+    def heatmap(self):
+        """
+        Totals the focus time by weekday and hour of the day.
+
+        Returns:
+            numpy.ndarray: A 7 x 24 array of focus seconds, Monday first.
+        """
+        event, kind = self.column("event"), self.column("kind")
+        ended = (kind == POMODORO) & (
+            (event == EVENT_CODES[journal.COMPLETE]) | (event == EVENT_CODES[journal.RESET])
+        )
+        weekdays = (self.column("day")[ended] + 3) % 7
+        hours = self.column("hour")[ended].astype(np.int64)
+        heatmap = np.bincount(
+            weekdays * 24 + hours, weights=self.column("actual")[ended], minlength=7 * 24
+        )
+        return heatmap.reshape(7, 24)
+
+    def summary(self):
+        """
+        Summarizes the focus totals, streaks and completion rates.
+
+        Returns:
+            list: The summary, one statistic per line.
+        """
+        days, daily = self.daily_focus()
+        weeks, weekly = self.weekly_focus()
+        today = np.datetime64(int(local_day_and_hour(time.time())[0]), "D")
+        this_week = today - (today.astype(np.int64) + 3) % 7
+        current_streak, longest_streak = self.streaks()
+        rates = self.completion_rates()
+        heatmap = self.heatmap()
+
+        lines = [
+            f"Today: {format_duration(daily[days == today].sum())} of focus",
+            f"This week: {format_duration(weekly[weeks == this_week].sum())} of focus",
+            f"Streak: {current_streak} days (longest {longest_streak})",
+            "Completed: "
+            + ", ".join(
+                f"{name} {'-' if np.isnan(rate) else f'{rate:.0%}'}"
+                for name, rate in zip(KIND_NAMES, rates)
+            ),
+        ]
+        if heatmap.any():
+            weekday, hour = np.unravel_index(heatmap.argmax(), heatmap.shape)
+            lines.append(f"Most focused: {calendar.day_name[weekday]}s at {hour:02}:00")
+        return lines
+
+
+def format_duration(seconds):
+    """
+    Formats a duration in seconds as hours and minutes (e.g., "2 h 05 min").
+
+    Args:
+        seconds (float): The duration in seconds.
+
+    Returns:
+        str: The formatted duration.
+    """
+    hours, minutes = divmod(int(seconds) // 60, 60)
+    return f"{hours} h {minutes:02} min" if hours else f"{minutes} min"
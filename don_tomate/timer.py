@@ -0,0 +1,134 @@
+from functools import lru_cache
+import math
+import time
+
+
+@lru_cache(maxsize=4096)
+def format_time(seconds):
+    """
+    Formats the given time in seconds to a string in the format MM:SS. The strings are
+    cached, so a running countdown formats each value once.
+
+    Args:
+        seconds (int): The time in seconds.
+
+    Returns:
+        str: The formatted time string.
+    """
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes:02}:{seconds:02}"
+
+
+class TimerEngine:
+    """
+    Headless countdown that keeps a monotonic deadline instead of decrementing a counter.
+
+    The remaining time is always derived from the deadline, so late or missed wakeups
+    (frame hitches, a busy machine, laptop sleep) never add time to the countdown.
+
+    Attributes:
+        duration (float): Full length of the countdown in seconds.
+        clock (callable): Returns the current monotonic time in seconds.
+        deadline (float): Monotonic time at which the countdown ends, None while paused.
+    """
+
+    def __init__(self, duration, clock=time.monotonic):
+        """
+        Gets the TimerEngine started, paused at its full duration.
+
+        Args:
+            duration (float): Length of the countdown in seconds.
+            clock (callable): Monotonic time source, `time.monotonic` by default.
+        """
+        self.duration = duration
+        self.clock = clock
+        self.deadline = None
+        self._remaining = float(duration)
+
+    @property
+    def running(self):
+        """
+        bool: Indicates if the countdown is currently running.
+        """
+        return self.deadline is not None
+
+    def start(self):
+        """
+        Starts (or resumes) the countdown from the remaining time.
+        """
+        if self.deadline is None:
+            self.deadline = self.clock() + self._remaining
+
+    def pause(self):
+        """
+        Pauses the countdown, freezing the remaining time.
+        """
+        if self.deadline is not None:
+            self._remaining = max(0.0, self.deadline - self.clock())
+            self.deadline = None
+
+    def reset(self, duration=None):
+        """
+        Stops the countdown and rewinds it to its full duration.
+
+        Args:
+            duration (float): New duration in seconds, keeps the current one if None.
+        """
+        if duration is not None:
+            self.duration = duration
+        self.deadline = None
+        self._remaining = float(self.duration)
+
+    def set_remaining(self, seconds):
+        """
+        Moves the countdown to the given remaining time, keeping it running if it was.
+
+        Args:
+            seconds (float): The new remaining time in seconds.
+        """
+        if self.deadline is not None:
+            self.deadline = self.clock() + seconds
+        else:
+            self._remaining = float(seconds)
+
+    def remaining(self):
+        """
+        Returns:
+            float: The exact remaining time in seconds, never below zero.
+        """
+        if self.deadline is None:
+            return self._remaining
+        return max(0.0, self.deadline - self.clock())
+
+    def remaining_seconds(self):
+        """
+        Returns the remaining time as shown to the user, rounded up to whole seconds
+        so that a fresh 25 minutes timer reads 25:00 until a full second has elapsed.
+
+        Returns:
+            int: The remaining time in whole seconds.
+        """
+        return math.ceil(self.remaining())
+
+    def expired(self):
+        """
+        Returns:
+            bool: True once the remaining time has reached zero.
+        """
+        return self.remaining() <= 0
+
+    def next_wakeup(self, visible=True):
+        """
+        Computes how long to sleep before the countdown needs attention again.
+
+        Args:
+            visible (bool): If the countdown is on screen. Visible countdowns wake at every
+                whole-second boundary, hidden ones only once at the deadline.
+
+        Returns:
+            float: The delay in seconds until the next wakeup.
+        """
+        remaining = self.remaining()
+        if not visible or remaining <= 1:
+            return remaining
+        return remaining - (math.ceil(remaining) - 1)
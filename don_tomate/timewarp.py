@@ -0,0 +1,170 @@
+from kivy.event import EventDispatcher
+from don_tomate import schedule
+from don_tomate.clock import VirtualClock
+from don_tomate.main import DonTomateApp
+from don_tomate.window import IdleMonitor
+
+
+class SimulatedSound(EventDispatcher):
+    """
+    A silent stand-in for the notification sound, which plays for a while on a
+    VirtualClock and then stops like a real sound reaching its end.
+
+    Attributes:
+        clock (VirtualClock): The clock the sound plays on.
+        length (float): The length of the sound in seconds.
+        state (str): "play" while playing, "stop" otherwise.
+    """
+
+    __events__ = ("on_stop",)
+
+    def __init__(self, clock, length=3.0, **kwargs):
+        """
+        Gets the SimulatedSound started, stopped.
+
+        Args:
+            clock (VirtualClock): The clock the sound plays on.
+            length (float): The length of the sound in seconds.
+        """
+        super(SimulatedSound, self).__init__(**kwargs)
+        self.clock = clock
+        self.length = length
+        self.state = "stop"
+        self._end = None
+
+    def play(self):
+        """
+        Starts playing, until the end of the sound or `stop`.
+        """
+        self.state = "play"
+        self._end = self.clock.schedule_once(lambda dt: self.stop(), self.length)
+
+    def stop(self):
+        """
+        Stops playing and dispatches `on_stop`.
+        """
+        if self._end is not None:
+            self._end.cancel()
+            self._end = None
+        self.state = "stop"
+        self.dispatch("on_stop")
+
+    def on_stop(self):
+        pass
+
+
+class WarpedApp(DonTomateApp):
+    """
+    The app with its user data kept in a given directory, for simulations.
+
+    Attributes:
+        data_dir (str): The directory of the session journal.
+    """
+
+    data_dir = None
+
+    @property
+    def user_data_dir(self):
+        return self.data_dir
+
+
+class TimeWarp:
+    """
+    Runs the app on a virtual clock, going through the schedule like a user who starts
+    every timer, lets its notification play to the end and moves on to the next one.
+
+    Time only moves from one pending callback to the next, so a full schedule takes as
+    long as its handful of callbacks do, and thousands of cycles run in seconds. The
+    window is treated as hidden, each countdown waking up once at its deadline.
+
+    Attributes:
+        clock (VirtualClock): The clock of the app.
+        app (DonTomateApp): The simulated app, built with its root screen manager.
+        segments (int): The number of segments run to completion.
+    """
+
+    def __init__(self, data_dir, n_pomodoros=4, sound_length=3.0, screen_cache_radius=None):
+        """
+        Gets the TimeWarp started on the first Pomodoro of a freshly built app.
+
+        Args:
+            data_dir (str): The directory of the session journal.
+            n_pomodoros (int): The number of Pomodoro cycles.
+            sound_length (float): The length of the notification sounds in seconds.
+            screen_cache_radius (int): The number of timer screens kept alive on each side
+                of the current one, the default of the app if None. Keeping them all skips
+                rebuilding the screens of every cycle.
+        """
+        self.clock = VirtualClock()
+        self.app = WarpedApp()
+        self.app.data_dir = str(data_dir)
+        self.app.clock = self.clock
+        if screen_cache_radius is not None:
+            self.app.screen_cache_radius = screen_cache_radius
+        self.app.root = self.app.build(n_pomodoros)
+        for name in ("notification",) + schedule.TONE_NAMES:
+            self.app.sounds.sounds[name] = SimulatedSound(self.clock, sound_length)
+        self.app.idle_monitor = IdleMonitor(self.app.on_window_state)
+        self.app.idle_monitor.hidden = True
+        self.segments = 0
+
+    def run_segment(self):
+        """
+        Starts the displayed timer, runs it to completion and through its notification,
+        then moves to the next screen.
+
+        Returns:
+            str: The screen name of the segment that ran.
+        """
+        screen = self.app.control_target()
+        # A timer that finished in the previous cycle takes one press to rewind
+        for presses in range(3):
+            if screen.running:
+                break
+            if presses == 2:
+                raise RuntimeError(f"{screen.name} could not be started")
+            screen.start_stop(None)
+        self.run_pending()
+        self.segments += 1
+        screen.next_screen(None)
+        self.finish_transition()
+        return screen.name
+
+    def run_cycles(self, n_cycles):
+        """
+        Runs whole schedules, from the displayed timer on.
+
+        Args:
+            n_cycles (int): The number of schedules to run.
+        """
+        for _ in range(n_cycles * len(self.app.screens)):
+            self.run_segment()
+
+    def finish_transition(self):
+        """
+        Ends the screen transition at once. Transitions are animated on the Kivy clock, which
+        does not move here, and the screen they slide out stays a child of the screen
+        manager until they end.
+        """
+        transition = self.app.root.transition
+        if transition.is_active:
+            transition.stop()
+
+    def run_pending(self):
+        """
+        Moves the virtual time forward until no callback is pending.
+        """
+        deadline = self.clock.next_deadline()
+        while deadline is not None:
+            self.clock.advance(deadline - self.clock.now)
+            deadline = self.clock.next_deadline()
+
+    def close(self):
+        """
+        Delivers the pending timer events, commits the session journal and the settings of
+        the simulated app, and closes its timer checkpoint.
+        """
+        self.app.events.close()
+        self.app.journal.close()
+        self.app.settings.close()
+        self.app.checkpoint.close()
@@ -0,0 +1,155 @@
+import hashlib
+import os
+from pathlib import Path
+import numpy as np
+
+SAMPLE_RATE = 22050
+
+# The notes of the tone played at the end of each kind of timer, as (frequency in Hz,
+# duration in seconds) pairs, a frequency of 0 being a rest
+TONES = {
+    # Falling, to step away from the work
+    "pomodoro": ((880.0, 0.16), (0.0, 0.04), (698.46, 0.16), (0.0, 0.04), (523.25, 0.4)),
+    # Rising, back to work
+    "short_break": ((523.25, 0.16), (0.0, 0.04), (783.99, 0.36)),
+    "long_break": ((523.25, 0.14), (659.25, 0.14), (783.99, 0.14), (1046.5, 0.5)),
+}
+
+# The volume at the start and at the end of each tone, so it does not startle
+VOLUME_RAMP = (0.25, 0.9)
+
+# Seconds each note fades in and out, so the notes do not click
+FADE = 0.01
+
+
+def synthesize(notes, rate=SAMPLE_RATE, ramp=VOLUME_RAMP, fade=FADE):
+    """
+    Synthesizes a tone as 16-bit mono PCM samples: each note is a sine with a short fade
+    in and out, and the volume ramps linearly over the whole tone.
+
+    Args:
+        notes (tuple): The (frequency in Hz, duration in seconds) pair of each note.
+        rate (int): The sample rate in Hz.
+        ramp (tuple): The volume, from 0 to 1, at the start and at the end of the tone.
+        fade (float): The fade in and out of each note, in seconds.
+
+    Returns:
+        numpy.ndarray: The int16 samples of the tone.
+    """
+    lengths = [int(round(duration * rate)) for _, duration in notes]
+    samples = np.zeros(sum(lengths), dtype=np.float32)
+    start = 0
+    for (frequency, _), length in zip(notes, lengths):
+        if frequency:
+            phase = np.arange(length, dtype=np.float32) * np.float32(2 * np.pi * frequency / rate)
+            note = samples[start : start + length]
+            np.sin(phase, out=note)
+            n_fade = min(int(fade * rate), length // 2)
+            if n_fade:
+                envelope = np.linspace(0, 1, n_fade, endpoint=False, dtype=np.float32)
+                note[:n_fade] *= envelope
+                note[length - n_fade :] *= envelope[::-1]
+        start += length
+    samples *= np.linspace(ramp[0], ramp[1], len(samples), dtype=np.float32)
+    # Little-endian, as in a WAV file
+    return (samples * np.iinfo(np.int16).max).astype("<i2")
+
+
+def wav_header(n_samples, rate=SAMPLE_RATE):
+    """
+    Returns the header of a 16-bit mono PCM WAV file.
+
+    Args:
+        n_samples (int): The number of samples following the header.
+        rate (int): The sample rate in Hz.
+
+    Returns:
+        bytes: The 44 bytes of the RIFF header.
+    """
+    data_size = n_samples * 2
+    return b"".join(
+        [
+            b"RIFF",
+            (36 + data_size).to_bytes(4, "little"),
+            b"WAVEfmt ",
+            (16).to_bytes(4, "little"),
+            (1).to_bytes(2, "little"),  # PCM
+            (1).to_bytes(2, "little"),  # Mono
+            rate.to_bytes(4, "little"),
+            (rate * 2).to_bytes(4, "little"),
+            (2).to_bytes(2, "little"),
+            (16).to_bytes(2, "little"),
+            b"data",
+            data_size.to_bytes(4, "little"),
+        ]
+    )
+
+
+class ToneBank:
+    """
+    The notification tones, synthesized once with NumPy on first use and kept in memory
+    as PCM buffers.
+
+    The audio providers of Kivy only load sounds from files, so each tone is also written
+    once, straight from its buffer, to a WAV file named after a digest of its notes. The
+    file is reused as long as the tone does not change.
+
+    Attributes:
+        directory (Path): The directory of the WAV files.
+        tones (dict): The notes of each tone, by tone name.
+        rate (int): The sample rate in Hz.
+        buffers (dict): The int16 samples of each synthesized tone, by tone name.
+    """
+
+    def __init__(self, directory, tones=TONES, rate=SAMPLE_RATE):
+        """
+        Gets the ToneBank started without synthesizing anything yet.
+
+        Args:
+            directory (str): The directory of the WAV files.
+            tones (dict): The notes of each tone, by tone name.
+            rate (int): The sample rate in Hz.
+        """
+        self.directory = Path(directory)
+        self.tones = tones
+        self.rate = rate
+        self.buffers = {}
+
+    def pcm(self, name):
+        """
+        Returns the samples of a tone, synthesizing them on first use.
+
+        Args:
+            name (str): The name of the tone (e.g., "long_break").
+
+        Returns:
+            numpy.ndarray: The int16 samples of the tone.
+        """
+        if name not in self.buffers:
+            self.buffers[name] = synthesize(self.tones[name], self.rate)
+        return self.buffers[name]
+
+    def path(self, name):
+        """
+        Returns the WAV file of a tone, writing it if it does not exist yet. The file is
+        written aside and renamed, so a player never reads a partial file.
+
+        Args:
+            name (str): The name of the tone (e.g., "long_break").
+
+        Returns:
+            str: The path of the WAV file.
+        """
+        spec = (self.tones[name], self.rate, VOLUME_RAMP, FADE)
+        digest = hashlib.sha1(repr(spec).encode()).hexdigest()[:12]
+        path = self.directory / f"{name}-{digest}.wav"
+        if not path.exists():
+            samples = self.pcm(name)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(".part")
+            with open(partial, "wb") as wav:
+                wav.write(wav_header(len(samples), self.rate))
+                # The buffer itself, not a bytes copy of it
+                wav.write(memoryview(samples).cast("B"))
+            os.replace(partial, path)
+        return str(path)
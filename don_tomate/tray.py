@@ -0,0 +1,240 @@
+from pathlib import Path
+import threading
+from don_tomate.schedule import DEFAULT_DURATIONS, make_segments
+from don_tomate.timer import TimerEngine, format_time
+
+base_path = Path(__file__).parent / "don_tomate" / "Resources"
+
+STATUS_MENU_ICON = str(base_path / "status_menu_icon.png")
+
+# Delay in seconds past a progress step before waking, so the new step is already reached
+STEP_MARGIN = 0.05
+
+
+class TrayTimer:
+    """
+    Runs the Pomodoro schedule without any window, for the tray-only mode.
+
+    Only the current segment has a countdown. It sleeps on a single thread timer until its
+    deadline, since the tray menu reads the remaining time when it is opened. With progress
+    steps, it also wakes once per step so the tray icon can show the progress. A finished
+    segment moves the schedule to the next one, which waits to be started, like the
+    screens of the app do.
+
+    Attributes:
+        segments (list): A (displayed name, screen name, duration) tuple for each segment.
+        index (int): The position of the current segment in the schedule.
+        timer (TimerEngine): The countdown of the current segment.
+        on_change (callable): Called with the TrayTimer when its state changes.
+        on_complete (callable): Called with the displayed name of a segment that finished.
+        steps (int): The number of progress steps of a segment, None to only wake at the
+            deadline.
+    """
+
+    def __init__(
+        self, n_pomodoros=4, on_change=None, on_complete=None, steps=None, durations=None
+    ):
+        """
+        Gets the TrayTimer started on the first Pomodoro, paused.
+
+        Args:
+            n_pomodoros (int): The number of Pomodoro cycles.
+            on_change (callable): Called with the TrayTimer when its state changes.
+            on_complete (callable): Called with the displayed name of a segment that finished.
+            steps (int): The number of progress steps of a segment, None to only wake at
+                the deadline.
+            durations (tuple): The duration in seconds of each kind of segment, by
+                `don_tomate.schedule` kind, the default ones if None.
+        """
+        self.segments = make_segments(n_pomodoros, durations or DEFAULT_DURATIONS)
+        self.index = 0
+        self.timer = TimerEngine(self.segments[0][2])
+        self.on_change = on_change
+        self.on_complete = on_complete
+        self.steps = steps
+        self._wakeup = None
+        self._lock = threading.RLock()
+
+    @property
+    def title(self):
+        """
+        str: The displayed name of the current segment (e.g., "Pomodoro 1").
+        """
+        return self.segments[self.index][0]
+
+    @property
+    def running(self):
+        """
+        bool: Indicates if the current segment is counting down.
+        """
+        return self.timer.running
+
+    def status(self):
+        """
+        Returns:
+            str: The current segment and its remaining time (e.g., "Pomodoro 1 - 24:59").
+        """
+        return f"{self.title} - {format_time(self.timer.remaining_seconds())}"
+
+    def start_stop(self):
+        """
+        Starts the current segment, or pauses it if it is running.
+        """
+        with self._lock:
+            if self.timer.running:
+                self.timer.pause()
+                self._cancel_wakeup()
+            else:
+                self.timer.start()
+                self._schedule_wakeup()
+        self._changed()
+
+    def reset(self):
+        """
+        Stops the current segment and rewinds it to its full duration.
+        """
+        with self._lock:
+            self._cancel_wakeup()
+            self.timer.reset()
+        self._changed()
+
+    def next(self):
+        """
+        Moves to the next segment of the schedule, stopped at its full duration.
+        """
+        with self._lock:
+            self._cancel_wakeup()
+            self.index = (self.index + 1) % len(self.segments)
+            self.timer.reset(self.segments[self.index][2])
+        self._changed()
+
+    def handover(self):
+        """
+        Describes the current segment, for the window to continue it.
+
+        Returns:
+            dict: The screen name of the current segment, its remaining time in seconds
+                and, if it is running, its `time.monotonic` deadline.
+        """
+        with self._lock:
+            return dict(
+                segment=self.segments[self.index][1],
+                remaining=self.timer.remaining(),
+                deadline=self.timer.deadline,
+            )
+
+    def stop(self):
+        """
+        Cancels the pending wakeup, before exiting.
+        """
+        with self._lock:
+            self._cancel_wakeup()
+
+    def check(self):
+        """
+        Finishes the current segment if its deadline passed, else sleeps until it (or
+        until the next progress step).
+        """
+        with self._lock:
+            if not self.timer.running:
+                return
+            expired = self.timer.expired()
+            if expired:
+                title = self.title
+                self._wakeup = None
+                self.index = (self.index + 1) % len(self.segments)
+                self.timer.reset(self.segments[self.index][2])
+            else:
+                self._schedule_wakeup()
+        if expired and self.on_complete is not None:
+            self.on_complete(title)
+        if expired or self.steps is not None:
+            self._changed()
+
+    def _schedule_wakeup(self):
+        """
+        Sleeps on a thread timer until the deadline of the current segment, or just past
+        its next progress step.
+        """
+        self._cancel_wakeup()
+        delay = self.timer.next_wakeup(visible=False)
+        if self.steps is not None:
+            # Progress steps fall on multiples of the step length before the deadline
+            delay = min(delay, delay % (self.timer.duration / self.steps) + STEP_MARGIN)
+        self._wakeup = threading.Timer(delay, self.check)
+        self._wakeup.daemon = True
+        self._wakeup.start()
+
+    def _cancel_wakeup(self):
+        """
+        Cancels the pending wakeup, if any.
+        """
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+    def _changed(self):
+        """
+        Tells the listener about a change of state.
+        """
+        if self.on_change is not None:
+            self.on_change(self)
+
+
+def run_tray(n_pomodoros=4, durations=None):
+    """
+    Runs the schedule from a status bar icon, with no Kivy window or GL context.
+    Blocks until the user quits or asks for the window.
+
+    Args:
+        n_pomodoros (int): The number of Pomodoro cycles.
+        durations (tuple): The duration in seconds of each kind of segment, the default
+            ones if None.
+
+    Returns:
+        dict: The `TrayTimer.handover` of the current segment if the user asked to open
+            the window, None if they quit.
+    """
+    import pystray
+    from don_tomate.tray_icons import PROGRESS_STEPS, TrayIconAnimator, progress_frame
+
+    open_window = []
+
+    def on_change(timer):
+        animator.update(timer.timer.remaining(), timer.timer.duration)
+        icon.update_menu()
+
+    def on_complete(title):
+        icon.notify(f"{title}: Time's up!", "Don Tomate")
+
+    timer = TrayTimer(
+        n_pomodoros,
+        on_change=on_change,
+        on_complete=on_complete,
+        steps=PROGRESS_STEPS,
+        durations=durations,
+    )
+
+    def open_app(icon, item):
+        open_window.append(True)
+        icon.stop()
+
+    menu = pystray.Menu(
+        pystray.MenuItem(lambda item: timer.status(), None, enabled=False),
+        pystray.MenuItem(
+            lambda item: "Pause" if timer.running else "Start",
+            lambda icon, item: timer.start_stop(),
+            default=True,
+        ),
+        pystray.MenuItem("Reset", lambda icon, item: timer.reset()),
+        pystray.MenuItem("Next", lambda icon, item: timer.next()),
+        pystray.Menu.SEPARATOR,
+        pystray.MenuItem("Open Don Tomate", open_app),
+        pystray.MenuItem("Quit", lambda icon, item: icon.stop()),
+    )
+    icon = pystray.Icon("don_tomate", progress_frame(0), "Don Tomate", menu)
+    animator = TrayIconAnimator(icon)
+    animator.update(timer.timer.remaining(), timer.timer.duration)
+    icon.run()
+    timer.stop()
+    return timer.handover() if open_window else None
@@ -0,0 +1,116 @@
+from functools import lru_cache
+from PIL import Image, ImageDraw
+from don_tomate.tray import STATUS_MENU_ICON
+
+# Number of distinct progress states drawn on the tray icon
+PROGRESS_STEPS = 32
+
+# Ring colors (track, progress) of each theme
+THEMES = {
+    "light": ((0, 0, 0, 60), (214, 40, 40, 255)),
+    "dark": ((255, 255, 255, 70), (255, 99, 71, 255)),
+}
+
+
+@lru_cache(maxsize=8)
+def base_icon(size):
+    """
+    Returns the status menu icon scaled to the given size, loaded once per size.
+
+    Args:
+        size (int): The size of the icon in pixels.
+
+    Returns:
+        PIL.Image.Image: The scaled icon.
+    """
+    return Image.open(STATUS_MENU_ICON).convert("RGBA").resize((size, size), Image.LANCZOS)
+
+
+@lru_cache(maxsize=4 * PROGRESS_STEPS)
+def progress_frame(step, theme="light", size=64, steps=PROGRESS_STEPS):
+    """
+    Renders the tray icon with a ring filled up to the given progress step. Frames are
+    kept in a bounded LRU cache, so each one is rendered once.
+
+    Args:
+        step (int): The progress step, from 0 (just started) to `steps` (finished).
+        theme (str): The name of the ring colors, one of THEMES.
+        size (int): The size of the icon in pixels.
+        steps (int): The number of progress steps.
+
+    Returns:
+        PIL.Image.Image: The rendered frame. It is shared, do not modify it.
+    """
+    track_color, progress_color = THEMES[theme]
+    frame = base_icon(size).copy()
+    draw = ImageDraw.Draw(frame)
+    width = max(2, size // 10)
+    box = (width // 2, width // 2, size - 1 - width // 2, size - 1 - width // 2)
+    draw.ellipse(box, outline=track_color, width=width)
+    if step > 0:
+        draw.arc(box, -90, -90 + 360 * step / steps, fill=progress_color, width=width)
+    return frame
+
+
+def progress_step(remaining, duration, steps=PROGRESS_STEPS):
+    """
+    Returns the progress step shown for a countdown.
+
+    Args:
+        remaining (float): The remaining time in seconds.
+        duration (float): The full duration in seconds.
+        steps (int): The number of progress steps.
+
+    Returns:
+        int: The progress step, from 0 to `steps`.
+    """
+    if duration <= 0:
+        return steps
+    return min(steps, int((duration - remaining) / duration * steps))
+
+
+class TrayIconAnimator:
+    """
+    Shows the progress of the countdown on a tray icon, only pushing a new image to the
+    tray when the visible frame changes.
+
+    Attributes:
+        icon (pystray.Icon): The tray icon.
+        theme (str): The name of the ring colors, one of THEMES.
+        size (int): The size of the icon in pixels.
+        steps (int): The number of progress steps.
+    """
+
+    def __init__(self, icon, theme="light", size=64, steps=PROGRESS_STEPS):
+        """
+        Gets the TrayIconAnimator started, nothing is pushed yet.
+
+        Args:
+            icon (pystray.Icon): The tray icon.
+            theme (str): The name of the ring colors, one of THEMES.
+            size (int): The size of the icon in pixels.
+            steps (int): The number of progress steps.
+        """
+        self.icon = icon
+        self.theme = theme
+        self.size = size
+        self.steps = steps
+        self._shown = None
+
+    def update(self, remaining, duration):
+        """
+        Pushes the frame of the countdown progress if it is not the one shown.
+
+        Args:
+            remaining (float): The remaining time in seconds.
+            duration (float): The full duration in seconds.
+
+        Returns:
+            bool: True if a new frame was pushed.
+        """
+        key = (progress_step(remaining, duration, self.steps), self.theme, self.size)
+        if key == self._shown:
+            return False
+        self._shown = key
+        self.icon.icon = progress_frame(*key, steps=self.steps)
+        return True
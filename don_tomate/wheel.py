@@ -0,0 +1,413 @@
+import math
+from operator import attrgetter
+import threading
+import time
+from don_tomate.schedule import make_segments
+
+
+class WheelTimer:
+    """
+    A callback waiting in a TimingWheel.
+
+    Attributes:
+        deadline (float): The time at which the callback is due.
+        tick (int): The tick of the wheel the callback fires on.
+        callback (callable): Called with `args` once the deadline passed.
+        args (tuple): The arguments of the callback.
+        slot (set): The slot of the wheel holding the timer, None once fired or cancelled.
+    """
+
+    __slots__ = ("deadline", "tick", "callback", "args", "slot")
+
+    def __init__(self, deadline, callback, args):
+        """
+        Gets the WheelTimer started, outside of any wheel.
+
+        Args:
+            deadline (float): The time at which the callback is due.
+            callback (callable): Called with `args` once the deadline passed.
+            args (tuple): The arguments of the callback.
+        """
+        self.deadline = deadline
+        self.tick = None
+        self.callback = callback
+        self.args = args
+        self.slot = None
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel, holding any number of timers with O(1) schedule and cancel.
+
+    Time is cut in ticks of `resolution` seconds. The first wheel has a slot per tick for
+    the next `slots` ticks, each next wheel a slot per turn of the previous one. A timer
+    sits in the finest wheel covering its delay, and cascades down to finer wheels as its
+    deadline comes closer, so advancing the wheel only ever looks at the timers due.
+
+    Attributes:
+        resolution (float): The length of a tick in seconds.
+        clock (callable): Returns the current monotonic time in seconds.
+        current (int): The next tick to process.
+    """
+
+    def __init__(self, resolution=0.01, slot_bits=8, levels=4, clock=time.monotonic):
+        """
+        Gets the TimingWheel started, empty.
+
+        Args:
+            resolution (float): The length of a tick in seconds.
+            slot_bits (int): The number of slots of each wheel, as a power of two.
+            levels (int): The number of wheels. Timers beyond the last one wait in an
+                overflow set.
+            clock (callable): Monotonic time source, `time.monotonic` by default.
+        """
+        self.resolution = resolution
+        self.clock = clock
+        self.origin = clock()
+        self.current = 0
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._wheels = [[set() for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self._overflow = set()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def schedule(self, delay, callback, *args):
+        """
+        Calls a function once the delay elapsed, on the first tick after it.
+
+        Args:
+            delay (float): The delay in seconds.
+            callback (callable): The function to call.
+            *args: The arguments of the function.
+
+        Returns:
+            WheelTimer: The timer, to cancel it.
+        """
+        timer = WheelTimer(self.clock() + delay, callback, args)
+        self._insert(timer)
+        self._size += 1
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancels a timer, if it did not fire yet.
+
+        Args:
+            timer (WheelTimer): The timer to cancel.
+        """
+        if timer.slot is not None:
+            timer.slot.discard(timer)
+            timer.slot = None
+            self._size -= 1
+
+    def advance(self, now=None):
+        """
+        Processes every tick up to the given time, calling the timers that are due.
+
+        Args:
+            now (float): The current time, read from the clock if None.
+
+        Returns:
+            int: The number of timers called.
+        """
+        if now is None:
+            now = self.clock()
+        target = math.floor((now - self.origin) / self.resolution)
+        if not self._size:
+            self.current = max(self.current, target + 1)
+            return 0
+        fired = 0
+        while self.current <= target:
+            tick = self.current
+            self._cascade(tick)
+            slot = self._wheels[0][tick & self._mask]
+            due = sorted(slot, key=attrgetter("deadline"))
+            slot.clear()
+            self.current = tick + 1
+            for timer in due:
+                timer.slot = None
+            self._size -= len(due)
+            for timer in due:
+                timer.callback(*timer.args)
+            fired += len(due)
+        return fired
+
+    def next_timeout(self):
+        """
+        Computes how long the wheel can sleep before it needs to be advanced again.
+
+        Returns:
+            float: The delay in seconds until the next due tick or cascade, None if the
+                wheel is empty.
+        """
+        if not self._size:
+            return None
+        tick = self.current
+        if not any(self._cascading(tick)):
+            # Timers of the coarser wheels only come down at the end of a turn
+            level0 = self._wheels[0]
+            turn_end = (tick | self._mask) + 1
+            while tick < turn_end and not level0[tick & self._mask]:
+                tick += 1
+        return max(0.0, self.origin + tick * self.resolution - self.clock())
+
+    def _insert(self, timer):
+        """
+        Puts a timer in the finest wheel covering its delay.
+        """
+        tick = max(self.current, math.ceil((timer.deadline - self.origin) / self.resolution))
+        timer.tick = tick
+        self._place(timer, tick)
+
+    def _place(self, timer, tick):
+        """
+        Puts a timer due on the given tick in the finest wheel covering it.
+        """
+        delta = tick - self.current
+        for level, wheel in enumerate(self._wheels):
+            if delta < 1 << (self._bits * (level + 1)):
+                timer.slot = wheel[(tick >> (self._bits * level)) & self._mask]
+                break
+        else:
+            timer.slot = self._overflow
+        timer.slot.add(timer)
+
+    def _cascade(self, tick):
+        """
+        Moves the timers of the coarser wheels down when their slot comes up.
+        """
+        for slot in self._cascading(tick):
+            timers = list(slot)
+            slot.clear()
+            for timer in timers:
+                self._place(timer, max(self.current, timer.tick))
+
+    def _cascading(self, tick):
+        """
+        Yields the non-empty slots of the coarser wheels coming up on the given tick,
+        coarsest first.
+        """
+        for level in range(len(self._wheels), 0, -1):
+            if tick & ((1 << (self._bits * level)) - 1):
+                continue
+            if level == len(self._wheels):
+                slot = self._overflow
+            else:
+                slot = self._wheels[level][(tick >> (self._bits * level)) & self._mask]
+            if slot:
+                yield slot
+
+
+class Member:
+    """
+    The position of one person in the schedule of a TeamScheduler.
+
+    Attributes:
+        key (hashable): The identifier of the person.
+        index (int): The position of the current segment in the schedule.
+        remaining (float): The remaining time of the current segment while paused.
+        timer (WheelTimer): The deadline of the current segment while running.
+    """
+
+    __slots__ = ("key", "index", "remaining", "timer")
+
+    def __init__(self, key, remaining):
+        """
+        Gets the Member started on the first Pomodoro, paused.
+
+        Args:
+            key (hashable): The identifier of the person.
+            remaining (float): The duration of the first Pomodoro in seconds.
+        """
+        self.key = key
+        self.index = 0
+        self.remaining = remaining
+        self.timer = None
+
+
+class TeamScheduler:
+    """
+    Runs the Pomodoro schedule of many people at once, headless, for a shared kiosk or
+    server.
+
+    All the countdowns share one TimingWheel and one wakeup thread, which sleeps until
+    the next deadline. Like the screens of the app, a finished segment moves the person
+    to the next one, which waits to be started.
+
+    Attributes:
+        segments (list): A (displayed name, screen name, duration) tuple for each segment.
+        wheel (TimingWheel): The deadlines of the running segments.
+        members (dict): The Member of each person, by key.
+        on_complete (callable): Called with the key of the person and the displayed name
+            of a segment that finished, from the wakeup thread.
+    """
+
+    def __init__(
+        self, n_pomodoros=4, resolution=0.01, on_complete=None, segments=None, clock=time.monotonic
+    ):
+        """
+        Gets the TeamScheduler started, with nobody in it.
+
+        Args:
+            n_pomodoros (int): The number of Pomodoro cycles.
+            resolution (float): The length of a tick of the wheel in seconds.
+            on_complete (callable): Called with the key of the person and the displayed
+                name of a segment that finished.
+            segments (list): The segments of the schedule, `make_segments(n_pomodoros)`
+                if None.
+            clock (callable): Monotonic time source, `time.monotonic` by default.
+        """
+        self.segments = segments if segments is not None else make_segments(n_pomodoros)
+        self.wheel = TimingWheel(resolution, clock=clock)
+        self.members = {}
+        self.on_complete = on_complete
+        self._condition = threading.Condition(threading.RLock())
+        self._thread = None
+        self._stopped = False
+
+    def add(self, key):
+        """
+        Adds a person, on the first Pomodoro, paused.
+
+        Args:
+            key (hashable): The identifier of the person.
+        """
+        with self._condition:
+            self.members[key] = Member(key, self.segments[0][2])
+
+    def remove(self, key):
+        """
+        Removes a person and cancels their countdown.
+
+        Args:
+            key (hashable): The identifier of the person.
+        """
+        with self._condition:
+            member = self.members.pop(key)
+            if member.timer is not None:
+                self.wheel.cancel(member.timer)
+
+    def start(self, key):
+        """
+        Starts (or resumes) the current segment of a person.
+
+        Args:
+            key (hashable): The identifier of the person.
+        """
+        with self._condition:
+            member = self.members[key]
+            if member.timer is None:
+                member.timer = self.wheel.schedule(member.remaining, self._complete, member)
+                self._condition.notify()
+
+    def pause(self, key):
+        """
+        Pauses the current segment of a person, freezing the remaining time.
+
+        Args:
+            key (hashable): The identifier of the person.
+        """
+        with self._condition:
+            member = self.members[key]
+            if member.timer is not None:
+                member.remaining = self.remaining(key)
+                self.wheel.cancel(member.timer)
+                member.timer = None
+
+    def reset(self, key):
+        """
+        Stops the current segment of a person and rewinds it to its full duration.
+
+        Args:
+            key (hashable): The identifier of the person.
+        """
+        with self._condition:
+            member = self.members[key]
+            self._stop(member, member.index)
+
+    def next(self, key):
+        """
+        Moves a person to the next segment of the schedule, stopped at its full duration.
+
+        Args:
+            key (hashable): The identifier of the person.
+        """
+        with self._condition:
+            member = self.members[key]
+            self._stop(member, (member.index + 1) % len(self.segments))
+
+    def remaining(self, key):
+        """
+        Args:
+            key (hashable): The identifier of the person.
+
+        Returns:
+            float: The remaining time of the current segment in seconds.
+        """
+        member = self.members[key]
+        timer = member.timer
+        if timer is None:
+            return member.remaining
+        return max(0.0, timer.deadline - self.wheel.clock())
+
+    def title(self, key):
+        """
+        Args:
+            key (hashable): The identifier of the person.
+
+        Returns:
+            str: The displayed name of the current segment (e.g., "Pomodoro 1").
+        """
+        return self.segments[self.members[key].index][0]
+
+    def run(self):
+        """
+        Starts the wakeup thread.
+        """
+        with self._condition:
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the wakeup thread, leaving the countdowns as they are.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """
+        Advances the wheel, then sleeps until the next deadline or a new countdown.
+        """
+        with self._condition:
+            while not self._stopped:
+                self.wheel.advance()
+                self._condition.wait(self.wheel.next_timeout())
+
+    def _stop(self, member, index):
+        """
+        Stops the countdown of a person on the given segment, at its full duration.
+        """
+        if member.timer is not None:
+            self.wheel.cancel(member.timer)
+            member.timer = None
+        member.index = index
+        member.remaining = self.segments[index][2]
+
+    def _complete(self, member):
+        """
+        Moves a person whose segment finished to the next one.
+        """
+        title = self.segments[member.index][0]
+        member.timer = None
+        self._stop(member, (member.index + 1) % len(self.segments))
+        if self.on_complete is not None:
+            self.on_complete(member.key, title)
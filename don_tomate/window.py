@@ -0,0 +1,142 @@
+import platform
+
+# Default window size
+WINDOW_SIZE = (500, 300)
+
+
+def get_window():
+    """
+    Returns the Kivy window. Kivy creates the window and its GL context when
+    `kivy.core.window` is first imported, so this is only called once the app builds.
+
+    Returns:
+        WindowBase: The application window.
+    """
+    from kivy.core.window import Window
+
+    return Window
+
+
+def set_always_on_top(enabled):
+    """
+    Floats the window on top of the others, or puts it back at the normal level.
+    Only supported on macOS, where the Cocoa bindings are imported on first use.
+
+    Args:
+        enabled (bool): True to float the window on top.
+
+    Returns:
+        bool: True if the window level was changed, False if the platform is not supported.
+    """
+    if platform.system() != "Darwin":
+        return False
+
+    import objc
+    from Quartz import kCGNormalWindowLevel, kCGStatusWindowLevel
+
+    NSApplication = objc.lookUpClass("NSApplication")
+    app = NSApplication.sharedApplication()
+    window = app.windows()[0]  # Get the main window
+    window.setLevel_(kCGStatusWindowLevel if enabled else kCGNormalWindowLevel)
+    return True
+
+
+def set_opacity(opacity):
+    """
+    Sets the opacity of the window.
+
+    Args:
+        opacity (float): The opacity, from 0 (transparent) to 1 (opaque).
+    """
+    get_window().opacity = opacity
+
+
+# Frame rate of the event loop while the window is unfocused, minimized or hidden
+IDLE_FPS = 2
+
+
+class IdleMonitor:
+    """
+    Follows the window being minimized, hidden or unfocused, and lowers the frame rate
+    of the Kivy event loop meanwhile. The app is told about every change, so it can stop
+    updating the countdown while nothing is visible.
+
+    Attributes:
+        on_change (callable): Called with the monitor when the window state changes.
+        idle_fps (float): The frame rate of the event loop while idle.
+        hidden (bool): Indicates if the window is minimized or hidden.
+        focused (bool): Indicates if the window has the focus.
+    """
+
+    def __init__(self, on_change, idle_fps=IDLE_FPS):
+        """
+        Gets the IdleMonitor started, assuming a visible and focused window.
+
+        Args:
+            on_change (callable): Called with the monitor when the window state changes.
+            idle_fps (float): The frame rate of the event loop while idle.
+        """
+        self.on_change = on_change
+        self.idle_fps = idle_fps
+        self.hidden = False
+        self.focused = True
+        self._active_fps = None
+
+    @property
+    def idle(self):
+        """
+        bool: Indicates if the window is minimized, hidden or unfocused.
+        """
+        return self.hidden or not self.focused
+
+    def start(self):
+        """
+        Binds the window events.
+        """
+        window = get_window()
+        window.bind(
+            on_minimize=self.on_hide,
+            on_hide=self.on_hide,
+            on_restore=self.on_show,
+            on_show=self.on_show,
+            focus=self.on_focus,
+        )
+
+    def on_hide(self, *args):
+        """
+        Handles the window being minimized or hidden.
+        """
+        self._update(hidden=True, focused=self.focused)
+
+    def on_show(self, *args):
+        """
+        Handles the window being restored or shown.
+        """
+        self._update(hidden=False, focused=self.focused)
+
+    def on_focus(self, window, focused):
+        """
+        Handles the window gaining or losing the focus.
+        """
+        self._update(hidden=self.hidden, focused=focused)
+
+    def _update(self, hidden, focused):
+        """
+        Applies a new window state, adjusting the frame rate of the event loop.
+
+        Args:
+            hidden (bool): Indicates if the window is minimized or hidden.
+            focused (bool): Indicates if the window has the focus.
+        """
+        if (hidden, focused) == (self.hidden, self.focused):
+            return
+        from kivy.clock import Clock
+
+        was_idle = self.idle
+        self.hidden, self.focused = hidden, focused
+        if self.idle and not was_idle:
+            self._active_fps = Clock._max_fps
+            Clock._max_fps = self.idle_fps
+        elif was_idle and not self.idle:
+            Clock._max_fps = self._active_fps
+        self.on_change(self)
@@ -0,0 +1,45 @@
+from unittest.mock import patch
+from kivy.event import EventDispatcher
+from don_tomate.audio import SoundCache
+
+
+class FakeSound(EventDispatcher):
+    __events__ = ("on_stop",)
+
+    def __init__(self, **kwargs):
+        super(FakeSound, self).__init__(**kwargs)
+        self.state = "stop"
+
+    def play(self):
+        self.state = "play"
+
+    def stop(self):
+        self.state = "stop"
+        self.dispatch("on_stop")
+
+    def on_stop(self):
+        pass
+
+
+def test_sounds_are_loaded_once():
+    with patch("kivy.core.audio.SoundLoader.load", return_value=FakeSound()) as mock_load:
+        sounds = SoundCache({"notification": "notification.wav"})
+        sounds.preload()
+        sounds.play("notification")
+        sounds.play("notification")
+        mock_load.assert_called_once_with("notification.wav")
+
+
+def test_on_stop_callbacks_are_released():
+    sound = FakeSound()
+    calls = []
+    with patch("kivy.core.audio.SoundLoader.load", return_value=sound):
+        sounds = SoundCache({"notification": "notification.wav"})
+
+        sounds.play("notification", on_stop=lambda s: calls.append("first"))
+        # Playing again for someone else stops the sound for the first caller
+        sounds.play("notification", on_stop=lambda s: calls.append("second"))
+        sound.stop()
+        sound.stop()
+
+    assert calls == ["first", "second"]
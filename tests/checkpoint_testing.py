@@ -0,0 +1,40 @@
+import os
+from unittest.mock import patch
+from don_tomate.checkpoint import PAUSED, RECORD, RUNNING, Checkpoint, TimerCheckpoint
+
+
+def test_checkpoint_round_trip(tmp_path):
+    path = tmp_path / "timer.checkpoint"
+    saved = TimerCheckpoint(path)
+    saved.save(RUNNING, "break_2", 4, deadline=1_700_000_000.5)
+    saved.save(PAUSED, "main_3", 4, remaining=754.25)
+    saved.close()
+
+    assert os.path.getsize(path) == RECORD.size
+    assert TimerCheckpoint(path).load() == Checkpoint(PAUSED, "main_3", 4, 0.0, 754.25)
+
+
+def test_unchanged_states_are_not_written(tmp_path):
+    saved = TimerCheckpoint(tmp_path / "timer.checkpoint")
+    with patch("os.pwrite", wraps=os.pwrite) as pwrite:
+        for _ in range(3):
+            saved.save(RUNNING, "main", 4, deadline=1000.0)
+        saved.save(PAUSED, "main", 4, remaining=10.0)
+    saved.close()
+    assert pwrite.call_count == 2
+
+
+def test_torn_records_are_ignored(tmp_path):
+    path = tmp_path / "timer.checkpoint"
+    assert TimerCheckpoint(path).load() is None
+
+    saved = TimerCheckpoint(path)
+    saved.save(RUNNING, "main", 4, deadline=1000.0)
+    saved.close()
+    data = bytearray(path.read_bytes())
+    data[30] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert TimerCheckpoint(path).load() is None
+
+    path.write_bytes(bytes(data[:20]))
+    assert TimerCheckpoint(path).load() is None
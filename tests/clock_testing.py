@@ -0,0 +1,38 @@
+import pytest
+from don_tomate.clock import VirtualClock
+
+
+def test_virtual_clock_calls_callbacks_in_order():
+    clock = VirtualClock()
+    calls = []
+    clock.schedule_once(lambda dt: calls.append(("late", clock.time(), dt)), 5)
+    clock.schedule_once(lambda dt: calls.append(("early", clock.time(), dt)), 1)
+    cancelled = clock.schedule_once(lambda dt: calls.append(("cancelled", clock.time(), dt)), 2)
+    cancelled.cancel()
+
+    assert clock.advance(3) == 1
+    assert clock.time() == 3
+    assert clock.next_deadline() == 5
+    clock.advance(10)
+    assert calls == [("early", 1, 1), ("late", 5, 5)]
+    assert clock.next_deadline() is None
+
+
+def test_virtual_clock_intervals():
+    clock = VirtualClock()
+    calls = []
+
+    def tick(dt):
+        calls.append(clock.time())
+        return len(calls) < 3
+
+    clock.schedule_interval(tick, 2)
+    clock.advance(100)
+    assert calls == [2, 4, 6]
+
+
+def test_virtual_clock_stops_callbacks_that_never_move_time():
+    clock = VirtualClock()
+    clock.schedule_interval(lambda dt: None, 0)
+    with pytest.raises(RuntimeError):
+        clock.advance(1)
@@ -1 +1,17 @@
+import pytest
+
 pytest_plugins = "pytester"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    # A monotonic clock the test moves by hand
+    return FakeClock()
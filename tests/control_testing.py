@@ -0,0 +1,114 @@
+import json
+import socket
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from kivy.clock import Clock
+from don_tomate.control import ControlServer
+from don_tomate.main import DonTomateApp
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(DonTomateApp, "user_data_dir", str(tmp_path))
+    app = DonTomateApp()
+    app.root = app.build()
+    server = ControlServer(app, path=str(tmp_path / "control.sock"))
+    server.start()
+    yield server
+    server.stop()
+    app.root.get_screen("main").soft_reset(None)
+    app.events.close()
+    app.journal.close()
+
+
+def run_client(server, talk):
+    """
+    Runs a client on a thread while the Kivy clock is ticked on this one.
+    """
+    results = []
+    client = socket.socket(socket.AF_UNIX)
+    client.connect(server.address)
+    stream = client.makefile("rw")
+
+    def request(**message):
+        stream.write(json.dumps(message) + "\n")
+        stream.flush()
+        return json.loads(stream.readline())
+
+    thread = threading.Thread(target=lambda: results.append(talk(request, stream)))
+    thread.start()
+    deadline = time.monotonic() + 5
+    while thread.is_alive() and time.monotonic() < deadline:
+        Clock.tick()
+        time.sleep(0.01)
+    thread.join(0)
+    client.close()
+    return results[0]
+
+
+def test_commands_drive_the_displayed_timer(server):
+    def talk(request, stream):
+        return [
+            request(command="status", id=1),
+            request(command="start_stop", id=2),
+            request(command="reset"),
+            request(command="next"),
+            request(command="bogus"),
+        ]
+
+    status, started, reset, moved, bogus = run_client(server, talk)
+    assert status == dict(
+        id=1,
+        ok=True,
+        state=dict(
+            screen="main",
+            title="Pomodoro 1",
+            running=False,
+            remaining=25 * 60,
+            duration=25 * 60,
+            current_timer=None,
+        ),
+    )
+    assert started["id"] == 2
+    assert started["state"]["running"] and started["state"]["current_timer"] == "main"
+    assert not reset["state"]["running"] and reset["state"]["current_timer"] is None
+    assert moved["state"]["screen"] == "break_1"
+    assert bogus == dict(id=None, ok=False, error="unknown command: bogus")
+
+
+def test_subscribers_get_state_changes(server):
+    def talk(request, stream):
+        subscribed = request(command="subscribe")
+        started = request(command="start_stop")
+        # Pushed once the frame of the command is done
+        pushed = json.loads(stream.readline())
+        return subscribed, started, pushed
+
+    subscribed, started, pushed = run_client(server, talk)
+    assert subscribed["ok"] and not subscribed["state"]["running"]
+    assert started["state"]["running"]
+    assert pushed["event"] == "state"
+    assert pushed["state"]["running"]
+
+
+def test_failing_commands_are_answered(server, monkeypatch):
+    def control_target():
+        raise RuntimeError("no timer")
+
+    monkeypatch.setattr(server.app, "control_target", control_target)
+
+    def talk(request, stream):
+        return request(command=["start_stop"], id=1), request(command="next", id=2)
+
+    unhashable, failed = run_client(server, talk)
+    assert unhashable == dict(id=1, ok=False, error="unknown command: ['start_stop']")
+    assert failed == dict(id=2, ok=False, error="next failed: RuntimeError('no timer')")
+
+
+def test_start_raises_when_the_address_cannot_be_bound(tmp_path):
+    control = ControlServer(MagicMock(), path=str(tmp_path / "missing" / "control.sock"))
+    with pytest.raises(OSError):
+        control.start()
+    assert not control._thread.is_alive()
@@ -0,0 +1,28 @@
+from don_tomate.countdown import CountdownLabel
+from don_tomate.timer import format_time
+
+
+def test_format_time():
+    assert format_time(25 * 60) == "25:00"
+    assert format_time(59) == "00:59"
+
+
+def test_tick_only_swaps_changed_digits():
+    label = CountdownLabel(text="24:59", font_size="40sp")
+    rects = list(label._rects)
+    textures = [rect.texture for rect in rects]
+
+    label.text = "24:58"
+
+    # Same rectangles, only the last digit got a new texture
+    assert label._rects == rects
+    assert [rect.texture for rect in rects[:-1]] == textures[:-1]
+    assert rects[-1].texture is CountdownLabel.glyph("8", label.font_size)
+
+
+def test_other_texts_are_rendered_whole():
+    label = CountdownLabel(text="00:01", font_size="40sp")
+    label.text = "Time's up!"
+    assert len(label._rects) == 1
+    label.text = "25:00"
+    assert len(label._rects) == 5
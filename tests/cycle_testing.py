@@ -0,0 +1,66 @@
+from don_tomate.cycle import CycleState
+
+SEGMENTS = ["main", "break_1", "main_2", "long_break"]
+
+
+def test_segments_follow_each_other():
+    cycle = CycleState(SEGMENTS)
+    assert cycle.can_start("main")
+    assert not cycle.can_start("break_1")
+
+    cycle.start("main")
+    cycle.complete("main")
+    assert cycle.can_start("main")
+    assert cycle.can_start("break_1")
+    assert not cycle.can_start("main_2")
+    # Only the beginning or the end of a cycle lets the first segment start again
+    cycle.stop()
+    assert not cycle.can_start("main")
+
+    for name in SEGMENTS[1:]:
+        cycle.start(name)
+        cycle.complete(name)
+    assert cycle.n_completed == len(SEGMENTS)
+    assert cycle.can_start("main")
+
+
+def test_restarted_segments_are_disarmed():
+    cycle = CycleState(SEGMENTS)
+    cycle.start("main")
+    cycle.complete("main")
+    cycle.start("break_1")
+    cycle.disarm("break_1")
+    assert not cycle.is_armed("break_1")
+    assert not cycle.can_start("break_1")
+
+
+def test_snapshot_restore_and_resize():
+    cycle = CycleState(SEGMENTS)
+    cycle.start("main")
+    cycle.complete("main")
+    cycle.start("break_1")
+    cycle.disarm("main_2")
+
+    restored = CycleState.restore(cycle.snapshot())
+    assert restored.snapshot() == cycle.snapshot()
+    assert restored.current_name == "break_1"
+
+    cycle.resize(["main", "long_break"])
+    assert cycle.snapshot() == dict(
+        segments=["main", "long_break"], completed=["main"], disarmed=[], current=None
+    )
+    assert cycle.can_start("long_break")
+
+
+def test_restart_keeps_the_current_timer():
+    cycle = CycleState(SEGMENTS)
+    cycle.start("main")
+    cycle.complete("main")
+    cycle.start("break_1")
+    cycle.disarm("main_2")
+
+    cycle.restart()
+    assert cycle.n_completed == 0
+    assert cycle.current_name == "break_1"
+    assert cycle.is_armed("main_2")
+    assert cycle.can_start("main")
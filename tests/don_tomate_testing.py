@@ -1,15 +1,36 @@
+import subprocess
+import sys
 import pytest
 from unittest.mock import patch, MagicMock
 from kivy.uix.screenmanager import ScreenManager
-from don_tomate.main import DonTomateApp
+from don_tomate import events
+from don_tomate.main import DonTomateApp, MainScreen
+
+
+def stop_timers(sm):
+    # The Kivy clock outlives the test, leave nothing running or sliding on it
+    for screen in sm.screens:
+        if isinstance(screen, MainScreen):
+            screen.soft_reset(None)
+    if sm.transition.is_active:
+        sm.transition.stop()
 
 
 @pytest.fixture
-def app_instance():
+def app_instance(tmp_path, monkeypatch):
+    # Keep the session journal out of the user's data directory
+    monkeypatch.setattr(DonTomateApp, "user_data_dir", str(tmp_path))
+
     # Create an instance of your DonTomateApp
     app = DonTomateApp()
     app.build()
-    return app
+    yield app
+    if app.root is not None:
+        stop_timers(app.root)
+    app.events.close()
+    app.journal.close()
+    app.settings.close()
+    app.checkpoint.close()
 
 
 @pytest.fixture
@@ -17,7 +38,8 @@ def screen_manager(app_instance):
     # Mock the ScreenManager used in the app
     sm = ScreenManager()
     app_instance.build_screens(sm)
-    return sm
+    yield sm
+    stop_timers(sm)
 
 
 def test_initial_timer_value(app_instance, screen_manager):
@@ -33,7 +55,7 @@ def test_start_stop_timer(app_instance, screen_manager):
     screen = screen_manager.get_screen("main")
 
     # Mock the clock scheduling
-    with patch("kivy.clock.Clock.schedule_interval") as mock_schedule:
+    with patch("kivy.clock.Clock.schedule_once") as mock_schedule:
         screen.start_stop(None)
         assert screen.running is True
         mock_schedule.assert_called_once()
@@ -46,8 +68,11 @@ def test_start_stop_timer(app_instance, screen_manager):
 def test_timer_countdown(app_instance, screen_manager):
     screen = screen_manager.get_screen("main")
 
-    # Start the timer and decrement time
+    # Start the timer on a fake monotonic clock and let one second pass
+    now = [100.0]
+    screen.timer.clock = lambda: now[0]
     screen.start_stop(None)
+    now[0] += 1
     screen.update_time(1)
 
     # Check that the timer has decremented by 1 second
@@ -84,3 +109,316 @@ def test_reset_timer(app_instance, screen_manager):
     assert screen.time == 25 * 60
     assert screen.label.text == "25:00"
     assert screen.running is False
+
+
+def test_screens_are_built_lazily(app_instance, screen_manager):
+    # Only the first timer screen exists up front
+    assert screen_manager.screen_names == ["main"]
+
+    # Walking through the schedule builds screens on demand and prunes the far ones
+    for _ in range(len(app_instance.screens) - 1):
+        screen_manager.current_screen.next_screen(None)
+        assert len(screen_manager.screens) <= 3
+    assert screen_manager.current == "long_break"
+    assert screen_manager.get_screen("long_break").previous_screen_name == "main_4"
+
+
+def test_pruning_keeps_running_timers(app_instance, screen_manager):
+    screen = screen_manager.get_screen("main")
+    screen.start_stop(None)
+
+    for _ in range(2):
+        screen_manager.current_screen.next_screen(None)
+    assert screen_manager.current == "main_2"
+    assert screen_manager.get_screen("main") is screen
+
+
+def test_rebuild_screens_keeps_untouched_screens(app_instance):
+    sm = app_instance.root = app_instance.build()
+    settings = app_instance.ensure_settings()
+    screen = sm.get_screen("main")
+    screen.start_stop(None)
+    app_instance.show_screen("break_1")
+    break_screen = sm.get_screen("break_1")
+
+    app_instance.rebuild_screens(2)
+
+    # Surviving screens, including the running timer, are kept and relinked
+    assert sm.get_screen("main") is screen
+    assert sm.get_screen("break_1") is break_screen
+    assert screen.running is True
+    assert app_instance.screens == ["main", "break_1", "main_2", "long_break"]
+    assert screen.previous_screen_name == "long_break"
+    assert app_instance.screen_specs["main_2"]["next_screen_name"] == "long_break"
+    assert "Short Break 3" not in settings.option_nodes
+
+    app_instance.rebuild_screens(5)
+    assert sm.get_screen("main") is screen
+    assert settings.timers_root_node.nodes[-1].text == "Long Break"
+
+
+def test_rebuild_screens_starts_a_new_cycle(app_instance):
+    sm = app_instance.root = app_instance.build()
+    app_instance.ensure_settings()
+    screen = sm.get_screen("main")
+    screen.start_stop(None)
+    screen.time = 0
+    screen.update_time(1)
+    assert app_instance.cycle.n_completed == 1
+
+    # Rebuilding returns to the first Pomodoro, which has to be startable
+    app_instance.rebuild_screens(6)
+    assert app_instance.cycle.n_completed == 0
+    assert screen.mute is None
+    screen.start_stop(None)
+    assert screen.running is True
+
+
+def test_number_of_cycles_of_the_app(app_instance):
+    app_instance.n_pomodoros = 2
+    app_instance.build()
+    assert app_instance.screens == ["main", "break_1", "main_2", "long_break"]
+
+
+def test_resume_a_timer_from_the_tray(app_instance):
+    sm = app_instance.root = app_instance.build()
+    now = app_instance.clock.time()
+    app_instance.resume_timer("main_2", remaining=0, deadline=now + 600)
+
+    screen = sm.get_screen("main_2")
+    assert sm.current == "main_2"
+    assert screen.running
+    assert 590 < screen.timer.remaining() <= 600
+    assert app_instance.cycle.current_name == "main_2"
+
+    # A paused countdown is resumed paused
+    screen.reset_timer(None)
+    app_instance.resume_timer("break_2", remaining=120)
+    assert not sm.get_screen("break_2").running
+    assert sm.get_screen("break_2").label.text == "02:00"
+
+
+def test_timer_events_are_journaled(app_instance, screen_manager):
+    screen = screen_manager.get_screen("main")
+
+    screen.start_stop(None)
+    screen.start_stop(None)
+    screen.reset_timer(None)
+    app_instance.events.flush()
+    app_instance.journal.flush()
+
+    sessions = app_instance.journal.read()
+    assert [session.event for session in sessions] == ["start", "pause", "reset"]
+    assert sessions[0].segment == "main"
+    assert sessions[0].title == "Pomodoro 1"
+    assert sessions[0].planned == 25 * 60
+
+
+def test_the_last_timer_of_the_cycle_completes_it(app_instance, screen_manager):
+    cycles = []
+    app_instance.events.subscribe(cycles.append, kinds=(events.CYCLE_COMPLETED,))
+    for name in app_instance.cycle.segments:
+        screen = app_instance.ensure_screen(name, screen_manager)
+        screen.time = 0
+        screen.running = True
+        screen.update_time(1)
+        screen.stop_sound(None)
+    app_instance.events.flush()
+    assert [event.segment for event in cycles] == [app_instance.cycle.segments[-1]]
+
+
+def test_resetting_a_finished_timer_is_not_journaled(app_instance, screen_manager):
+    screen = screen_manager.get_screen("main")
+    screen.start_stop(None)
+    screen.time = 0
+    screen.update_time(1)
+
+    # Reset while the notification still plays
+    screen.reset_timer(None)
+    app_instance.events.flush()
+    app_instance.journal.flush()
+    assert [session.event for session in app_instance.journal.read()] == ["start", "complete"]
+
+
+def test_statistics_screen(app_instance):
+    sm = app_instance.root = app_instance.build()
+    screen = sm.get_screen("main")
+    screen.time = 0
+    screen.running = True
+    screen.update_time(1)
+
+    statistics_screen = app_instance.ensure_statistics()
+    statistics_screen.on_pre_enter()
+    assert "Today: 25 min of focus" in statistics_screen.summary_label.text
+
+
+def test_hidden_window_wakes_up_at_the_deadline(app_instance):
+    from don_tomate.window import IdleMonitor
+
+    sm = app_instance.root = app_instance.build()
+    app_instance.idle_monitor = IdleMonitor(app_instance.on_window_state)
+    screen = sm.get_screen("main")
+    now = [100.0]
+    screen.timer.clock = lambda: now[0]
+    screen.start_stop(None)
+    assert screen.clock_event.timeout == 1
+
+    app_instance.idle_monitor.on_hide()
+    assert screen.clock_event.timeout == 25 * 60
+
+    # Restoring catches up with the time spent hidden
+    now[0] += 90
+    app_instance.idle_monitor.on_show()
+    assert screen.label.text == "23:30"
+    assert screen.clock_event.timeout == 1
+
+
+def test_instrumented_ticks(app_instance, monkeypatch):
+    from don_tomate.metrics import Instrumentation
+
+    sm = app_instance.root = app_instance.build()
+    app_instance.instrumentation = Instrumentation()
+    screen = sm.get_screen("main")
+    now = [100.0]
+    monkeypatch.setattr(app_instance.clock, "time", lambda: now[0])
+    screen.timer.clock = lambda: now[0]
+    screen.start_stop(None)
+
+    # The tick wakes up 30 ms late
+    now[0] += 1.03
+    screen.clock_event.callback(1.03)
+    screen._cancel_tick()
+    jitter = app_instance.instrumentation.tick_jitter.samples.values()
+    assert len(jitter) == 1 and abs(jitter[0] - 0.03) < 1e-9
+    assert app_instance.instrumentation.update_time.histogram.count == 1
+
+
+def test_settings_widgets_are_not_imported_at_startup():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, don_tomate.main; print('kivy.uix.treeview' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_each_kind_of_timer_plays_its_tone(app_instance, screen_manager):
+    app_instance.ensure_screen("break_1", screen_manager)
+    screen = screen_manager.get_screen("break_1")
+    assert screen.tone == "short_break"
+
+    with patch("kivy.core.audio.SoundLoader.load", return_value=MagicMock()) as mock_load:
+        screen.notify_time()
+    assert "short_break-" in mock_load.call_args.args[0]
+
+    # The notification sound stands in for a tone that cannot be played
+    app_instance.sounds.sounds.clear()
+    with patch("kivy.core.audio.SoundLoader.load", side_effect=[None, MagicMock()]) as mock_load:
+        screen.notify_time()
+    assert mock_load.call_args.args[0].endswith("notification.wav")
+    assert screen.sound is not None
+
+
+def test_the_ring_follows_the_countdown(app_instance, screen_manager):
+    screen = screen_manager.get_screen("main")
+    assert [type(widget).__name__ for widget in screen.walk()] == ["MainScreen", "TimerFace"]
+
+    now = [100.0]
+    screen.timer.clock = lambda: now[0]
+    screen.start_stop(None)
+    now[0] += 15 * 60
+    screen.update_time(0)
+    assert screen.face.progress == 0.6
+
+    screen.reset_timer(None)
+    assert screen.face.progress == 0
+
+
+def test_settings_are_saved_and_loaded_at_startup(app_instance):
+    app_instance.root = app_instance.build()
+    settings = app_instance.ensure_settings()
+    node = MagicMock()
+    node.collide_point.return_value = True
+    settings.select_time(node, MagicMock(pos=(0, 0)), "break_1", 10 * 60)
+    app_instance.translucent = True
+    settings.select_cycles(node, MagicMock(pos=(0, 0)), 2)
+    app_instance.on_stop()
+
+    # The next launch builds the screens with the saved settings
+    app = DonTomateApp()
+    app.root = app.build()
+    assert app.n_pomodoros == 2
+    assert app.translucent and not app.always_on_top
+    assert list(app.schedule.durations) == [25 * 60, 10 * 60, 25 * 60, 30 * 60]
+    assert app.screen_specs["break_1"]["duration"] == 10 * 60
+    assert app.screen_specs["main"]["duration"] == 25 * 60
+    stop_timers(app.root)
+
+    # Cycles given on the command line win over the saved ones
+    app = DonTomateApp()
+    app.n_pomodoros = 3
+    app.build()
+    assert app.screens == ["main", "break_1", "main_2", "break_2", "main_3", "long_break"]
+
+
+def test_a_custom_plan_drives_the_screens_and_the_settings(app_instance):
+    app_instance.kind_durations = (52 * 60, 17 * 60, 30 * 60)
+    app_instance.root = app_instance.build()
+    assert app_instance.root.get_screen("main").label.text == "52:00"
+    settings = app_instance.ensure_settings()
+    assert settings.tree_nodes[("main", 52 * 60)].color == [0.3, 0.5, 1, 1]
+
+    node = MagicMock()
+    node.collide_point.return_value = True
+    settings.select_cycles(node, MagicMock(pos=(0, 0)), 12)
+    assert app_instance.n_pomodoros == 12
+    assert app_instance.screens[-2:] == ["main_12", "long_break"]
+    assert app_instance.screen_specs["break_11"]["duration"] == 17 * 60
+    assert settings.option_nodes["main_12"].text == "Pomodoro 12"
+    stop_timers(app_instance.root)
+
+
+def test_a_running_timer_survives_a_crash(app_instance, monkeypatch):
+    sm = app_instance.root = app_instance.build()
+    sm.get_screen("main").start_stop(None)
+    app_instance.checkpoint.close()
+
+    # The next run continues the countdown, 100 s later
+    app = DonTomateApp()
+    app.root = app.build()
+    wall_time = app.clock.wall_time() + 100
+    monkeypatch.setattr(app.clock, "wall_time", lambda: wall_time)
+    assert app.restore_checkpoint()
+    screen = app.root.get_screen("main")
+    assert screen.running
+    assert 25 * 60 - 101 < screen.timer.remaining() <= 25 * 60 - 100
+    screen.start_stop(None)
+    app.checkpoint.close()
+
+    # The paused timer is restored paused, and once its deadline passed it finishes
+    app = DonTomateApp()
+    app.root = app.build()
+    assert app.restore_checkpoint()
+    assert not app.root.get_screen("main").running
+    app.root.get_screen("main").start_stop(None)
+    app.checkpoint.close()
+    app = DonTomateApp()
+    app.root = app.build()
+    monkeypatch.setattr(app.clock, "wall_time", lambda: wall_time + 25 * 60)
+    with patch("kivy.core.audio.SoundLoader.load", return_value=MagicMock()):
+        assert app.restore_checkpoint()
+    assert app.root.get_screen("main").label.text == "Time's up!"
+    assert app.cycle.completed[0]
+    stop_timers(app.root)
+    app.checkpoint.close()
+
+    # Nothing to restore once the timer finished
+    app = DonTomateApp()
+    app.root = app.build()
+    assert not app.restore_checkpoint()
+    app.checkpoint.close()
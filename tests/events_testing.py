@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+import pytest
+from don_tomate.events import (
+    COMPLETED,
+    CYCLE_COMPLETED,
+    PAUSED,
+    SEGMENT_STARTED,
+    EventBus,
+    TimerEvent,
+)
+
+
+def make_event(kind, segment="main"):
+    return TimerEvent(kind, segment, "Pomodoro 1", 1500.0, 1500.0, time.time())
+
+
+@pytest.fixture
+def bus():
+    bus = EventBus(max_workers=2, max_pending=4, timeout=1.0)
+    yield bus
+    bus.close(timeout=5)
+
+
+def test_each_subscriber_gets_its_events_in_order(bus):
+    received = []
+    cycles = []
+    bus.subscribe(received.append, kinds=(SEGMENT_STARTED, PAUSED, COMPLETED))
+    bus.subscribe(cycles.append, kinds=(CYCLE_COMPLETED,))
+
+    kinds = [SEGMENT_STARTED, PAUSED, SEGMENT_STARTED, COMPLETED, CYCLE_COMPLETED]
+    for idx, kind in enumerate(kinds):
+        assert bus.publish(make_event(kind, f"main_{idx}"))
+    assert bus.flush(timeout=5)
+
+    assert [event.segment for event in received] == ["main_0", "main_1", "main_2", "main_3"]
+    assert [event.kind for event in cycles] == [CYCLE_COMPLETED]
+
+
+def test_coroutine_handlers_run_on_the_loop(bus):
+    received = []
+
+    async def handler(event):
+        await asyncio.sleep(0)
+        received.append((event.kind, threading.current_thread().name))
+
+    bus.subscribe(handler, kinds=(COMPLETED,))
+    bus.publish(make_event(COMPLETED))
+    assert bus.flush(timeout=5)
+    assert received == [(COMPLETED, "don_tomate-events-loop")]
+
+
+def test_publishing_never_waits_for_a_slow_handler(bus):
+    release = threading.Event()
+    subscription = bus.subscribe(lambda event: release.wait(5), kinds=(SEGMENT_STARTED,))
+
+    start = time.monotonic()
+    results = [bus.publish(make_event(SEGMENT_STARTED)) for _ in range(10)]
+    assert time.monotonic() - start < 0.5
+
+    # The first event is being handled, four wait, the others are dropped
+    assert results.count(False) == subscription.dropped >= 5
+    release.set()
+    assert bus.flush(timeout=5)
+
+
+def test_slow_and_failing_handlers_do_not_hold_the_others(bus, caplog):
+    received = []
+
+    def fail(event):
+        raise RuntimeError("hook failed")
+
+    bus.subscribe(lambda event: time.sleep(2), kinds=(COMPLETED,), timeout=0.1)
+    bus.subscribe(fail, kinds=(COMPLETED,))
+    bus.subscribe(received.append, kinds=(COMPLETED,))
+
+    start = time.monotonic()
+    bus.publish(make_event(COMPLETED))
+    assert bus.flush(timeout=5)
+    assert time.monotonic() - start < 1.5
+    assert len(received) == 1
+    assert "took more than 0.1 s" in caplog.text
+    assert "hook failed" in caplog.text
+
+
+def test_unsubscribed_handlers_are_not_called(bus):
+    received = []
+    subscription = bus.subscribe(received.append)
+    bus.publish(make_event(PAUSED))
+    bus.flush(timeout=5)
+    bus.unsubscribe(subscription)
+    bus.publish(make_event(PAUSED))
+    bus.flush(timeout=5)
+    assert len(received) == 1
+
+
+def test_unknown_kinds_are_refused(bus):
+    with pytest.raises(ValueError):
+        bus.subscribe(print, kinds=("lunch",))
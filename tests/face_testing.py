@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock
+from don_tomate.face import FaceButton, TimerFace
+
+
+def make_face(pressed):
+    controls = {
+        slot: FaceButton(on_press=lambda button, slot=slot: pressed.append(slot))
+        for slot in ("stop_sound", "reset", "settings", "previous", "next", "start_stop")
+    }
+    face = TimerFace("Pomodoro 1", "25:00", controls, size=(500, 300))
+    return face, controls
+
+
+def touch_at(control):
+    (x, y), (width, height) = control.rect.pos, control.rect.size
+    return MagicMock(pos=(x + width / 2, y + height / 2))
+
+
+def test_touches_press_the_control_under_them():
+    pressed = []
+    face, controls = make_face(pressed)
+    for control in controls.values():
+        assert face.on_touch_down(touch_at(control))
+    assert pressed == list(controls)
+    assert not face.on_touch_down(MagicMock(pos=(250, 150)))
+
+
+def test_hidden_and_disabled_controls_ignore_touches():
+    pressed = []
+    hidden = FaceButton(opacity=0, on_press=pressed.append)
+    disabled = FaceButton(disabled=True, on_press=pressed.append)
+    face = TimerFace("Pomodoro 1", "25:00", dict(stop_sound=hidden, previous=disabled))
+    face.size = (500, 300)
+    assert not face.on_touch_down(touch_at(hidden))
+    assert not face.on_touch_down(touch_at(disabled))
+    assert pressed == []
+
+    hidden.opacity = 1
+    assert face.on_touch_down(touch_at(hidden))
+    assert pressed == [hidden]
+
+
+def test_controls_do_not_overlap_and_stay_in_the_face():
+    face, controls = make_face([])
+    face.size = (320, 480)
+    boxes = [(*control.rect.pos, *control.rect.size) for control in controls.values()]
+    for idx, (x, y, width, height) in enumerate(boxes):
+        assert width > 0 and 0 <= x and x + width <= 320 and 0 <= y and y + height <= 480
+        for other_x, other_y, other_width, other_height in boxes[idx + 1 :]:
+            assert (
+                # Side by side, up to the float precision of the rectangles
+                x + width <= other_x + 1e-3
+                or other_x + other_width <= x + 1e-3
+                or y + height <= other_y + 1e-3
+                or other_y + other_height <= y + 1e-3
+            )
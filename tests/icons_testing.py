@@ -0,0 +1,16 @@
+import json
+from don_tomate.icons import ATLAS_PATH, ICON_NAMES, icon_uri
+
+
+def test_atlas_holds_every_control_icon():
+    with open(ATLAS_PATH) as f:
+        pages = json.load(f)
+
+    # A single texture page holds all the icons
+    assert len(pages) == 1
+    assert sorted(next(iter(pages.values()))) == sorted(ICON_NAMES)
+
+
+def test_icon_uri():
+    assert icon_uri("play").startswith("atlas://")
+    assert icon_uri("play").endswith("/Resources/icons/play")
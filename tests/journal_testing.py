@@ -0,0 +1,41 @@
+import time
+from don_tomate.journal import SessionJournal
+
+
+def test_events_are_written_in_the_background(tmp_path):
+    journal = SessionJournal(tmp_path / "history.sqlite3", flush_interval=60)
+    journal.record("start", "main", "Pomodoro 1", 1500, 0)
+    journal.record("complete", "main", "Pomodoro 1", 1500, 1500)
+
+    # Flushing does not wait for the flush interval
+    start = time.monotonic()
+    journal.flush()
+    assert time.monotonic() - start < 5
+
+    sessions = journal.read()
+    assert [session.event for session in sessions] == ["start", "complete"]
+    assert sessions[1].actual == 1500
+    journal.close()
+
+
+def test_read_by_day(tmp_path):
+    journal = SessionJournal(tmp_path / "history.sqlite3")
+    for day in range(1, 6):
+        timestamp = time.mktime((2024, 8, day, 12, 0, 0, 0, 0, -1))
+        journal.record("complete", "main", "Pomodoro 1", 1500, 1500, timestamp=timestamp)
+    journal.close()
+
+    sessions = journal.read("2024-08-02", "2024-08-04")
+    assert [session.day for session in sessions] == ["2024-08-02", "2024-08-03", "2024-08-04"]
+
+
+def test_write_errors_do_not_stop_the_journal(tmp_path):
+    journal = SessionJournal(tmp_path / "missing" / "history.sqlite3")
+    journal.record("start", "main", "Pomodoro 1", 1500, 0)
+    journal.flush()
+
+    # The directory shows up, the next events are written
+    (tmp_path / "missing").mkdir()
+    journal.record("complete", "main", "Pomodoro 1", 1500, 1500)
+    journal.close()
+    assert [session.event for session in journal.read()] == ["complete"]
@@ -0,0 +1,37 @@
+import json
+from don_tomate.metrics import Histogram, Instrumentation, RingBuffer, bucket_index
+
+
+def test_ring_buffer_keeps_the_latest_samples():
+    ring = RingBuffer(3)
+    for value in range(5):
+        ring.append(value)
+    assert ring.values() == [2, 3, 4]
+    assert ring.count == 5
+
+
+def test_histogram_percentiles_are_close():
+    histogram = Histogram()
+    for micros in range(1, 10001):
+        histogram.record(micros / 1e6)
+    assert abs(histogram.percentile(50) - 5e-3) / 5e-3 < 0.04
+    assert abs(histogram.percentile(99) - 9.9e-3) / 9.9e-3 < 0.04
+    assert histogram.percentile(100) == 10e-3
+    # Buckets are contiguous, whatever the magnitude
+    indexes = [bucket_index(micros) for micros in range(100000)]
+    assert all(0 <= b - a <= 1 for a, b in zip(indexes, indexes[1:]))
+
+
+def test_instrumentation_dump(tmp_path):
+    metrics = Instrumentation(capacity=2)
+    metrics.tick_jitter.record(0.002)
+    for now in (0.0, 0.016, 0.033):
+        metrics.on_draw(now - 0.004)
+        metrics.on_flip(now)
+    metrics.dump(tmp_path / "metrics.json")
+    data = json.loads((tmp_path / "metrics.json").read_text())
+    assert data["tick_jitter"]["count"] == 1
+    assert data["update_time"] == {"count": 0, "latest_ms": []}
+    assert data["render_time"]["count"] == 3
+    assert data["frame_time"]["latest_ms"] == [16.0, 17.0]
+    assert "tick_jitter: p50" in metrics.report()
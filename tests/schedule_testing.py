@@ -0,0 +1,69 @@
+import pytest
+from don_tomate.schedule import (
+    LONG_BREAK,
+    MAX_DURATION,
+    POMODORO,
+    SHORT_BREAK,
+    Schedule,
+    make_segments,
+)
+
+
+def test_the_usual_cycle():
+    schedule = Schedule.plan(3)
+    assert schedule.names == ("main", "break_1", "main_2", "break_2", "main_3", "long_break")
+    assert schedule.titles[:2] == ("Pomodoro 1", "Short Break 1")
+    assert schedule.titles[-1] == "Long Break"
+    assert list(schedule.durations) == [1500, 300, 1500, 300, 1500, 1800]
+    assert list(schedule.ends) == [1500, 1800, 3300, 3600, 5100, 6900]
+    assert schedule.n_pomodoros == 3
+    assert [schedule.tone(idx) for idx in (0, 1, 5)] == ["pomodoro", "short_break", "long_break"]
+    assert make_segments(1) == [("Pomodoro 1", "main", 1500), ("Long Break", "long_break", 1800)]
+    assert not hasattr(schedule, "__dict__")
+
+
+def test_seeking_the_segment_at_an_elapsed_time():
+    schedule = Schedule.plan(2, durations=(52 * 60, 17 * 60, 30 * 60))
+    assert schedule.seek(0) == (0, 0)
+    assert schedule.seek(52 * 60 - 1) == (0, 52 * 60 - 1)
+    assert schedule.seek(52 * 60) == (1, 0)
+    assert schedule.seek(69 * 60 + 30.5) == (2, 30.5)
+    # The cycle repeats
+    assert schedule.seek(schedule.total + 60) == (0, 60)
+
+
+def test_changing_a_duration_moves_the_later_segments():
+    schedule = Schedule.plan(12)
+    assert len(schedule) == 24
+    assert schedule.names[-2:] == ("main_12", "long_break")
+    schedule.set_duration(schedule.index("break_1"), 10 * 60)
+    assert schedule.start(schedule.index("main_2")) == 35 * 60
+    assert schedule.total == 12 * 25 * 60 + 11 * 5 * 60 + 5 * 60 + 30 * 60
+    assert schedule.duration_options(1)[-1] == 30 * 60
+
+    with pytest.raises(ValueError):
+        schedule.set_duration(0, 0)
+    with pytest.raises(ValueError):
+        schedule.set_duration(0, MAX_DURATION + 1)
+
+
+def test_custom_plans():
+    schedule = Schedule([POMODORO, POMODORO, LONG_BREAK, SHORT_BREAK], [3120, 3120, 1020, 60])
+    assert schedule.names == ("main", "main_2", "long_break", "break_1")
+    assert schedule.duration_options(0)[-1] == 3120
+
+    with pytest.raises(ValueError):
+        Schedule([], [])
+    with pytest.raises(ValueError):
+        Schedule.plan(0)
+
+
+def test_resizing_keeps_the_chosen_durations():
+    schedule = Schedule.plan(4)
+    schedule.set_duration(schedule.index("break_1"), 10 * 60)
+    schedule.set_duration(schedule.index("main_4"), 30 * 60)
+
+    resized = schedule.resized(2, durations=(52 * 60, 17 * 60, 30 * 60))
+    assert list(resized.durations) == [25 * 60, 10 * 60, 25 * 60, 30 * 60]
+    resized = resized.resized(3, durations=(52 * 60, 17 * 60, 30 * 60))
+    assert list(resized.durations) == [25 * 60, 10 * 60, 25 * 60, 17 * 60, 52 * 60, 30 * 60]
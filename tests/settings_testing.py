@@ -0,0 +1,44 @@
+import json
+from unittest.mock import patch
+from don_tomate.settings import SettingsStore
+
+
+def test_settings_are_written_once_they_settle(tmp_path):
+    path = tmp_path / "settings.json"
+    store = SettingsStore(path, delay=0.2)
+    with patch.object(store, "_write", wraps=store._write) as write:
+        for n_cycles in range(1, 7):
+            store.update(n_pomodoros=n_cycles)
+        store.flush()
+        assert write.call_count == 1
+
+        store.update(translucent=True)
+        store.close()
+        assert write.call_count == 2
+
+    assert json.loads(path.read_text()) == {"n_pomodoros": 6, "translucent": True}
+    assert SettingsStore(path).get("n_pomodoros") == 6
+    assert [file.name for file in tmp_path.iterdir()] == ["settings.json"]
+
+
+def test_unreadable_settings_are_ignored(tmp_path):
+    path = tmp_path / "settings.json"
+    assert SettingsStore(path).values == {}
+    path.write_text("[1, 2")
+    assert SettingsStore(path).values == {}
+    path.write_text("[1, 2]")
+    assert SettingsStore(path).get("n_pomodoros", 4) == 4
+
+
+def test_write_errors_do_not_stop_the_settings(tmp_path):
+    # The directory of the file cannot be created
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    store = SettingsStore(blocker / "settings.json", delay=0)
+    store.update(n_pomodoros=2)
+    store.flush()
+
+    store.path = tmp_path / "settings.json"
+    store.update(n_pomodoros=3)
+    store.close()
+    assert json.loads(store.path.read_text()) == {"n_pomodoros": 3}
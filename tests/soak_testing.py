@@ -0,0 +1,23 @@
+from don_tomate.soak import Soak, live_widgets, screen_footprint
+
+
+def test_soak_does_not_leak_widgets(tmp_path):
+    soak = Soak(tmp_path, cycles=(2, 1, 3))
+    growth = soak.run(7, warmup=3)
+    soak.close()
+
+    assert len(soak.reports) == 7
+    assert growth["widgets"] == 0
+    assert soak.reports[0]["widget_classes"] == soak.reports[-1]["widget_classes"]
+    assert soak.top_growth(3)
+
+
+def test_screen_footprint(tmp_path):
+    soak = Soak(tmp_path)
+    footprint = screen_footprint(soak.warp.app)
+    soak.close()
+
+    assert footprint["bytes"] > 0
+    assert footprint["widgets"] > 1
+    assert footprint["canvas_instructions"] > 0
+    assert live_widgets()["MainScreen"] >= 1
@@ -0,0 +1,94 @@
+import time
+import numpy as np
+from don_tomate.journal import SessionJournal
+from don_tomate.stats import LONG_BREAK, POMODORO, SHORT_BREAK, SessionStatistics
+
+
+def at(day, hour=10):
+    return time.mktime((2024, 8, day, hour, 0, 0, 0, 0, -1))
+
+
+def make_statistics():
+    statistics = SessionStatistics(capacity=2)
+    # Monday 5th to Wednesday 7th, then Friday 9th
+    for day in [5, 6, 7, 9]:
+        statistics.record("start", "main", 1500, 0, at(day))
+        statistics.record("complete", "main", 1500, 1500, at(day))
+        statistics.record("complete", "break_1", 300, 300, at(day))
+    statistics.record("reset", "main_2", 1500, 600, at(9, hour=15))
+    statistics.record("reset", "long_break", 900, 60, at(9, hour=15))
+    return statistics
+
+
+def test_daily_and_weekly_focus():
+    statistics = make_statistics()
+
+    days, focus = statistics.daily_focus()
+    assert list(days.astype(str)) == ["2024-08-05", "2024-08-06", "2024-08-07", "2024-08-09"]
+    assert list(focus) == [1500, 1500, 1500, 2100]
+
+    weeks, focus = statistics.weekly_focus()
+    assert list(weeks.astype(str)) == ["2024-08-05"]
+    assert list(focus) == [6600]
+
+
+def test_completion_rates_and_streaks():
+    statistics = make_statistics()
+
+    rates = statistics.completion_rates()
+    assert rates[POMODORO] == 4 / 5
+    assert rates[SHORT_BREAK] == 1
+    assert rates[LONG_BREAK] == 0
+
+    current, longest = statistics.streaks()
+    assert longest == 3
+
+
+def test_heatmap():
+    heatmap = make_statistics().heatmap()
+    assert heatmap.shape == (7, 24)
+    assert heatmap[0, 10] == 1500  # Monday 10:00
+    assert heatmap[4, 15] == 600  # Friday 15:00
+    assert heatmap.sum() == 6600
+
+
+def test_history_is_loaded_from_the_journal(tmp_path):
+    journal = SessionJournal(tmp_path / "history.sqlite3")
+    journal.record("complete", "main", "Pomodoro 1", 1500, 1500, timestamp=at(5))
+    statistics = SessionStatistics(journal)
+
+    # Events recorded before loading are read back from the journal, not counted twice
+    statistics.record("complete", "main", 1500, 1500, at(5))
+    assert statistics.size == 0
+    days, focus = statistics.daily_focus()
+    assert list(focus) == [1500]
+    statistics.record("complete", "main", 1500, 1200, at(5))
+    assert np.array_equal(statistics.daily_focus()[1], [2700])
+    assert len(statistics.summary()) == 5
+    journal.close()
+
+
+def test_bulk_load_matches_the_recorded_columns(tmp_path):
+    journal = SessionJournal(tmp_path / "history.sqlite3")
+    recorded = SessionStatistics()
+    events = [
+        ("start", "main", 1500, 0, at(5, hour=0)),
+        ("complete", "main", 1500, 1500, at(5, hour=9)),
+        ("reset", "break_1", 300, 12, at(6, hour=23)),
+        ("pause", "main_2", 1500, 600, at(7, hour=13)),
+        ("complete", "long_break", 900, 900, at(31, hour=18)),
+    ]
+    for event, segment, planned, actual, timestamp in events:
+        journal.record(event, segment, segment, planned, actual, timestamp=timestamp)
+        recorded.record(event, segment, planned, actual, timestamp)
+
+    loaded = SessionStatistics(journal)
+    for name in ("timestamp", "day", "event", "kind", "planned", "actual", "hour"):
+        assert np.array_equal(loaded.column(name), recorded.column(name)), name
+    assert np.array_equal(loaded.completed, recorded.completed)
+    assert np.array_equal(loaded.ended, recorded.ended)
+
+    # New events still append after the bulk load
+    loaded.record("complete", "main", 1500, 1500, at(8))
+    assert loaded.size == len(events) + 1
+    journal.close()
@@ -0,0 +1,48 @@
+from don_tomate.timer import TimerEngine
+
+
+def test_remaining_is_derived_from_deadline(clock):
+    timer = TimerEngine(25 * 60, clock=clock)
+    timer.start()
+
+    # A late wakeup does not lose any time
+    clock.now += 90.4
+    assert timer.remaining() == 25 * 60 - 90.4
+    assert timer.remaining_seconds() == 25 * 60 - 90
+
+
+def test_pause_and_resume(clock):
+    timer = TimerEngine(60, clock=clock)
+    timer.start()
+    clock.now += 10
+    timer.pause()
+
+    # Time spent paused is not counted
+    clock.now += 1000
+    assert timer.remaining() == 50
+    timer.start()
+    clock.now += 5
+    assert timer.remaining() == 45
+
+
+def test_next_wakeup_on_second_boundaries(clock):
+    timer = TimerEngine(60, clock=clock)
+    timer.start()
+
+    assert timer.next_wakeup() == 1
+    clock.now += 0.25
+    assert timer.next_wakeup() == 0.75
+    # Hidden timers only wake up at the deadline
+    assert timer.next_wakeup(visible=False) == 59.75
+
+
+def test_expiry_and_reset(clock):
+    timer = TimerEngine(5, clock=clock)
+    timer.start()
+    clock.now += 7
+    assert timer.expired()
+    assert timer.remaining() == 0
+
+    timer.reset(10)
+    assert not timer.running
+    assert timer.remaining_seconds() == 10
@@ -0,0 +1,64 @@
+import sqlite3
+from don_tomate.clock import VirtualEvent
+from don_tomate.main import DonTomateApp
+from don_tomate.timewarp import TimeWarp
+
+
+def test_time_warp_runs_whole_schedules(tmp_path):
+    warp = TimeWarp(tmp_path, n_pomodoros=2, sound_length=3)
+    assert [warp.run_segment() for _ in range(4)] == ["main", "break_1", "main_2", "long_break"]
+    # 25 + 5 + 25 + 30 minutes, and the notification of each segment
+    assert warp.clock.now == (25 + 5 + 25 + 30) * 60 + 4 * 3
+
+    # The next cycles start over from the first Pomodoro
+    warp.run_cycles(50)
+    warp.close()
+    assert warp.segments == 4 * 51
+    assert warp.app.root.current == "main"
+    with sqlite3.connect(tmp_path / "history.sqlite3") as connection:
+        events = dict(connection.execute("SELECT event, COUNT(*) FROM sessions GROUP BY event"))
+    assert events == {"start": 4 * 51, "complete": 4 * 51}
+
+
+def test_screens_keep_the_clock_of_their_app(tmp_path, monkeypatch):
+    monkeypatch.setattr(DonTomateApp, "user_data_dir", str(tmp_path))
+    app = DonTomateApp()
+    screen = app.build().get_screen("main")
+    screen.start_stop(None)
+
+    # Another app becoming the running app does not move the timer to its clock
+    (tmp_path / "warp").mkdir()
+    warp = TimeWarp(tmp_path / "warp")
+    screen.update_time(0)
+    assert screen.clock is app.clock
+    assert not isinstance(screen.clock_event, VirtualEvent)
+    screen.soft_reset(None)
+    warp.close()
+    app.events.close()
+    app.journal.close()
+    app.checkpoint.close()
+
+
+def test_timers_catch_up_after_a_suspend(tmp_path):
+    warp = TimeWarp(tmp_path)
+    app = warp.app
+    screen = app.root.get_screen("main")
+    screen.start_stop(None)
+    warp.clock.advance(60)
+    app.check_suspend()
+    assert screen.timer.remaining() == 25 * 60 - 60
+
+    # The monotonic clock stands still while the machine sleeps
+    warp.clock.suspend(600)
+    assert screen.timer.remaining() == 25 * 60 - 60
+    app.check_suspend()
+    assert screen.timer.remaining() == 25 * 60 - 660
+    assert screen.label.text == "14:00"
+
+    # A deadline that passed during the sleep fires the notification on wakeup
+    warp.clock.suspend(3600)
+    app.check_suspend()
+    assert screen.label.text == "Time's up!"
+    assert app.cycle.completed[0]
+    warp.run_pending()
+    warp.close()
@@ -0,0 +1,37 @@
+import wave
+import numpy as np
+from don_tomate.tones import SAMPLE_RATE, TONES, ToneBank, synthesize
+
+
+def test_tones_ramp_up_their_volume():
+    samples = synthesize(((440.0, 1.0),), ramp=(0.2, 0.8))
+    assert samples.dtype == np.dtype("<i2")
+    assert len(samples) == SAMPLE_RATE
+
+    tenth = SAMPLE_RATE // 10
+    first, last = np.abs(samples[:tenth]).max(), np.abs(samples[-tenth:]).max()
+    assert first < 0.3 * 32767 < 0.7 * 32767 < last
+    # Faded in and out, without a click
+    assert abs(samples[0]) < 50 and abs(samples[-1]) < 500
+
+
+def test_rests_are_silent():
+    samples = synthesize(((440.0, 0.1), (0.0, 0.1), (440.0, 0.1)))
+    assert not samples[SAMPLE_RATE // 10 : SAMPLE_RATE // 5].any()
+
+
+def test_tone_bank_writes_each_tone_once(tmp_path):
+    bank = ToneBank(tmp_path)
+    paths = {name: bank.path(name) for name in TONES}
+    assert len(set(paths.values())) == len(TONES)
+
+    with wave.open(paths["long_break"]) as wav:
+        assert (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) == (1, 2, SAMPLE_RATE)
+        frames = wav.readframes(wav.getnframes())
+    assert frames == bank.pcm("long_break").tobytes()
+
+    # Another bank reuses the files instead of synthesizing the tones again
+    other = ToneBank(tmp_path)
+    assert other.path("long_break") == paths["long_break"]
+    assert other.buffers == {}
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".wav"] * len(TONES)
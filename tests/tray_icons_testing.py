@@ -0,0 +1,49 @@
+from don_tomate.tray import TrayTimer
+from don_tomate.tray_icons import TrayIconAnimator, progress_frame, progress_step
+
+
+class FakeIcon:
+    def __init__(self):
+        self.pushed = []
+
+    @property
+    def icon(self):
+        return self.pushed[-1]
+
+    @icon.setter
+    def icon(self, image):
+        self.pushed.append(image)
+
+
+def test_progress_frames_are_rendered_once():
+    progress_frame.cache_clear()
+    first = progress_frame(3, "dark", 32)
+    assert first.size == (32, 32)
+    assert progress_frame(3, "dark", 32) is first
+    assert progress_frame(4, "dark", 32) is not first
+    assert progress_frame.cache_info().misses == 2
+
+
+def test_progress_step():
+    assert progress_step(1500, 1500, steps=32) == 0
+    assert progress_step(750, 1500, steps=32) == 16
+    assert progress_step(0, 1500, steps=32) == 32
+
+
+def test_animator_only_pushes_changed_frames():
+    icon = FakeIcon()
+    animator = TrayIconAnimator(icon, steps=10)
+    for remaining in range(1500, -1, -1):
+        animator.update(remaining, 1500)
+    # One frame per step, from the empty ring to the full one
+    assert len(icon.pushed) == 11
+
+
+def test_tray_timer_wakes_at_progress_steps():
+    changes = []
+    timer = TrayTimer(on_change=changes.append, steps=4)
+    timer.timer.reset(0.4)
+    timer.start_stop()
+    delay = timer._wakeup.interval
+    timer.stop()
+    assert 0.1 < delay < 0.2
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import time
+from don_tomate.tray import TrayTimer
+
+
+def test_tray_timer_runs_the_schedule():
+    completed = []
+    timer = TrayTimer(n_pomodoros=2, on_complete=completed.append)
+    assert [segment[1] for segment in timer.segments] == [
+        "main",
+        "break_1",
+        "main_2",
+        "long_break",
+    ]
+    assert timer.status() == "Pomodoro 1 - 25:00"
+
+    timer.timer.set_remaining(0.05)
+    timer.start_stop()
+    time.sleep(0.5)
+
+    # The finished segment hands over to the next one, stopped
+    assert completed == ["Pomodoro 1"]
+    assert timer.title == "Short Break 1"
+    assert not timer.running
+    assert timer.status() == "Short Break 1 - 05:00"
+
+
+def test_tray_timer_controls():
+    changes = []
+    timer = TrayTimer(on_change=changes.append)
+    timer.start_stop()
+    assert timer.running
+    timer.start_stop()
+    assert not timer.running
+    timer.next()
+    timer.reset()
+    assert timer.title == "Short Break 1"
+    assert len(changes) == 4
+    timer.stop()
+
+
+def test_tray_timer_handover():
+    timer = TrayTimer()
+    timer.next()
+    assert timer.handover() == dict(segment="break_1", remaining=5 * 60, deadline=None)
+
+    timer.start_stop()
+    handover = timer.handover()
+    assert handover["deadline"] == timer.timer.deadline
+    timer.stop()
+
+
+def test_tray_mode_does_not_import_kivy():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, don_tomate.tray; print('kivy' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
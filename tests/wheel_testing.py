@@ -0,0 +1,85 @@
+import random
+import threading
+from don_tomate.wheel import TeamScheduler, TimingWheel
+
+
+def test_timing_wheel_fires_in_order_and_never_early(clock):
+    wheel = TimingWheel(resolution=0.01, slot_bits=4, levels=2, clock=clock)
+    fired = []
+    delays = [random.uniform(0, 10) for _ in range(2000)]
+    for delay in delays:
+        wheel.schedule(delay, lambda delay: fired.append((delay, clock.now)), delay)
+    # Beyond the two wheels, in the overflow
+    wheel.schedule(20, fired.append, (20, None))
+    assert len(wheel) == 2001
+
+    while clock.now < 11:
+        clock.now += 0.05
+        wheel.advance()
+    assert sorted(delays) == [delay for delay, _ in fired]
+    assert all(0 <= now - delay < 0.07 for delay, now in fired)
+    assert len(wheel) == 1
+
+
+def test_timing_wheel_cancel_and_timeout(clock):
+    wheel = TimingWheel(resolution=0.01, clock=clock)
+    assert wheel.next_timeout() is None
+    fired = []
+    timer = wheel.schedule(1, fired.append, "cancelled")
+    wheel.schedule(1.5, fired.append, "kept")
+    wheel.cancel(timer)
+    wheel.cancel(timer)
+    assert len(wheel) == 1
+    assert abs(wheel.next_timeout() - 1.5) < 1e-9
+
+    clock.now = 2
+    assert wheel.advance() == 1
+    assert fired == ["kept"]
+
+
+def test_team_scheduler_semantics(clock):
+    scheduler = TeamScheduler(n_pomodoros=2, clock=clock)
+    for key in ("ana", "bob"):
+        scheduler.add(key)
+    assert [segment[1] for segment in scheduler.segments] == [
+        "main",
+        "break_1",
+        "main_2",
+        "long_break",
+    ]
+    completed = []
+    scheduler.on_complete = lambda key, title: completed.append((key, title))
+
+    scheduler.start("ana")
+    scheduler.start("bob")
+    clock.now = 60
+    scheduler.pause("bob")
+    assert scheduler.remaining("bob") == 24 * 60
+    clock.now = 25 * 60
+    scheduler.wheel.advance()
+
+    # The finished segment hands over to the next one, stopped
+    assert completed == [("ana", "Pomodoro 1")]
+    assert scheduler.title("ana") == "Short Break 1"
+    assert scheduler.remaining("ana") == 5 * 60
+    assert scheduler.title("bob") == "Pomodoro 1"
+
+    scheduler.next("bob")
+    scheduler.start("bob")
+    scheduler.reset("bob")
+    scheduler.remove("bob")
+    assert len(scheduler.wheel) == 0
+
+
+def test_team_scheduler_wakeup_thread():
+    done = threading.Event()
+    scheduler = TeamScheduler(
+        segments=[("Pomodoro 1", "main", 0.05), ("Long Break", "long_break", 0.05)],
+        on_complete=lambda key, title: done.set(),
+    )
+    scheduler.run()
+    scheduler.add("ana")
+    scheduler.start("ana")
+    assert done.wait(2)
+    scheduler.stop()
+    assert scheduler.title("ana") == "Long Break"
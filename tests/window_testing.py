@@ -0,0 +1,30 @@
+import sys
+from unittest.mock import patch
+from don_tomate.window import set_always_on_top
+
+
+def test_always_on_top_is_a_no_op_off_macos():
+    with patch("platform.system", return_value="Linux"):
+        assert set_always_on_top(True) is False
+    # The Cocoa bindings are never imported
+    assert "objc" not in sys.modules
+
+
+def test_idle_monitor_lowers_the_frame_rate():
+    from kivy.clock import Clock
+    from don_tomate.window import IDLE_FPS, IdleMonitor
+
+    changes = []
+    monitor = IdleMonitor(changes.append)
+    active_fps = Clock._max_fps
+
+    monitor.on_focus(None, False)
+    assert monitor.idle and not monitor.hidden
+    assert Clock._max_fps == IDLE_FPS
+    monitor.on_hide()
+    monitor.on_focus(None, True)
+    assert Clock._max_fps == IDLE_FPS
+    monitor.on_show()
+    assert not monitor.idle
+    assert Clock._max_fps == active_fps
+    assert len(changes) == 4